@@ -17,7 +17,7 @@ import { SentimentSpeedometer } from "@/components/charts/sentiment-speedometer"
 import { MovieRace } from "@/components/charts/movie-race";
 import { MoviesLeaderboard } from "@/components/charts/movies-leaderboard";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
-import { getOverviewStats, getSignals } from "@/lib/api";
+import { getDashboardHome } from "@/lib/api";
 import { realStats, realSignals, realBoxOfficeData, movieRaceData, sentimentQuotes } from "@/lib/mock-data";
 
 // Use real data collected from Exa search
@@ -25,33 +25,29 @@ const mockStats = realStats;
 const mockSignals = realSignals;
 
 export default function DashboardPage() {
+  // The whole page in one request
   const {
-    data: stats,
-    isLoading: statsLoading,
-    refetch: refetchStats,
+    data: home,
+    isLoading,
+    refetch,
   } = useQuery({
-    queryKey: ["stats"],
-    queryFn: getOverviewStats,
-    placeholderData: mockStats,
-  });
-
-  const {
-    data: signalsData,
-    isLoading: signalsLoading,
-    refetch: refetchSignals,
-  } = useQuery({
-    queryKey: ["signals", { importance: "critical" }],
-    queryFn: () => getSignals({ importance: "critical", per_page: 5 }),
-    placeholderData: { signals: mockSignals, total: 5, page: 1, per_page: 5 },
+    queryKey: ["dashboard", "home"],
+    queryFn: getDashboardHome,
+    placeholderData: {
+      overview: mockStats,
+      critical_signals: mockSignals,
+      latest_signals: mockSignals,
+      leaderboard: [],
+    },
   });
 
   const handleRefresh = () => {
-    refetchStats();
-    refetchSignals();
+    refetch();
   };
 
-  const displayStats = stats || mockStats;
-  const displaySignals = signalsData?.signals || mockSignals;
+  const displayStats = home?.overview || mockStats;
+  const displaySignals = home?.critical_signals || mockSignals;
+  const latestSignals = home?.latest_signals || mockSignals;
 
   return (
     <div className="flex flex-col">
@@ -59,7 +55,7 @@ export default function DashboardPage() {
         title="Дэшборд"
         description="Аналитика российского кинорынка в реальном времени"
         onRefresh={handleRefresh}
-        isRefreshing={statsLoading || signalsLoading}
+        isRefreshing={isLoading}
         showDemoAlert
       />
 
@@ -178,7 +174,7 @@ export default function DashboardPage() {
               </CardTitle>
             </CardHeader>
             <CardContent className="space-y-2">
-              {mockSignals.slice(0, 5).map((signal) => (
+              {latestSignals.slice(0, 5).map((signal) => (
                 <SignalCard key={signal.id} signal={signal} compact />
               ))}
             </CardContent>
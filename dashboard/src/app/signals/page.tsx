@@ -1,7 +1,7 @@
 "use client";
 
-import { useState } from "react";
-import { useQuery } from "@tanstack/react-query";
+import { useEffect, useState } from "react";
+import { useQuery, useQueryClient } from "@tanstack/react-query";
 import {
   Radio,
   Filter,
@@ -18,7 +18,14 @@ import { Header } from "@/components/header";
 import { SignalCard } from "@/components/signal-card";
 import { Badge } from "@/components/ui/badge";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
-import { getSignals, type Signal } from "@/lib/api";
+import {
+  getSignals,
+  subscribeSignals,
+  type Signal,
+  type SignalEvent,
+  type SignalEventType,
+  type SignalListResponse,
+} from "@/lib/api";
 import { realSignals, realActionItems } from "@/lib/mock-data";
 import { cn } from "@/lib/utils";
 
@@ -26,6 +33,48 @@ import { cn } from "@/lib/utils";
 const mockSignals = realSignals;
 const mockActionItems = realActionItems;
 
+const PER_PAGE = 20;
+
+// Apply a live event to a cached first page: new signals go on top,
+// classified ones are updated in place (or added once they match)
+function applySignalEvent(
+  page: SignalListResponse | undefined,
+  type: SignalEventType,
+  event: SignalEvent
+): SignalListResponse | undefined {
+  if (!page) return page;
+  const index = page.signals.findIndex((signal) => signal.id === event.id);
+  const fields = {
+    ...event,
+    importance: event.importance as Signal["importance"],
+    sentiment: event.sentiment as Signal["sentiment"],
+  };
+
+  if (index >= 0) {
+    const signals = [...page.signals];
+    signals[index] = {
+      ...signals[index],
+      ...fields,
+      is_classified: signals[index].is_classified || type === "classified",
+    };
+    return { ...page, signals };
+  }
+
+  const signal: Signal = {
+    external_id: "",
+    created_at: event.published_at ?? new Date().toISOString(),
+    is_classified: type === "classified",
+    is_published: true,
+    is_featured: false,
+    ...fields,
+  };
+  return {
+    ...page,
+    signals: [signal, ...page.signals].slice(0, page.per_page || PER_PAGE),
+    total: page.total + 1,
+  };
+}
+
 const signalTypes = [
   { value: "", label: "Все типы" },
   { value: "review", label: "Отзывы" },
@@ -115,6 +164,7 @@ export default function SignalsPage() {
   const [signalType, setSignalType] = useState("");
   const [importance, setImportance] = useState("");
   const [showActions, setShowActions] = useState(true);
+  const queryClient = useQueryClient();
 
   const {
     data: signalsData,
@@ -126,11 +176,28 @@ export default function SignalsPage() {
       getSignals({
         signal_type: signalType || undefined,
         importance: importance || undefined,
-        per_page: 20,
+        per_page: PER_PAGE,
       }),
     placeholderData: { signals: mockSignals, total: 6, page: 1, per_page: 20 },
   });
 
+  // Merge matching live signals into the cached list; no refetch per event
+  useEffect(
+    () =>
+      subscribeSignals(
+        {
+          signal_type: signalType || undefined,
+          importance: importance || undefined,
+        },
+        (type, event) =>
+          queryClient.setQueryData<SignalListResponse>(
+            ["signals", signalType, importance],
+            (page) => applySignalEvent(page, type, event)
+          )
+      ),
+    [signalType, importance, queryClient]
+  );
+
   const displaySignals = signalsData?.signals || mockSignals;
 
   // Filter signals client-side for demo
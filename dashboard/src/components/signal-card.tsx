@@ -19,6 +19,7 @@ const signalTypeLabels: Record<string, string> = {
   news: "Новость",
   promotion: "Реклама",
   box_office: "Сборы",
+  spike: "Всплеск",
 };
 
 const importanceVariants: Record<string, "critical" | "notable" | "minor"> = {
@@ -67,6 +67,46 @@ export interface OverviewStats {
   trend_vs_previous: number;
 }
 
+interface Page {
+  total: number;
+  page: number;
+  per_page: number;
+  next_cursor?: string;
+  total_is_estimate?: boolean;
+}
+
+export interface SignalListResponse extends Page {
+  signals: Signal[];
+}
+
+export interface MovieListResponse extends Page {
+  movies: Movie[];
+}
+
+export interface LeaderboardEntry {
+  slug: string;
+  title: string;
+  poster_url?: string;
+  signals_count: number;
+  reviews_count: number;
+  sentiment_score?: number;
+  total_screenings: number;
+  avg_occupancy?: number;
+}
+
+export interface DashboardHome {
+  overview: OverviewStats;
+  critical_signals: Signal[];
+  latest_signals: Signal[];
+  leaderboard: LeaderboardEntry[];
+}
+
+export async function getDashboardHome(): Promise<DashboardHome> {
+  const res = await fetch(`${API_URL}/dashboard/home`);
+  if (!res.ok) throw new Error("Failed to fetch dashboard");
+  return res.json();
+}
+
 export async function getOverviewStats(): Promise<OverviewStats> {
   const res = await fetch(`${API_URL}/stats/overview`);
   if (!res.ok) throw new Error("Failed to fetch stats");
@@ -78,35 +118,81 @@ export async function getSignals(params?: {
   signal_type?: string;
   importance?: string;
   hours?: number;
+  search?: string;
   page?: number;
   per_page?: number;
-}): Promise<{ signals: Signal[]; total: number; page: number; per_page: number }> {
+  cursor?: string;
+}): Promise<SignalListResponse> {
   const searchParams = new URLSearchParams();
   if (params?.movie_slug) searchParams.set("movie_slug", params.movie_slug);
   if (params?.signal_type) searchParams.set("signal_type", params.signal_type);
   if (params?.importance) searchParams.set("importance", params.importance);
   if (params?.hours) searchParams.set("hours", params.hours.toString());
+  if (params?.search) searchParams.set("search", params.search);
   if (params?.page) searchParams.set("page", params.page.toString());
   if (params?.per_page) searchParams.set("per_page", params.per_page.toString());
+  if (params?.cursor) searchParams.set("cursor", params.cursor);
 
   const res = await fetch(`${API_URL}/signals?${searchParams}`);
   if (!res.ok) throw new Error("Failed to fetch signals");
   return res.json();
 }
 
+export type SignalEventType = "created" | "classified";
+
+export interface SignalEvent {
+  id: string;
+  movie_id?: string;
+  title: string;
+  summary?: string;
+  source_url: string;
+  image_url?: string;
+  signal_type?: string;
+  importance?: string;
+  sentiment?: string;
+  published_at?: string;
+}
+
+// Live signal events over SSE. The browser reconnects on its own and
+// resumes from the last event id. Returns a function that closes the stream.
+export function subscribeSignals(
+  params: {
+    movie_slug?: string;
+    signal_type?: string;
+    importance?: string;
+  },
+  onEvent: (type: SignalEventType, signal: SignalEvent) => void
+): () => void {
+  const searchParams = new URLSearchParams();
+  if (params.movie_slug) searchParams.set("movie_slug", params.movie_slug);
+  if (params.signal_type) searchParams.set("signal_type", params.signal_type);
+  if (params.importance) searchParams.set("importance", params.importance);
+
+  const source = new EventSource(`${API_URL}/signals/stream?${searchParams}`);
+  const types: SignalEventType[] = ["created", "classified"];
+  for (const type of types) {
+    source.addEventListener(type, (event) =>
+      onEvent(type, JSON.parse((event as MessageEvent).data))
+    );
+  }
+  return () => source.close();
+}
+
 export async function getMovies(params?: {
   search?: string;
   featured?: boolean;
   distributor?: string;
   page?: number;
   per_page?: number;
-}): Promise<{ movies: Movie[]; total: number; page: number; per_page: number }> {
+  cursor?: string;
+}): Promise<MovieListResponse> {
   const searchParams = new URLSearchParams();
   if (params?.search) searchParams.set("search", params.search);
   if (params?.featured) searchParams.set("featured", "true");
   if (params?.distributor) searchParams.set("distributor", params.distributor);
   if (params?.page) searchParams.set("page", params.page.toString());
   if (params?.per_page) searchParams.set("per_page", params.per_page.toString());
+  if (params?.cursor) searchParams.set("cursor", params.cursor);
 
   const res = await fetch(`${API_URL}/movies?${searchParams}`);
   if (!res.ok) throw new Error("Failed to fetch movies");
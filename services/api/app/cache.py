@@ -0,0 +1,387 @@
+"""
+Response cache for read endpoints.
+
+Two tiers: an in-process LRU and a shared Redis tier. Keys are built from
+the route path, the endpoint's resolved parameters (so defaults and
+parameter order do not fragment the cache) and the current versions of
+the namespaces the route depends on. Workers bump those versions when
+they commit, which makes older entries unreachable in both tiers.
+
+Responses carry a strong ETag; a matching If-None-Match gets a 304.
+Computed results are validated and filtered against the route's
+response_model before they are serialized, as FastAPI does for uncached
+routes.
+
+Misses are computed once per process through a single-flight group, and
+optionally once across replicas via a short Redis lock: replicas that
+lose the lock wait briefly for the winner's entry in the shared tier.
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import time
+import types
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Union, get_args, get_origin
+
+from fastapi import Request, Response
+from fastapi.exceptions import ResponseValidationError
+from pydantic import BaseModel, ConfigDict, ValidationError, create_model
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from services.api.app.responses import dumps
+from services.api.app.singleflight import SingleFlight
+from shared.cache import INVALIDATION_CHANNEL, NAMESPACES, get_versions
+from shared.db import run_in_session
+from shared.settings import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+CACHE_CONTROL = "no-cache"
+LOCK_TTL_MS = 10_000
+PEER_WAIT_SECONDS = 2.0
+PEER_POLL_SECONDS = 0.05
+
+
+@dataclass
+class CachedResponse:
+    """A serialized response body and its ETag."""
+
+    body: bytes
+    etag: str
+    namespaces: tuple[str, ...]
+    expires_at: float = 0.0
+
+    def dump(self) -> bytes:
+        return self.etag.encode() + b"\n" + self.body
+
+    @classmethod
+    def load(cls, raw: bytes, namespaces: tuple[str, ...]) -> "CachedResponse":
+        etag, body = raw.split(b"\n", 1)
+        return cls(body=body, etag=etag.decode(), namespaces=namespaces)
+
+
+class ResponseCache:
+    """In-process LRU in front of a shared Redis tier."""
+
+    def __init__(self, max_entries: int = 1024, prefix: str = "resp"):
+        self.max_entries = max_entries
+        self.prefix = prefix
+        self.redis: Optional[Redis] = None
+        self.versions: dict[str, int] = {ns: 0 for ns in NAMESPACES}
+        self._local: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._listener: Optional[asyncio.Task] = None
+        self.stats = {
+            "local_hits": 0,
+            "redis_hits": 0,
+            "peer_hits": 0,
+            "misses": 0,
+            "not_modified": 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._local)
+
+    async def start(self, redis: Redis) -> None:
+        """Attach Redis and follow invalidations."""
+        self.redis = redis
+        try:
+            self._apply(await get_versions(redis))
+        except Exception as e:
+            logger.warning(f"Cache versions unavailable: {e}")
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+        self._listener = None
+        self.redis = None
+
+    async def _listen(self) -> None:
+        """Apply published version bumps, reconnecting on errors."""
+        while True:
+            try:
+                pubsub = self.redis.pubsub()
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Catch up on anything published while we were not listening
+                self._apply(await get_versions(self.redis))
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._apply(json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener error: {e}")
+                await asyncio.sleep(5)
+
+    def _apply(self, versions: dict[str, int]) -> None:
+        changed = {
+            ns for ns, version in versions.items() if self.versions.get(ns) != version
+        }
+        if not changed:
+            return
+        self.versions.update(versions)
+        for key in [k for k, v in self._local.items() if changed & set(v.namespaces)]:
+            del self._local[key]
+
+    def key(self, path: str, params: dict, namespaces: tuple[str, ...]) -> str:
+        """Cache key for a route, its parameters and namespace versions."""
+        normalized = "&".join(
+            f"{name}={params[name]}"
+            for name in sorted(params)
+            if params[name] is not None
+        )
+        versions = ".".join(str(self.versions.get(ns, 0)) for ns in namespaces)
+        return f"{self.prefix}:{path}?{normalized}#v{versions}"
+
+    async def get(
+        self, key: str, namespaces: tuple[str, ...], count_miss: bool = True
+    ) -> Optional[CachedResponse]:
+        entry = self._local.get(key)
+        if entry:
+            if entry.expires_at > time.monotonic():
+                self._local.move_to_end(key)
+                self.stats["local_hits"] += 1
+                return entry
+            del self._local[key]
+
+        if self.redis is not None:
+            try:
+                raw, ttl = await self.redis.pipeline().get(key).ttl(key).execute()
+            except Exception as e:
+                logger.warning(f"Redis cache read failed: {e}")
+                raw = None
+            if raw:
+                entry = CachedResponse.load(raw, namespaces)
+                self._store_local(key, entry, max(ttl, 1))
+                self.stats["redis_hits"] += 1
+                return entry
+
+        if count_miss:
+            self.stats["misses"] += 1
+        return None
+
+    async def set(self, key: str, entry: CachedResponse, ttl: int) -> None:
+        self._store_local(key, entry, ttl)
+        if self.redis is not None:
+            try:
+                await self.redis.set(key, entry.dump(), ex=ttl)
+            except Exception as e:
+                logger.warning(f"Redis cache write failed: {e}")
+
+    def _store_local(self, key: str, entry: CachedResponse, ttl: int) -> None:
+        entry.expires_at = time.monotonic() + ttl
+        self._local[key] = entry
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+
+response_cache = ResponseCache()
+flight = SingleFlight()
+
+
+def _make_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _respond(request: Request, entry: CachedResponse) -> Response:
+    headers = {"ETag": entry.etag, "Cache-Control": CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match", "")
+    if entry.etag in [tag.strip() for tag in if_none_match.split(",")]:
+        response_cache.stats["not_modified"] += 1
+        return Response(status_code=304, headers=headers)
+    return Response(entry.body, media_type="application/json", headers=headers)
+
+
+def _partial_annotation(annotation):
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return partial_model(annotation)
+    args = get_args(annotation)
+    if get_origin(annotation) is list and args:
+        return list[_partial_annotation(args[0])]
+    if get_origin(annotation) in (Union, types.UnionType):
+        return Union[tuple(_partial_annotation(arg) for arg in args)]
+    return annotation
+
+
+@functools.cache
+def partial_model(model: type[BaseModel]) -> type[BaseModel]:
+    """
+    `model` with every field optional, nested models included.
+
+    Validates payloads trimmed by `fields=`: whatever is present must have
+    the declared type, and anything the model does not declare is dropped.
+    """
+    fields = {
+        name: (Optional[_partial_annotation(field.annotation)], None)
+        for name, field in model.model_fields.items()
+    }
+    return create_model(
+        f"Partial{model.__name__}",
+        __config__=ConfigDict(from_attributes=True),
+        **fields,
+    )
+
+
+def render(request: Request, result, trimmed: bool = False) -> bytes:
+    """
+    Validate a computed result against the route's response_model and
+    serialize it.
+
+    Like FastAPI's own response handling, fields the model does not
+    declare are dropped and a result that does not fit the model is a
+    server error. `trimmed` results (`fields=`) are checked against the
+    partial model and keep only the fields they have.
+    """
+    route = request.scope.get("route")
+    model = getattr(route, "response_model", None)
+    if not (isinstance(model, type) and issubclass(model, BaseModel)):
+        return dumps(result)
+    if trimmed:
+        model = partial_model(model)
+    try:
+        validated = model.model_validate(result, from_attributes=True)
+    except ValidationError as e:
+        raise ResponseValidationError(e.errors(include_url=False), body=result)
+    return model.__pydantic_serializer__.to_json(validated, exclude_unset=trimmed)
+
+
+async def _wait_for_peer(
+    key: str, namespaces: tuple[str, ...]
+) -> Optional[CachedResponse]:
+    """Poll the shared tier while another replica computes the entry."""
+    deadline = time.monotonic() + PEER_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        await asyncio.sleep(PEER_POLL_SECONDS)
+        entry = await response_cache.get(key, namespaces, count_miss=False)
+        if entry is not None:
+            response_cache.stats["peer_hits"] += 1
+            return entry
+    return None
+
+
+async def _fill(key: str, namespaces: tuple[str, ...], ttl: int, compute):
+    """Compute and store a cache entry."""
+    redis = response_cache.redis
+    lock_key = f"{key}:lock"
+    locked = False
+    if settings.singleflight_redis_lock and redis is not None:
+        try:
+            locked = bool(await redis.set(lock_key, b"1", nx=True, px=LOCK_TTL_MS))
+        except Exception as e:
+            logger.warning(f"Redis lock failed: {e}")
+        else:
+            if not locked:
+                entry = await _wait_for_peer(key, namespaces)
+                if entry is not None:
+                    return entry
+
+    try:
+        body = await compute()
+        if isinstance(body, Response):
+            return body
+        entry = CachedResponse(body=body, etag=_make_etag(body), namespaces=namespaces)
+        await response_cache.set(key, entry, ttl)
+        return entry
+    finally:
+        if locked:
+            try:
+                await redis.delete(lock_key)
+            except Exception as e:
+                logger.warning(f"Redis unlock failed: {e}")
+
+
+async def _own_session(func, args: tuple, kwargs: dict):
+    """
+    Call an endpoint on a session of its own.
+
+    A coalesced computation is shared by several requests and outlives
+    any one of them, so it must not use the first request's session,
+    which FastAPI closes when that request ends.
+    """
+    sessions = [
+        name for name, value in kwargs.items() if isinstance(value, AsyncSession)
+    ]
+    if not sessions:
+        return await func(*args, **kwargs)
+    return await run_in_session(
+        lambda session: func(*args, **{**kwargs, **dict.fromkeys(sessions, session)}),
+        read=True,
+    )
+
+
+def cached(*namespaces: str, ttl: int = 30):
+    """
+    Cache a GET endpoint's JSON response.
+
+    `namespaces` are the data the response is built from; a write to any
+    of them invalidates the entry. The endpoint may declare `request`
+    itself, otherwise it is injected. The endpoint's return value is
+    validated against the route's response_model (see `render`); with a
+    `fields` parameter it may return a trimmed dict instead.
+
+    Identical concurrent misses are computed once, on a read session
+    owned by the computation, even with the response cache disabled.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+        declares_request = "request" in signature.parameters
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            request: Request = (
+                kwargs["request"] if declares_request else kwargs.pop("request")
+            )
+            params = {
+                name: value
+                for name, value in kwargs.items()
+                if not isinstance(value, (Request, AsyncSession))
+            }
+            key = response_cache.key(request.url.path, params, namespaces)
+
+            async def compute():
+                result = await _own_session(func, args, kwargs)
+                if isinstance(result, Response):
+                    return result
+                return render(request, result, trimmed=bool(kwargs.get("fields")))
+
+            if not settings.response_cache_enabled:
+                body = await flight.do(key, compute)
+                if isinstance(body, Response):
+                    return body
+                return Response(body, media_type="application/json")
+
+            entry = await response_cache.get(key, namespaces)
+            if entry is None:
+                entry = await flight.do(
+                    key, lambda: _fill(key, namespaces, ttl, compute)
+                )
+                if isinstance(entry, Response):
+                    return entry
+            return _respond(request, entry)
+
+        if not declares_request:
+            wrapper.__signature__ = signature.replace(
+                parameters=[
+                    *signature.parameters.values(),
+                    inspect.Parameter(
+                        "request", inspect.Parameter.KEYWORD_ONLY, annotation=Request
+                    ),
+                ]
+            )
+        return wrapper
+
+    return decorator
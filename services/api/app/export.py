@@ -0,0 +1,171 @@
+"""
+Row encoders for bulk exports.
+
+Each encoder turns batches of result rows into bytes for one format, so
+an export is a header, one chunk per fetched batch and a footer. Nothing
+but the current batch is held in memory. Parquet needs pyarrow and writes
+one row group per batch.
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Optional, Sequence
+from uuid import UUID
+
+import orjson
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+class RowEncoder:
+    """Encodes batches of rows with the given columns."""
+
+    extension = ""
+
+    def __init__(self, columns: Sequence):
+        self.columns = list(columns)
+        self.names = [column.key for column in self.columns]
+
+    def header(self) -> bytes:
+        return b""
+
+    def chunk(self, rows: Sequence) -> bytes:
+        raise NotImplementedError
+
+    def footer(self) -> bytes:
+        return b""
+
+
+class NDJSONEncoder(RowEncoder):
+    extension = "ndjson"
+
+    def chunk(self, rows: Sequence) -> bytes:
+        names = self.names
+        return b"".join(
+            orjson.dumps(dict(zip(names, row)), option=orjson.OPT_UTC_Z) + b"\n"
+            for row in rows
+        )
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+class CSVEncoder(RowEncoder):
+    extension = "csv"
+
+    def _write(self, rows) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows(rows)
+        return buffer.getvalue().encode()
+
+    def header(self) -> bytes:
+        return self._write([self.names])
+
+    def chunk(self, rows: Sequence) -> bytes:
+        return self._write([_csv_value(value) for value in row] for row in rows)
+
+
+class _Sink(io.RawIOBase):
+    """Write-only file that hands out what was written since last drain."""
+
+    def __init__(self):
+        self._parts: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def _arrow_type(column):
+    type_ = column.type
+    if isinstance(type_, Boolean):
+        return pa.bool_()
+    if isinstance(type_, Integer):
+        return pa.int64()
+    if isinstance(type_, Float):
+        return pa.float64()
+    if isinstance(type_, DateTime):
+        return pa.timestamp("us", tz="UTC" if type_.timezone else None)
+    if isinstance(type_, Date):
+        return pa.date32()
+    return pa.string()
+
+
+def _arrow_value(value):
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+class ParquetEncoder(RowEncoder):
+    extension = "parquet"
+
+    def __init__(self, columns: Sequence):
+        super().__init__(columns)
+        self.schema = pa.schema(
+            [pa.field(column.key, _arrow_type(column)) for column in self.columns]
+        )
+        self._sink = _Sink()
+        self._writer = pq.ParquetWriter(self._sink, self.schema, compression="zstd")
+
+    def chunk(self, rows: Sequence) -> bytes:
+        data = {
+            name: [_arrow_value(row[index]) for row in rows]
+            for index, name in enumerate(self.names)
+        }
+        self._writer.write_table(pa.Table.from_pydict(data, schema=self.schema))
+        return self._sink.drain()
+
+    def footer(self) -> bytes:
+        self._writer.close()
+        return self._sink.drain()
+
+
+ENCODERS = {
+    "ndjson": NDJSONEncoder,
+    "csv": CSVEncoder,
+    "parquet": ParquetEncoder,
+}
+
+
+def get_encoder(export_format: str, columns: Sequence) -> Optional[RowEncoder]:
+    """Encoder for a format, or None if it is unavailable here."""
+    if export_format == "parquet" and pa is None:
+        return None
+    return ENCODERS[export_format](columns)
@@ -2,23 +2,55 @@
 FastAPI application entry point.
 """
 
+import logging
+
 import uvicorn
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
+from shared.queue import close_redis_pool, get_redis_pool
 from shared.settings import get_settings
-from services.api.app.routers import movies, signals, stats, admin
+from services.api.app.cache import response_cache
+from services.api.app.responses import JSONResponse
+from services.api.app.slugs import slug_resolver
+from services.api.app.stream import signal_stream
+from services.api.app.routers import (
+    movies,
+    signals,
+    stats,
+    admin,
+    export,
+    dashboard,
+)
+
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:
+    BrotliMiddleware = None
 
+logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
-    # Startup
+    # Startup: one Redis pool for the queue, cache and stream
+    redis = await get_redis_pool()
+    await response_cache.start(redis)
+    await signal_stream.start(redis)
+    try:
+        await slug_resolver.warm()
+    except Exception as e:
+        # Resolved lazily on first use instead
+        logger.warning(f"Slug resolver warm-up failed: {e}")
     yield
     # Shutdown
+    await signal_stream.stop()
+    await response_cache.stop()
+    await close_redis_pool()
 
 
 app = FastAPI(
@@ -26,8 +58,19 @@ app = FastAPI(
     description="Russian cinema market intelligence API",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=JSONResponse,
 )
 
+# Compression (brotli when installed, gzip otherwise)
+if BrotliMiddleware is not None:
+    app.add_middleware(
+        BrotliMiddleware,
+        minimum_size=settings.compression_min_size,
+        gzip_fallback=True,
+    )
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=settings.compression_min_size)
+
 # CORS
 app.add_middleware(
     CORSMiddleware,
@@ -42,6 +85,8 @@ app.include_router(movies.router, prefix="/movies", tags=["movies"])
 app.include_router(signals.router, prefix="/signals", tags=["signals"])
 app.include_router(stats.router, prefix="/stats", tags=["stats"])
 app.include_router(admin.router, prefix="/admin", tags=["admin"])
+app.include_router(export.router, prefix="/export", tags=["export"])
+app.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
 
 
 @app.get("/health")
@@ -0,0 +1,63 @@
+"""
+JSON rendering and sparse fieldsets for API responses.
+
+Pydantic models are serialized by pydantic-core straight to JSON bytes;
+everything else (plain dicts of rows) goes through orjson. Both produce
+the same wire format as FastAPI's default encoder.
+"""
+
+from decimal import Decimal
+from typing import Any, Iterable, Optional
+
+import orjson
+from fastapi import HTTPException, Response
+from pydantic import BaseModel
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize a response payload to JSON bytes."""
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__.to_json(content)
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class JSONResponse(Response):
+    """JSON response rendered with `dumps`."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def parse_fields(
+    fields: Optional[str],
+    allowed: Iterable[str],
+    required: Iterable[str] = ("id",),
+) -> Optional[tuple[str, ...]]:
+    """
+    Parse a comma-separated `fields=` parameter.
+
+    Returns None when no fieldset was requested. `required` fields are
+    always included (they are needed for keys and cursors).
+    """
+    if not fields:
+        return None
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = set(requested) - set(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    return tuple(dict.fromkeys([*required, *requested]))
@@ -2,13 +2,55 @@
 Admin router for triggering jobs.
 """
 
-from fastapi import APIRouter
+from typing import Optional
 
-from shared.queue import enqueue_task
+from arq.jobs import Job, JobDef, JobResult, JobStatus
+from fastapi import APIRouter, HTTPException, Query
+
+from services.api.app.cache import flight, response_cache
+from services.api.app.slugs import slug_resolver
+from services.api.app.stream import signal_stream
+from shared.db import pool_stats, run_in_session
+from shared.db.database import engine_profile
+from shared.db.partitions import PARTITIONED_TABLES, list_partitions
+from shared.db.storage import STORAGE_TABLES, table_storage
+from shared.queue import enqueue_task, get_progress, get_redis_pool
+from shared.queue.jobs import job_timings, latency_histograms
 
 router = APIRouter()
 
 
+def _result_value(result):
+    """Task results are dicts; failures are stored as the exception."""
+    if isinstance(result, BaseException):
+        return {"error": f"{type(result).__name__}: {result}"}
+    return result
+
+
+def _job_summary(
+    job: JobDef, status: JobStatus, progress: Optional[dict] = None
+) -> dict:
+    summary = {
+        "job_id": job.job_id,
+        "function": job.function,
+        "status": status.value,
+        "args": list(job.args),
+        "kwargs": job.kwargs,
+        "job_try": job.job_try,
+        "enqueue_time": job.enqueue_time,
+        "progress": progress,
+        **job_timings(job),
+    }
+    if isinstance(job, JobResult):
+        summary.update(
+            start_time=job.start_time,
+            finish_time=job.finish_time,
+            success=job.success,
+            result=_result_value(job.result),
+        )
+    return summary
+
+
 @router.post("/jobs/collect/{source_type}")
 async def trigger_collection(source_type: str):
     """Trigger signal collection for a source type."""
@@ -35,3 +77,118 @@ async def trigger_metrics_update():
     """Trigger movie metrics update."""
     job_id = await enqueue_task("update_movie_metrics")
     return {"status": "queued", "job_id": job_id}
+
+
+@router.post("/jobs/aggregate-screenings")
+async def trigger_screenings_aggregation():
+    """Trigger screening snapshot aggregation."""
+    job_id = await enqueue_task("aggregate_screenings")
+    return {"status": "queued", "job_id": job_id}
+
+
+@router.post("/jobs/maintain-partitions")
+async def trigger_partition_maintenance():
+    """Trigger partition maintenance."""
+    job_id = await enqueue_task("maintain_partitions")
+    return {"status": "queued", "job_id": job_id}
+
+
+@router.post("/jobs/prune-signals")
+async def trigger_signal_retention():
+    """Trigger signal retention."""
+    job_id = await enqueue_task("prune_signals")
+    return {"status": "queued", "job_id": job_id}
+
+
+@router.get("/jobs")
+async def list_jobs(limit: int = Query(50, ge=1, le=500)):
+    """Queued and running jobs, then the most recently finished ones."""
+    pool = await get_redis_pool()
+
+    active = []
+    for job in await pool.queued_jobs():
+        status = await Job(job.job_id, pool).status()
+        progress = None
+        if status == JobStatus.in_progress:
+            progress = await get_progress(pool, job.job_id)
+        active.append(_job_summary(job, status, progress))
+
+    results = sorted(
+        await pool.all_job_results(), key=lambda job: job.finish_time, reverse=True
+    )
+    finished = [_job_summary(job, JobStatus.complete) for job in results[:limit]]
+
+    return {"active": active, "finished": finished}
+
+
+@router.get("/jobs/latency")
+async def get_job_latency():
+    """Rolling latency histograms per task over recent runs."""
+    pool = await get_redis_pool()
+    return await latency_histograms(pool)
+
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """State, timings, result and progress of a job."""
+    pool = await get_redis_pool()
+    job = Job(job_id, pool)
+    status = await job.status()
+    if status == JobStatus.not_found:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    info = await job.info()
+    if info is None:
+        # Finished between the two reads and its result already expired
+        raise HTTPException(status_code=404, detail="Job not found")
+    progress = await get_progress(pool, job_id)
+    return _job_summary(info, status, progress)
+
+
+@router.get("/cache")
+async def get_cache_stats():
+    """Response cache, single-flight and slug resolver counters."""
+    return {
+        **response_cache.stats,
+        "local_entries": len(response_cache),
+        "versions": response_cache.versions,
+        "singleflight": {**flight.stats, "in_flight": len(flight)},
+        "slugs": {**slug_resolver.stats, "movies": len(slug_resolver)},
+    }
+
+
+@router.get("/stream")
+async def get_stream_stats():
+    """Live signal stream counters."""
+    return {
+        **signal_stream.stats,
+        "clients": len(signal_stream),
+        "buffered": len(signal_stream.buffer),
+    }
+
+
+@router.get("/db")
+async def get_db_stats():
+    """Engine profile and connection pool checkouts and wait times."""
+    return {
+        "profile": engine_profile,
+        "pools": pool_stats(),
+    }
+
+
+@router.get("/partitions")
+async def get_partitions():
+    """Attached partitions of each time-partitioned table."""
+    return {
+        table.name: await run_in_session(lambda s: list_partitions(s, table))
+        for table in PARTITIONED_TABLES
+    }
+
+
+@router.get("/storage")
+async def get_storage():
+    """Size, rows per page and cache hit rate of the hot and cold tables."""
+    return {
+        table: await run_in_session(lambda s: table_storage(s, table))
+        for table in STORAGE_TABLES
+    }
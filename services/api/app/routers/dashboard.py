@@ -0,0 +1,95 @@
+"""
+Dashboard router: one payload per page.
+
+Each page's sub-queries are independent, so they run concurrently on
+separate pooled connections and the response is ready when the slowest
+one is. The whole payload is cached as a unit.
+"""
+
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Query
+
+from services.api.app.cache import cached
+from services.api.app.routers.stats import movie_stats, overview_stats
+from shared.db import run_in_session
+from shared.db.repositories.movies import MovieRepository
+from shared.db.repositories.screenings import ScreeningRepository
+from shared.db.repositories.signals import SignalRepository
+from shared.schemas.dashboard import (
+    DashboardHome,
+    DashboardMovie,
+    LeaderboardEntry,
+    ScreeningRollupResponse,
+)
+from shared.schemas.signal import SignalResponse
+
+router = APIRouter()
+
+
+async def _feed(**filters) -> list[SignalResponse]:
+    rows = await run_in_session(
+        lambda s: SignalRepository(s).list_feed(**filters), read=True
+    )
+    return [SignalResponse.model_validate(row) for row in rows]
+
+
+async def _leaderboard(limit: int) -> list[LeaderboardEntry]:
+    movies = await run_in_session(
+        lambda s: MovieRepository(s).get_leaderboard(limit), read=True
+    )
+    return [LeaderboardEntry.model_validate(movie) for movie in movies]
+
+
+async def _cities(movie_id) -> list[ScreeningRollupResponse]:
+    rollups = await run_in_session(
+        lambda s: ScreeningRepository(s).get_rollups(movie_id, dimension="city"),
+        read=True,
+    )
+    return [ScreeningRollupResponse.model_validate(rollup) for rollup in rollups]
+
+
+@router.get("/home", response_model=DashboardHome)
+@cached("signals", "movies", ttl=30)
+async def get_home(
+    days: int = Query(7, ge=1, le=90),
+    signals_limit: int = Query(5, ge=1, le=20),
+    leaderboard_limit: int = Query(10, ge=1, le=50),
+):
+    """Home page: overview stats, critical and latest signals, leaderboard."""
+    overview, critical, latest, leaderboard = await asyncio.gather(
+        overview_stats(days),
+        _feed(hours=days * 24, importance="critical", limit=signals_limit),
+        _feed(hours=days * 24, limit=signals_limit),
+        _leaderboard(leaderboard_limit),
+    )
+
+    return DashboardHome(
+        overview=overview,
+        critical_signals=critical,
+        latest_signals=latest,
+        leaderboard=leaderboard,
+    )
+
+
+@router.get("/movie/{slug}", response_model=DashboardMovie)
+@cached("signals", "movies", "screenings", ttl=60)
+async def get_movie_page(
+    slug: str,
+    signals_limit: int = Query(20, ge=1, le=100),
+):
+    """Movie page: stats, recent signals and screenings by city."""
+    # On a session of its own, released before the gather takes three more
+    movie = await run_in_session(
+        lambda s: MovieRepository(s).get_by_slug(slug), read=True
+    )
+    if not movie:
+        raise HTTPException(status_code=404, detail="Movie not found")
+
+    stats, signals, cities = await asyncio.gather(
+        movie_stats(movie),
+        _feed(hours=24 * 30, movie_id=movie.id, limit=signals_limit),
+        _cities(movie.id),
+    )
+
+    return DashboardMovie(stats=stats, signals=signals, cities=cities)
@@ -0,0 +1,250 @@
+"""
+Export router for bulk datasets.
+"""
+
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import Literal, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, select, tuple_
+
+from services.api.app.export import MEDIA_TYPES, get_encoder
+from services.api.app.slugs import slug_resolver
+from shared.db.database import read_session_factory
+from shared.db.models.screening import ScreeningSnapshot
+from shared.db.models.signal import Signal
+from shared.db.pagination import InvalidCursor, decode_cursor
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+BATCH_SIZE = 5_000
+MAX_RANGE_DAYS = 366
+
+ExportFormat = Literal["ndjson", "csv", "parquet"]
+
+SIGNAL_EXPORT_COLUMNS = (
+    Signal.published_at,
+    Signal.id,
+    Signal.external_id,
+    Signal.source_id,
+    Signal.movie_id,
+    Signal.title,
+    Signal.summary,
+    Signal.content,
+    Signal.source_url,
+    Signal.author,
+    Signal.signal_type,
+    Signal.importance,
+    Signal.sentiment,
+    Signal.sentiment_score,
+    Signal.rating,
+    Signal.platform_rating,
+    Signal.views_count,
+    Signal.likes_count,
+    Signal.comments_count,
+    Signal.shares_count,
+    Signal.keywords,
+    Signal.is_classified,
+    Signal.created_at,
+)
+
+SCREENING_EXPORT_COLUMNS = (
+    ScreeningSnapshot.snapshot_date,
+    ScreeningSnapshot.id,
+    ScreeningSnapshot.movie_id,
+    ScreeningSnapshot.city,
+    ScreeningSnapshot.cinema_chain,
+    ScreeningSnapshot.snapshot_time,
+    ScreeningSnapshot.screenings_count,
+    ScreeningSnapshot.cinemas_count,
+    ScreeningSnapshot.halls_count,
+    ScreeningSnapshot.avg_occupancy_percent,
+    ScreeningSnapshot.total_seats,
+    ScreeningSnapshot.sold_seats,
+    ScreeningSnapshot.morning_screenings,
+    ScreeningSnapshot.afternoon_screenings,
+    ScreeningSnapshot.evening_screenings,
+    ScreeningSnapshot.format_2d,
+    ScreeningSnapshot.format_3d,
+    ScreeningSnapshot.format_imax,
+    ScreeningSnapshot.format_dolby,
+    ScreeningSnapshot.min_price,
+    ScreeningSnapshot.max_price,
+    ScreeningSnapshot.avg_price,
+)
+
+
+def _check_range(date_from: date, date_to: date) -> None:
+    if date_to < date_from:
+        raise HTTPException(status_code=400, detail="date_to is before date_from")
+    if (date_to - date_from).days > MAX_RANGE_DAYS:
+        raise HTTPException(
+            status_code=400, detail=f"Range is limited to {MAX_RANGE_DAYS} days"
+        )
+
+
+def _decode(cursor: Optional[str], types: tuple) -> Optional[list]:
+    if not cursor:
+        return None
+    try:
+        return decode_cursor(cursor, types)
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _resume_after(cursor: Optional[str], types: tuple, *after) -> Optional[list]:
+    """
+    Sort key to resume after: the last row's key columns, or a cursor.
+
+    The key columns must be given together.
+    """
+    if any(value is not None for value in after):
+        if any(value is None for value in after):
+            raise HTTPException(
+                status_code=400, detail="Both resume key parameters are required"
+            )
+        return list(after)
+    return _decode(cursor, types)
+
+
+async def _movie_id(movie_slug: Optional[str]) -> Optional[UUID]:
+    if not movie_slug:
+        return None
+    movie = await slug_resolver.resolve(movie_slug)
+    if not movie:
+        raise HTTPException(status_code=404, detail="Movie not found")
+    return movie.id
+
+
+def _stream(query: Select, columns: tuple, export_format: str, name: str):
+    """Stream a query through a server-side cursor in the given format."""
+    encoder = get_encoder(export_format, columns)
+    if encoder is None:
+        raise HTTPException(
+            status_code=400, detail=f"{export_format} export is not available"
+        )
+
+    async def body():
+        rows = 0
+        # Own session: request-scoped dependencies may be closed before
+        # the body is sent
+        async with read_session_factory() as session:
+            result = await session.stream(query.execution_options(yield_per=BATCH_SIZE))
+            yield encoder.header()
+            async for batch in result.partitions():
+                rows += len(batch)
+                yield encoder.chunk(batch)
+            yield encoder.footer()
+        logger.info(f"Exported {rows} rows to {name}.{encoder.extension}")
+
+    return StreamingResponse(
+        body(),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{name}.{encoder.extension}"'
+            ),
+        },
+    )
+
+
+@router.get("/signals")
+async def export_signals(
+    date_from: date,
+    date_to: Optional[date] = None,
+    format: ExportFormat = "ndjson",
+    movie_slug: Optional[str] = None,
+    signal_type: Optional[str] = None,
+    importance: Optional[str] = None,
+    after_published_at: Optional[datetime] = None,
+    after_id: Optional[UUID] = None,
+    cursor: Optional[str] = None,
+):
+    """
+    Export signals published in [date_from, date_to] in publication order.
+    `date_to` defaults to today.
+
+    To resume an interrupted export, pass the `published_at` and `id` of
+    the last row received as `after_published_at` and `after_id` (or a
+    pagination `cursor` for them).
+    """
+    date_to = date_to or date.today()
+    _check_range(date_from, date_to)
+    seek = _resume_after(cursor, (datetime, UUID), after_published_at, after_id)
+    movie_id = await _movie_id(movie_slug)
+
+    query = select(*SIGNAL_EXPORT_COLUMNS).where(
+        Signal.published_at >= datetime.combine(date_from, time.min),
+        Signal.published_at < datetime.combine(date_to + timedelta(days=1), time.min),
+    )
+    if movie_id:
+        query = query.where(Signal.movie_id == movie_id)
+    if signal_type:
+        query = query.where(Signal.signal_type == signal_type)
+    if importance:
+        query = query.where(Signal.importance == importance)
+    if seek:
+        query = query.where(tuple_(Signal.published_at, Signal.id) > tuple_(*seek))
+    query = query.order_by(Signal.published_at, Signal.id)
+
+    return _stream(
+        query,
+        SIGNAL_EXPORT_COLUMNS,
+        format,
+        f"signals_{date_from}_{date_to}",
+    )
+
+
+@router.get("/screenings")
+async def export_screenings(
+    date_from: date,
+    date_to: Optional[date] = None,
+    format: ExportFormat = "ndjson",
+    movie_slug: Optional[str] = None,
+    city: Optional[str] = None,
+    cinema_chain: Optional[str] = None,
+    after_snapshot_date: Optional[date] = None,
+    after_id: Optional[UUID] = None,
+    cursor: Optional[str] = None,
+):
+    """
+    Export screening snapshots for [date_from, date_to] in date order.
+    `date_to` defaults to today.
+
+    To resume an interrupted export, pass the `snapshot_date` and `id` of
+    the last row received as `after_snapshot_date` and `after_id` (or a
+    pagination `cursor` for them).
+    """
+    date_to = date_to or date.today()
+    _check_range(date_from, date_to)
+    seek = _resume_after(cursor, (date, UUID), after_snapshot_date, after_id)
+    movie_id = await _movie_id(movie_slug)
+
+    query = select(*SCREENING_EXPORT_COLUMNS).where(
+        ScreeningSnapshot.snapshot_date >= date_from,
+        ScreeningSnapshot.snapshot_date <= date_to,
+    )
+    if movie_id:
+        query = query.where(ScreeningSnapshot.movie_id == movie_id)
+    if city:
+        query = query.where(ScreeningSnapshot.city == city)
+    if cinema_chain:
+        query = query.where(ScreeningSnapshot.cinema_chain == cinema_chain)
+    if seek:
+        query = query.where(
+            tuple_(ScreeningSnapshot.snapshot_date, ScreeningSnapshot.id)
+            > tuple_(*seek)
+        )
+    query = query.order_by(ScreeningSnapshot.snapshot_date, ScreeningSnapshot.id)
+
+    return _stream(
+        query,
+        SCREENING_EXPORT_COLUMNS,
+        format,
+        f"screenings_{date_from}_{date_to}",
+    )
@@ -4,51 +4,118 @@ Movies router.
 
 from typing import Optional
 from datetime import date
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from shared.db import get_session
+from services.api.app.cache import cached
+from services.api.app.responses import parse_fields
+from shared.db import get_read_session
+from shared.db.pagination import (
+    InvalidCursor,
+    decode_cursor,
+    encode_cursor,
+    next_cursor,
+)
 from shared.db.repositories.movies import MovieRepository
 from shared.schemas.movie import MovieResponse, MovieListResponse
 
 router = APIRouter()
 
+# Needed for the keyset cursor, so always part of a fieldset
+CURSOR_FIELDS = ("id", "release_date")
+
+
+def _trim(movie, fields) -> dict:
+    return {
+        name: (
+            (movie.distributor.name if movie.distributor else None)
+            if name == "distributor_name"
+            else getattr(movie, name)
+        )
+        for name in fields
+    }
+
 
 @router.get("", response_model=MovieListResponse)
+@cached("movies", ttl=60)
 async def list_movies(
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
     search: Optional[str] = None,
     release_from: Optional[date] = None,
     release_to: Optional[date] = None,
     distributor: Optional[str] = None,
     featured: bool = False,
-    session: AsyncSession = Depends(get_session),
+    fields: Optional[str] = None,
+    session: AsyncSession = Depends(get_read_session),
 ):
-    """List movies with filters."""
+    """
+    List movies with filters.
+
+    `fields` is a comma-separated subset of movie fields; only those are
+    loaded and returned.
+    """
     repo = MovieRepository(session)
     offset = (page - 1) * per_page
+    selected = parse_fields(fields, MovieResponse.model_fields, CURSOR_FIELDS)
+
+    seek = None
+    if cursor:
+        try:
+            seek = decode_cursor(cursor, (float if search else date, UUID))
+        except InvalidCursor:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
 
     if search:
-        movies = await repo.search(search, offset=offset, limit=per_page)
-        total = len(movies)  # Simplified for demo
+        # Ranked by relevance, so the cursor is (rank, id)
+        rows = await repo.search(
+            search, offset=offset, limit=per_page, cursor=seek, fields=selected
+        )
+        movies = [row.Movie for row in rows]
+        page_cursor = (
+            encode_cursor(rows[-1].rank, rows[-1].Movie.id)
+            if len(rows) == per_page
+            else None
+        )
+        total, is_estimate = await repo.count_search(search)
     elif featured:
-        movies = await repo.get_featured(limit=per_page)
-        total = len(movies)
+        movies = await repo.get_featured(
+            per_page, offset=offset, cursor=seek, fields=selected
+        )
+        total, is_estimate = await repo.count_featured()
     elif distributor:
         movies = await repo.get_by_distributor(
-            distributor, offset=offset, limit=per_page
+            distributor, offset=offset, limit=per_page, cursor=seek, fields=selected
         )
-        total = len(movies)
+        total, is_estimate = await repo.count_by_distributor(distributor)
     else:
         movies = await repo.get_active(
             offset=offset,
             limit=per_page,
             release_from=release_from,
             release_to=release_to,
+            cursor=seek,
+            fields=selected,
+        )
+        total, is_estimate = await repo.count_active(
+            release_from=release_from, release_to=release_to
         )
-        total = await repo.count()
+
+    if not search:
+        page_cursor = next_cursor(movies, per_page, "release_date", "id")
+
+    if selected:
+        return {
+            "movies": [_trim(movie, selected) for movie in movies],
+            "total": total,
+            "page": page,
+            "per_page": per_page,
+            "next_cursor": page_cursor,
+            "total_is_estimate": is_estimate,
+        }
 
     return MovieListResponse(
         movies=[
@@ -65,13 +132,16 @@ async def list_movies(
         total=total,
         page=page,
         per_page=per_page,
+        next_cursor=page_cursor,
+        total_is_estimate=is_estimate,
     )
 
 
 @router.get("/{slug}", response_model=MovieResponse)
+@cached("movies", ttl=60)
 async def get_movie(
     slug: str,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ):
     """Get movie by slug."""
     repo = MovieRepository(session)
@@ -2,99 +2,221 @@
 Signals router.
 """
 
+import asyncio
 from typing import Optional
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from shared.db import get_session
-from shared.db.repositories.signals import SignalRepository
-from shared.db.repositories.movies import MovieRepository
-from shared.schemas.signal import SignalResponse, SignalListResponse
+from services.api.app.cache import cached
+from services.api.app.responses import parse_fields
+from services.api.app.slugs import slug_resolver
+from services.api.app.stream import StreamFilter, signal_stream
+from shared.db import get_read_session
+from shared.db.pagination import InvalidCursor, decode_cursor, next_cursor
+from shared.db.repositories.signals import FEED_FIELDS, SignalRepository
+from shared.schemas.signal import (
+    SignalDetailResponse,
+    SignalListResponse,
+    SignalResponse,
+)
+from shared.settings import get_settings
 
 router = APIRouter()
+settings = get_settings()
+
+# Needed for the keyset cursor, so always part of a fieldset
+CURSOR_FIELDS = ("id", "published_at")
+
+
+def _serialize(rows, fields):
+    if fields:
+        return [row._asdict() for row in rows]
+    return [SignalResponse.model_validate(row) for row in rows]
 
 
 @router.get("", response_model=SignalListResponse)
+@cached("signals", "movies", ttl=15)
 async def list_signals(
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
     movie_slug: Optional[str] = None,
     signal_type: Optional[str] = None,
     importance: Optional[str] = None,
     hours: int = Query(168, ge=1, le=720),  # Default 7 days
-    session: AsyncSession = Depends(get_session),
+    search: Optional[str] = Query(None, min_length=2, max_length=200),
+    fields: Optional[str] = None,
+    session: AsyncSession = Depends(get_read_session),
 ):
-    """List signals with filters."""
+    """
+    List signals with filters.
+
+    `search` runs a full-text query over title, summary and content and
+    orders results by relevance. `fields` is a comma-separated subset of
+    signal fields; only those are selected and returned.
+    """
     repo = SignalRepository(session)
+    selected = parse_fields(fields, FEED_FIELDS, required=CURSOR_FIELDS)
     offset = (page - 1) * per_page
+    sort_key = "rank" if search else "published_at"
+
+    seek = None
+    if cursor:
+        try:
+            seek = decode_cursor(cursor, (float if search else datetime, UUID))
+        except InvalidCursor:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        offset = 0
 
     # Get movie ID if slug provided
     movie_id = None
     if movie_slug:
-        movie_repo = MovieRepository(session)
-        movie = await movie_repo.get_by_slug(movie_slug)
+        movie = await slug_resolver.resolve(movie_slug)
         if movie:
             movie_id = movie.id
 
-    signals = await repo.get_recent(
+    signals = await repo.list_feed(
         hours=hours,
         signal_type=signal_type,
         importance=importance,
         movie_id=movie_id,
+        search=search,
+        cursor=seek,
         offset=offset,
         limit=per_page,
+        fields=selected,
     )
-
-    # Build response with related data
-    signal_responses = []
-    for signal in signals:
-        response = SignalResponse(
-            **{
-                **signal.__dict__,
-                "movie_title": signal.movie.title if signal.movie else None,
-                "source_name": signal.source.name if signal.source else None,
-            }
-        )
-        signal_responses.append(response)
-
-    return SignalListResponse(
-        signals=signal_responses,
-        total=len(signals),  # Simplified
-        page=page,
-        per_page=per_page,
+    total, is_estimate = await repo.count_recent(
+        hours=hours,
+        signal_type=signal_type,
+        importance=importance,
+        movie_id=movie_id,
+        search=search,
     )
 
+    return {
+        "signals": _serialize(signals, selected),
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "next_cursor": next_cursor(signals, per_page, sort_key, "id"),
+        "total_is_estimate": is_estimate,
+    }
+
 
 @router.get("/critical", response_model=SignalListResponse)
+@cached("signals", "movies", ttl=15)
 async def list_critical_signals(
     per_page: int = Query(10, ge=1, le=50),
-    session: AsyncSession = Depends(get_session),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    session: AsyncSession = Depends(get_read_session),
 ):
-    """List critical signals."""
+    """List critical signals of the last week."""
     repo = SignalRepository(session)
+    selected = parse_fields(fields, FEED_FIELDS, required=CURSOR_FIELDS)
 
-    signals = await repo.get_recent(
+    seek = None
+    if cursor:
+        try:
+            seek = decode_cursor(cursor, (datetime, UUID))
+        except InvalidCursor:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    signals = await repo.list_feed(
         hours=168,
         importance="critical",
+        cursor=seek,
         limit=per_page,
+        fields=selected,
     )
+    total, is_estimate = await repo.count_recent(hours=168, importance="critical")
+
+    return {
+        "signals": _serialize(signals, selected),
+        "total": total,
+        "page": 1,
+        "per_page": per_page,
+        "next_cursor": next_cursor(signals, per_page, "published_at", "id"),
+        "total_is_estimate": is_estimate,
+    }
+
+
+@router.get("/stream")
+async def stream_signals(
+    request: Request,
+    movie_slug: Optional[str] = None,
+    signal_type: Optional[str] = None,
+    importance: Optional[str] = None,
+    last_event_id: Optional[int] = Header(None),
+):
+    """
+    Live signal events (Server-Sent Events).
+
+    Emits `created` and `classified` events matching the filters. Clients
+    reconnecting with Last-Event-ID get the events they missed while they
+    are still in the server's buffer.
+    """
+    movie_id = None
+    if movie_slug:
+        movie = await slug_resolver.resolve(movie_slug)
+        if not movie:
+            raise HTTPException(status_code=404, detail="Movie not found")
+        movie_id = str(movie.id)
+
+    stream_filter = StreamFilter(
+        movie_id=movie_id, signal_type=signal_type, importance=importance
+    )
+    subscription, backlog = signal_stream.subscribe(stream_filter, last_event_id)
+
+    async def events():
+        try:
+            yield "retry: 5000\n\n"
+            for event in backlog:
+                yield event.encode()
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.get(), timeout=settings.sse_heartbeat_seconds
+                    )
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+                if event is None:
+                    break
+                yield event.encode()
+        finally:
+            signal_stream.unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/{signal_id}", response_model=SignalDetailResponse)
+@cached("signals", ttl=60)
+async def get_signal(
+    signal_id: UUID,
+    session: AsyncSession = Depends(get_read_session),
+):
+    """
+    Get a signal with its content, keywords and raw source data.
+
+    Raw data lives in the cold payload table and is only loaded here.
+    """
+    repo = SignalRepository(session)
+    signal = await repo.get(signal_id)
+
+    if not signal:
+        raise HTTPException(status_code=404, detail="Signal not found")
 
-    signal_responses = []
-    for signal in signals:
-        response = SignalResponse(
-            **{
-                **signal.__dict__,
-                "movie_title": signal.movie.title if signal.movie else None,
-                "source_name": signal.source.name if signal.source else None,
-            }
-        )
-        signal_responses.append(response)
-
-    return SignalListResponse(
-        signals=signal_responses,
-        total=len(signals),
-        page=1,
-        per_page=per_page,
+    payload = await repo.get_payload(signal)
+    return SignalDetailResponse.model_validate(signal).model_copy(
+        update={"raw_data": payload.get("raw_data") or {}}
     )
@@ -2,12 +2,16 @@
 Statistics router.
 """
 
-from typing import Optional
+import asyncio
+from datetime import timedelta
 
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from shared.db import get_session
+from services.api.app.cache import cached
+from shared.analytics import TrendEngine
+from shared.db import get_read_session, run_in_session
+from shared.db.models.movie import Movie
 from shared.db.repositories.signals import SignalRepository
 from shared.db.repositories.movies import MovieRepository
 from shared.schemas.stats import OverviewStats, MovieStats
@@ -15,19 +19,18 @@ from shared.schemas.stats import OverviewStats, MovieStats
 router = APIRouter()
 
 
-@router.get("/overview", response_model=OverviewStats)
-async def get_overview_stats(
-    days: int = Query(7, ge=1, le=90),
-    session: AsyncSession = Depends(get_session),
-):
-    """Get overview statistics for dashboard."""
-    signal_repo = SignalRepository(session)
-
-    # Get stats for current period
-    stats = await signal_repo.get_stats(days=days)
-
-    # Get 24h stats
-    stats_24h = await signal_repo.get_stats(days=1)
+async def overview_stats(days: int) -> OverviewStats:
+    """Overview statistics; sub-queries run concurrently."""
+    stats, stats_24h, trends = await asyncio.gather(
+        # Current period
+        run_in_session(lambda s: SignalRepository(s).get_stats(days=days), read=True),
+        # Last 24h
+        run_in_session(lambda s: SignalRepository(s).get_stats(days=1), read=True),
+        # Trend vs previous period of the same length
+        run_in_session(
+            lambda s: TrendEngine(s).signal_trends(timedelta(days=days)), read=True
+        ),
+    )
 
     return OverviewStats(
         signals_24h=stats_24h["total"],
@@ -36,26 +39,30 @@ async def get_overview_stats(
         notable_count=stats["by_importance"].get("notable", 0),
         by_type=stats["by_type"],
         by_sentiment=stats["by_sentiment"],
-        trend_vs_previous=0,  # TODO: Calculate trend
+        trend_vs_previous=trends["signals"].percent_change,
     )
 
 
-@router.get("/movie/{slug}", response_model=MovieStats)
-async def get_movie_stats(
-    slug: str,
-    session: AsyncSession = Depends(get_session),
-):
-    """Get statistics for a specific movie."""
-    movie_repo = MovieRepository(session)
-    signal_repo = SignalRepository(session)
-
-    movie = await movie_repo.get_by_slug(slug)
-    if not movie:
-        return MovieStats(movie_slug=slug, movie_title="Not found")
-
-    # Get signal stats for movie
-    stats = await signal_repo.get_stats(days=30, movie_id=movie.id)
-    stats_24h = await signal_repo.get_stats(days=1, movie_id=movie.id)
+async def movie_stats(movie: Movie) -> MovieStats:
+    """Statistics for a movie; sub-queries run concurrently."""
+    stats, stats_24h, screenings = await asyncio.gather(
+        # Signal stats for movie
+        run_in_session(
+            lambda s: SignalRepository(s).get_stats(days=30, movie_id=movie.id),
+            read=True,
+        ),
+        run_in_session(
+            lambda s: SignalRepository(s).get_stats(days=1, movie_id=movie.id),
+            read=True,
+        ),
+        # Week-over-week screenings trend
+        run_in_session(
+            lambda s: TrendEngine(s).screening_trend(
+                timedelta(days=7), movie_id=movie.id
+            ),
+            read=True,
+        ),
+    )
 
     return MovieStats(
         movie_slug=movie.slug,
@@ -72,4 +79,30 @@ async def get_movie_stats(
         neutral_count=stats["by_sentiment"].get("neutral", 0),
         total_screenings=movie.total_screenings,
         avg_occupancy=movie.avg_occupancy,
+        screenings_trend=screenings.percent_change,
     )
+
+
+@router.get("/overview", response_model=OverviewStats)
+@cached("signals", ttl=30)
+async def get_overview_stats(
+    days: int = Query(7, ge=1, le=90),
+):
+    """Get overview statistics for dashboard."""
+    return await overview_stats(days)
+
+
+@router.get("/movie/{slug}", response_model=MovieStats)
+@cached("signals", "movies", "screenings", ttl=60)
+async def get_movie_stats(
+    slug: str,
+    session: AsyncSession = Depends(get_read_session),
+):
+    """Get statistics for a specific movie."""
+    movie_repo = MovieRepository(session)
+
+    movie = await movie_repo.get_by_slug(slug)
+    if not movie:
+        return MovieStats(movie_slug=slug, movie_title="Not found")
+
+    return await movie_stats(movie)
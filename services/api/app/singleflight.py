@@ -0,0 +1,41 @@
+"""
+Single-flight execution for identical concurrent computations.
+
+The first caller for a key starts the computation as its own task; every
+caller that arrives while it is running awaits the same task instead of
+starting another one. The task is shielded, so a caller that goes away
+(client disconnect) does not cancel the work for everyone else.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable
+
+
+class SingleFlight:
+    """Per-process de-duplication of in-flight work by key."""
+
+    def __init__(self):
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.stats = {"executed": 0, "coalesced": 0}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `fn` once per key among concurrent callers."""
+        task = self._inflight.get(key)
+        if task is None:
+            self.stats["executed"] += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._forget(key, task))
+        else:
+            self.stats["coalesced"] += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved when every waiter went away
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,127 @@
+"""
+Movie slug resolver.
+
+Slug-filtered endpoints only need a movie's id (and sometimes its title
+or distributor), not the row itself. The resolver keeps every movie's
+slug → MovieRef in process, loaded in one query when the API starts and
+reloaded when it expires or the "movies" namespace version changes (the
+response cache follows those versions). Slugs missing from the table are
+looked up individually and remembered briefly, so a movie added between
+reloads is still found.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from services.api.app.cache import response_cache
+from shared.db import run_in_session
+from shared.db.models.distributor import Distributor
+from shared.db.models.movie import Movie
+
+logger = logging.getLogger(__name__)
+
+NAMESPACE = "movies"
+# Forget remembered misses past this many (e.g. crawlers guessing slugs)
+MAX_MISSING = 10_000
+
+
+@dataclass(frozen=True)
+class MovieRef:
+    """What slug-filtered endpoints need to know about a movie."""
+
+    id: UUID
+    slug: str
+    title: str
+    distributor_name: Optional[str] = None
+
+
+def _query():
+    return select(Movie.id, Movie.slug, Movie.title, Distributor.name).outerjoin(
+        Distributor, Distributor.id == Movie.distributor_id
+    )
+
+
+def _ref(row) -> MovieRef:
+    id, slug, title, distributor_name = row
+    return MovieRef(id=id, slug=slug, title=title, distributor_name=distributor_name)
+
+
+class SlugResolver:
+    """In-process slug → MovieRef table with TTL and versioned reloads."""
+
+    def __init__(self, ttl: int = 300, missing_ttl: int = 30):
+        self.ttl = ttl
+        self.missing_ttl = missing_ttl
+        self._refs: dict[str, MovieRef] = {}
+        self._missing: dict[str, float] = {}
+        self._version: Optional[int] = None
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+        self.stats = {"hits": 0, "lookups": 0, "not_found": 0, "reloads": 0}
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def _fresh(self) -> bool:
+        return (
+            self._expires_at > time.monotonic()
+            and self._version == response_cache.versions.get(NAMESPACE)
+        )
+
+    async def warm(self) -> None:
+        """Load every movie's slug."""
+        async with self._lock:
+            if self._fresh():
+                return
+            version = response_cache.versions.get(NAMESPACE)
+
+            async def load(session: AsyncSession):
+                result = await session.execute(_query())
+                return {ref.slug: ref for ref in map(_ref, result.all())}
+
+            self._refs = await run_in_session(load, read=True)
+            self._missing.clear()
+            self._version = version
+            self._expires_at = time.monotonic() + self.ttl
+            self.stats["reloads"] += 1
+            logger.info(f"Slug resolver loaded {len(self._refs)} movies")
+
+    async def resolve(self, slug: str) -> Optional[MovieRef]:
+        """The movie with this slug, or None."""
+        if not self._fresh():
+            await self.warm()
+
+        ref = self._refs.get(slug)
+        if ref is not None:
+            self.stats["hits"] += 1
+            return ref
+        if self._missing.get(slug, 0.0) > time.monotonic():
+            self.stats["not_found"] += 1
+            return None
+
+        self.stats["lookups"] += 1
+
+        async def lookup(session: AsyncSession):
+            result = await session.execute(_query().where(Movie.slug == slug))
+            return result.first()
+
+        row = await run_in_session(lookup, read=True)
+        if row is None:
+            self.stats["not_found"] += 1
+            if len(self._missing) >= MAX_MISSING:
+                self._missing.clear()
+            self._missing[slug] = time.monotonic() + self.missing_ttl
+            return None
+        ref = _ref(row)
+        self._refs[slug] = ref
+        return ref
+
+
+slug_resolver = SlugResolver()
@@ -0,0 +1,178 @@
+"""
+Live signal stream for Server-Sent Events.
+
+Each API process holds a single Redis subscription to the signal events
+channel and fans messages out to per-client queues, so the cost of a live
+client is a queue in memory rather than a periodic query. Recent events
+are kept in a ring buffer for clients resuming with Last-Event-ID.
+
+A client that cannot keep up is disconnected rather than allowed to grow
+its queue; the browser reconnects and resumes from the buffer.
+"""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from shared.events import SIGNAL_EVENTS_CHANNEL
+from shared.settings import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+QUEUE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class StreamEvent:
+    """A published signal event."""
+
+    id: int
+    event: str
+    data: dict
+
+    def encode(self) -> str:
+        """Wire format for text/event-stream."""
+        return (
+            f"id: {self.id}\n"
+            f"event: {self.event}\n"
+            f"data: {json.dumps(self.data, ensure_ascii=False)}\n\n"
+        )
+
+
+@dataclass(frozen=True)
+class StreamFilter:
+    """Per-client event filter; None matches anything."""
+
+    movie_id: Optional[str] = None
+    signal_type: Optional[str] = None
+    importance: Optional[str] = None
+
+    def matches(self, event: StreamEvent) -> bool:
+        data = event.data
+        return (
+            (self.movie_id is None or data.get("movie_id") == self.movie_id)
+            and (
+                self.signal_type is None or data.get("signal_type") == self.signal_type
+            )
+            and (self.importance is None or data.get("importance") == self.importance)
+        )
+
+
+class Subscription:
+    """A client's queue of matching events. `None` means disconnect."""
+
+    def __init__(self, stream_filter: StreamFilter):
+        self.filter = stream_filter
+        self.queue: asyncio.Queue[Optional[StreamEvent]] = asyncio.Queue(QUEUE_SIZE)
+
+    def offer(self, event: StreamEvent) -> bool:
+        """Queue an event. False when the client lags."""
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    async def get(self) -> Optional[StreamEvent]:
+        return await self.queue.get()
+
+
+class SignalStream:
+    """One Redis subscription per process, fanned out to subscribers."""
+
+    def __init__(self, buffer_size: int = 1000):
+        self.redis: Optional[Redis] = None
+        self.buffer: deque[StreamEvent] = deque(maxlen=buffer_size)
+        self._subscribers: set[Subscription] = set()
+        self._listener: Optional[asyncio.Task] = None
+        self.stats = {"received": 0, "delivered": 0, "dropped_clients": 0}
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    async def start(self, redis: Redis) -> None:
+        self.redis = redis
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+        self._listener = None
+        for subscription in list(self._subscribers):
+            self._close(subscription)
+        self.redis = None
+
+    async def _listen(self) -> None:
+        """Receive published events, reconnecting on errors."""
+        while True:
+            try:
+                pubsub = self.redis.pubsub()
+                await pubsub.subscribe(SIGNAL_EVENTS_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        raw = json.loads(message["data"])
+                        self.publish(StreamEvent(raw["id"], raw["event"], raw["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Signal stream listener error: {e}")
+                await asyncio.sleep(5)
+
+    def publish(self, event: StreamEvent) -> None:
+        """Buffer an event and hand it to matching subscribers."""
+        self.stats["received"] += 1
+        self.buffer.append(event)
+        for subscription in list(self._subscribers):
+            if not subscription.filter.matches(event):
+                continue
+            if subscription.offer(event):
+                self.stats["delivered"] += 1
+            else:
+                logger.info("Dropping lagging signal stream client")
+                self.stats["dropped_clients"] += 1
+                self._close(subscription)
+
+    def subscribe(
+        self, stream_filter: StreamFilter, last_event_id: Optional[int] = None
+    ) -> tuple[Subscription, list[StreamEvent]]:
+        """
+        Register a subscriber.
+
+        Returns the subscription and, when resuming from `last_event_id`,
+        the buffered matching events after it. Both are taken without
+        yielding to the loop, so nothing is missed or duplicated between
+        the backlog and the queue.
+        """
+        backlog = []
+        if last_event_id is not None:
+            backlog = [
+                event
+                for event in self.buffer
+                if event.id > last_event_id and stream_filter.matches(event)
+            ]
+        subscription = Subscription(stream_filter)
+        self._subscribers.add(subscription)
+        return subscription, backlog
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+
+    def _close(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+        # Make room for the sentinel so the reader wakes up and exits
+        while subscription.queue.full():
+            subscription.queue.get_nowait()
+        subscription.queue.put_nowait(None)
+
+
+signal_stream = SignalStream(buffer_size=settings.sse_buffer_size)
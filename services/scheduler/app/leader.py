@@ -0,0 +1,104 @@
+"""
+Scheduler leader election over a Redis lease.
+
+Every scheduler replica runs the same triggers, but only the holder of
+the lease enqueues jobs. The leader renews the lease well before it
+expires; if it dies, another replica takes over once the lease runs out.
+A replica that cannot reach Redis steps down, since it can no longer
+tell whether its lease is still valid.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+from typing import Optional
+from uuid import uuid4
+
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+LEASE_KEY = "scheduler:leader"
+
+# Extend or delete the lease only while we still hold it
+RENEW_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("PEXPIRE", KEYS[1], ARGV[2])
+end
+return 0
+"""
+RELEASE_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+class LeaderLease:
+    """A renewable Redis lease held by at most one scheduler."""
+
+    def __init__(self, ttl_ms: int = 30_000, key: str = LEASE_KEY):
+        self.ttl_ms = ttl_ms
+        self.key = key
+        self.token = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self.redis: Optional[Redis] = None
+        self.is_leader = False
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self, redis: Redis) -> None:
+        """Try to take the lease now, then keep renewing or retrying."""
+        self.redis = redis
+        await self.refresh()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop renewing and hand the lease over right away."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        if self.is_leader:
+            try:
+                await self.redis.eval(RELEASE_SCRIPT, 1, self.key, self.token)
+            except Exception as e:
+                logger.warning(f"Failed to release scheduler lease: {e}")
+        self._set_leader(False)
+
+    async def refresh(self) -> bool:
+        """Renew the lease if held, otherwise try to acquire it."""
+        try:
+            held = False
+            if self.is_leader:
+                held = bool(
+                    await self.redis.eval(
+                        RENEW_SCRIPT, 1, self.key, self.token, self.ttl_ms
+                    )
+                )
+            if not held:
+                held = bool(
+                    await self.redis.set(self.key, self.token, nx=True, px=self.ttl_ms)
+                )
+        except Exception as e:
+            logger.warning(f"Scheduler lease check failed: {e}")
+            held = False
+        self._set_leader(held)
+        return held
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.ttl_ms / 3000)
+            await self.refresh()
+
+    def _set_leader(self, leader: bool) -> None:
+        if leader != self.is_leader:
+            state = "acquired" if leader else "lost"
+            logger.info(f"Scheduler lease {state} ({self.token})")
+        self.is_leader = leader
+
+
+lease = LeaderLease()
@@ -1,92 +1,190 @@
 """
 APScheduler entry point.
+
+Replicas elect a leader over a Redis lease (see leader.py); only the
+leader enqueues. Periodic jobs get the id `task:window`, the start of the
+period they belong to, so repeated enqueues within a period (a second
+replica, a restart, a misfire) collapse into one job. A task is not
+enqueued again while its previous job is still queued or running.
 """
 
 import asyncio
 import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
-from shared.queue import enqueue_task
+from shared.analytics.collection import COLLECTED_TYPES, now_utc, plan
+from shared.db.database import async_session_factory
+from shared.db.repositories.sources import SourceRepository
+from shared.queue import close_redis_pool, enqueue_many, enqueue_task, get_redis_pool
+from shared.queue.jobs import job_in_flight
+from shared.settings import get_settings
+from services.scheduler.app.leader import lease
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+CLASSIFY_EVERY = timedelta(minutes=30)
+HOURLY = timedelta(hours=1)
+DAILY = timedelta(days=1)
+
+# Last job enqueued per task, so any leader can check it is done
+LAST_JOB_KEY = "scheduler:last_job:{task}"
+LAST_JOB_TTL = 7 * 24 * 3600
+
+
+def window_job_id(task: str, period: timedelta) -> str:
+    """`task:window`, identical for every enqueue within one period."""
+    seconds = int(period.total_seconds())
+    start = int(time.time()) // seconds * seconds
+    return f"{task}:{datetime.fromtimestamp(start, timezone.utc):%Y-%m-%dT%H:%M}"
+
+
+async def enqueue_periodic(task: str, period: timedelta, *args) -> Optional[str]:
+    """
+    Enqueue a periodic task once per period, on the leader only.
+
+    Skipped while the task's previous job is still in flight. Returns the
+    job id, or None when nothing was enqueued.
+    """
+    if not lease.is_leader:
+        return None
+
+    pool = await get_redis_pool()
+    last_key = LAST_JOB_KEY.format(task=task)
+    previous = await pool.get(last_key)
+    if previous and await job_in_flight(pool, previous.decode()):
+        logger.info(f"Skipping {task}: {previous.decode()} still in flight")
+        return None
+
+    job_id = await enqueue_task(task, *args, _job_id=window_job_id(task, period))
+    if not job_id:
+        logger.info(f"Skipping {task}: already enqueued this period")
+        return None
+    await pool.set(last_key, job_id, ex=LAST_JOB_TTL)
+    return job_id
+
+
+async def schedule_due_collection():
+    """Enqueue checks of due sources, most expected new items first."""
+    if not lease.is_leader:
+        return
+
+    budget = max(
+        1,
+        round(
+            settings.collection_fetch_budget_per_hour
+            * settings.collection_tick_minutes
+            / 60
+        ),
+    )
+    async with async_session_factory() as session:
+        due = await SourceRepository(session).get_due(COLLECTED_TYPES)
+    selected = plan(due, budget, now_utc())
+    if not selected:
+        return
+
+    # One job per source and scheduled check: a check still queued from an
+    # earlier tick is not enqueued again
+    job_ids = await enqueue_many(
+        "collect_source",
+        [(str(source.id),) for source in selected],
+        _job_ids=[
+            f"collect_source:{source.id}:"
+            f"{int(source.next_check_at.timestamp()) if source.next_check_at else 0}"
+            for source in selected
+        ],
+    )
+    queued = sum(1 for job_id in job_ids if job_id)
+    logger.info(f"Scheduling {queued} source checks ({len(due)} due, budget {budget})")
 
 
-async def schedule_collection_all():
-    """Schedule full collection."""
-    logger.info("Scheduling collect_all job")
-    await enqueue_task("collect_all")
+async def schedule_classification():
+    """Schedule classification job."""
+    if await enqueue_periodic("classify_batch", CLASSIFY_EVERY):
+        logger.info("Scheduled classification job")
 
 
-async def schedule_collection_news():
-    """Schedule news collection."""
-    logger.info("Scheduling news collection job")
-    await enqueue_task("collect_by_type", "news_site")
+async def schedule_metrics_update():
+    """Schedule metrics update job."""
+    if await enqueue_periodic("update_movie_metrics", HOURLY):
+        logger.info("Scheduled metrics update job")
 
 
-async def schedule_collection_telegram():
-    """Schedule Telegram collection."""
-    logger.info("Scheduling Telegram collection job")
-    await enqueue_task("collect_by_type", "telegram")
+async def schedule_screenings_aggregation():
+    """Schedule screening snapshot aggregation job."""
+    if await enqueue_periodic("aggregate_screenings", HOURLY):
+        logger.info("Scheduled screenings aggregation job")
 
 
-async def schedule_classification():
-    """Schedule classification job."""
-    logger.info("Scheduling classification job")
-    await enqueue_task("classify_batch")
+async def schedule_partition_maintenance():
+    """Schedule partition maintenance job."""
+    if await enqueue_periodic("maintain_partitions", DAILY):
+        logger.info("Scheduled partition maintenance job")
 
 
-async def schedule_metrics_update():
-    """Schedule metrics update job."""
-    logger.info("Scheduling metrics update job")
-    await enqueue_task("update_movie_metrics")
+async def schedule_signal_retention():
+    """Schedule signal retention job."""
+    if await enqueue_periodic("prune_signals", DAILY):
+        logger.info("Scheduled signal retention job")
 
 
 def create_scheduler() -> AsyncIOScheduler:
     """Create and configure scheduler."""
-    scheduler = AsyncIOScheduler()
+    # Never run a tick alongside itself, and fold missed ticks into one
+    scheduler = AsyncIOScheduler(job_defaults={"coalesce": True, "max_instances": 1})
+
+    # Adaptive collection: due sources within the fetch budget
+    scheduler.add_job(
+        schedule_due_collection,
+        IntervalTrigger(minutes=settings.collection_tick_minutes),
+        id="collect_due",
+        replace_existing=True,
+    )
 
-    # Collection jobs
-    # Full collection every 6 hours
+    # Classification every 30 minutes
     scheduler.add_job(
-        schedule_collection_all,
-        IntervalTrigger(hours=6),
-        id="collect_all",
+        schedule_classification,
+        IntervalTrigger(seconds=CLASSIFY_EVERY.total_seconds()),
+        id="classify",
         replace_existing=True,
     )
 
-    # News collection every 2 hours
+    # Metrics update every hour
     scheduler.add_job(
-        schedule_collection_news,
-        IntervalTrigger(hours=2),
-        id="collect_news",
+        schedule_metrics_update,
+        IntervalTrigger(seconds=HOURLY.total_seconds()),
+        id="update_metrics",
         replace_existing=True,
     )
 
-    # Telegram collection every hour
+    # Screening rollups every hour
     scheduler.add_job(
-        schedule_collection_telegram,
-        IntervalTrigger(hours=1),
-        id="collect_telegram",
+        schedule_screenings_aggregation,
+        IntervalTrigger(seconds=HOURLY.total_seconds()),
+        id="aggregate_screenings",
         replace_existing=True,
     )
 
-    # Classification every 30 minutes
+    # Partition maintenance daily at 03:00
     scheduler.add_job(
-        schedule_classification,
-        IntervalTrigger(minutes=30),
-        id="classify",
+        schedule_partition_maintenance,
+        CronTrigger(hour=3, minute=0),
+        id="maintain_partitions",
         replace_existing=True,
     )
 
-    # Metrics update every hour
+    # Signal retention daily at 04:00, after partition maintenance
     scheduler.add_job(
-        schedule_metrics_update,
-        IntervalTrigger(hours=1),
-        id="update_metrics",
+        schedule_signal_retention,
+        CronTrigger(hour=4, minute=0),
+        id="prune_signals",
         replace_existing=True,
     )
 
@@ -97,6 +195,10 @@ async def main():
     """Main entry point."""
     logger.info("Starting Cinema Radar Scheduler")
 
+    # Open the queue pool once; every tick and the lease reuse it
+    redis = await get_redis_pool()
+    await lease.start(redis)
+
     scheduler = create_scheduler()
     scheduler.start()
 
@@ -108,9 +210,12 @@ async def main():
     try:
         while True:
             await asyncio.sleep(60)
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         logger.info("Shutting down scheduler")
         scheduler.shutdown()
+    finally:
+        await lease.stop()
+        await close_redis_pool()
 
 
 if __name__ == "__main__":
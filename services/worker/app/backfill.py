@@ -0,0 +1,722 @@
+"""
+Historical backfill loader.
+
+Streams CSV, NDJSON or Parquet files into a temporary staging table with
+COPY and merges each chunk into its target table with a single
+INSERT ... SELECT, deduplicating on slug (movies), external_id (signals)
+or the snapshot's natural key (screenings). Signals and screenings refer
+to movies by slug, so load movies first.
+
+Raw data and embeddings are packed in Python and staged as one payload
+column, which the merge writes to the cold payload table.
+
+Progress is checkpointed to a JSON file after every committed chunk; an
+interrupted load resumes where it stopped, along with the range of dates
+loaded. Once the file is loaded the movie metrics and the rollups
+covering those dates are rebuilt.
+
+Usage:
+    python -m services.worker.app.backfill movies movies.csv
+    python -m services.worker.app.backfill signals reviews.ndjson
+    python -m services.worker.app.backfill screenings snapshots.parquet
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from itertools import islice
+from typing import Iterator, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from shared.cache import publish_invalidation
+from shared.config.retention import RETENTION_POLICIES
+from shared.db.database import engine
+from shared.db.models.payload import pack_payload
+from shared.queue import close_redis_pool, get_redis_pool
+from services.worker.app.tasks.metrics import update_movie_metrics
+from services.worker.app.tasks.partitions import maintain_partitions
+from services.worker.app.tasks.retention import prune_signals
+from services.worker.app.tasks.screenings import aggregate_screenings
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 50_000
+FORMATS = ("csv", "ndjson", "parquet")
+
+
+@dataclass(frozen=True)
+class BackfillTarget:
+    """A table that can be backfilled and how staged rows merge into it."""
+
+    table: str
+    columns: tuple[str, ...]  # accepted input fields, staged as TEXT
+    required: tuple[str, ...]
+    merge_sql: str  # merges the staging table, selects the rows merged
+    cold: tuple[str, ...] = ()  # fields staged as one packed payload
+    payload_table: Optional[str] = None
+    partition_key: Optional[str] = None  # staged field giving the month
+    invalidates: tuple[str, ...] = ()
+
+
+MOVIES = BackfillTarget(
+    table="movies",
+    columns=(
+        "slug",
+        "title",
+        "original_title",
+        "description",
+        "poster_url",
+        "release_date",
+        "year",
+        "runtime_minutes",
+        "age_rating",
+        "kinopoisk_id",
+        "afisha_id",
+        "imdb_id",
+        "kinopoisk_rating",
+        "kinopoisk_votes",
+        "afisha_rating",
+        "imdb_rating",
+    ),
+    required=("slug", "title"),
+    # Later rows win within a chunk; fields missing from the file keep
+    # the stored value
+    merge_sql="""
+        WITH merged AS (
+            INSERT INTO movies (
+                slug, title, original_title, description, poster_url,
+                release_date, year, runtime_minutes, age_rating,
+                kinopoisk_id, afisha_id, imdb_id,
+                kinopoisk_rating, kinopoisk_votes, afisha_rating, imdb_rating
+            )
+            SELECT DISTINCT ON (slug)
+                slug, title, original_title, description, poster_url,
+                release_date::date, year::integer, runtime_minutes::integer, age_rating,
+                kinopoisk_id, afisha_id, imdb_id,
+                kinopoisk_rating::float, kinopoisk_votes::integer,
+                afisha_rating::float, imdb_rating::float
+            FROM backfill_movies
+            ORDER BY slug, line DESC
+            ON CONFLICT (slug) DO UPDATE SET
+                title = EXCLUDED.title,
+                original_title = coalesce(EXCLUDED.original_title, movies.original_title),
+                description = coalesce(EXCLUDED.description, movies.description),
+                poster_url = coalesce(EXCLUDED.poster_url, movies.poster_url),
+                release_date = coalesce(EXCLUDED.release_date, movies.release_date),
+                year = coalesce(EXCLUDED.year, movies.year),
+                runtime_minutes = coalesce(EXCLUDED.runtime_minutes, movies.runtime_minutes),
+                age_rating = coalesce(EXCLUDED.age_rating, movies.age_rating),
+                kinopoisk_id = coalesce(EXCLUDED.kinopoisk_id, movies.kinopoisk_id),
+                afisha_id = coalesce(EXCLUDED.afisha_id, movies.afisha_id),
+                imdb_id = coalesce(EXCLUDED.imdb_id, movies.imdb_id),
+                kinopoisk_rating = coalesce(EXCLUDED.kinopoisk_rating, movies.kinopoisk_rating),
+                kinopoisk_votes = coalesce(EXCLUDED.kinopoisk_votes, movies.kinopoisk_votes),
+                afisha_rating = coalesce(EXCLUDED.afisha_rating, movies.afisha_rating),
+                imdb_rating = coalesce(EXCLUDED.imdb_rating, movies.imdb_rating),
+                updated_at = now()
+            RETURNING 1
+        )
+        SELECT count(*) FROM merged
+        """,
+    invalidates=("movies",),
+)
+
+SIGNALS = BackfillTarget(
+    table="signals",
+    columns=(
+        "external_id",
+        "movie_slug",
+        "title",
+        "content",
+        "summary",
+        "source_url",
+        "image_url",
+        "author",
+        "signal_type",
+        "importance",
+        "sentiment",
+        "sentiment_score",
+        "rating",
+        "platform_rating",
+        "views_count",
+        "likes_count",
+        "comments_count",
+        "shares_count",
+        "keywords",
+        "published_at",
+        "is_classified",
+    ),
+    required=("external_id", "title", "source_url", "published_at"),
+    cold=("raw_data", "embedding"),
+    payload_table="signal_payloads",
+    # External_ids already claimed (stored now or earlier) are skipped.
+    # Signals with a type are taken as classified unless the file says
+    # otherwise, so historical data does not flood the classification queue.
+    merge_sql="""
+        WITH staged AS (
+            SELECT DISTINCT ON (external_id) *
+            FROM backfill_signals
+            ORDER BY external_id, line DESC
+        ),
+        claimed AS (
+            INSERT INTO signal_external_ids (external_id)
+            SELECT external_id FROM staged
+            ON CONFLICT DO NOTHING
+            RETURNING external_id
+        ),
+        inserted AS (
+            INSERT INTO signals (
+                external_id, movie_id, title, content, summary, source_url,
+                image_url, author, signal_type, importance, sentiment,
+                sentiment_score, rating, platform_rating, views_count,
+                likes_count, comments_count, shares_count, keywords,
+                published_at, is_classified
+            )
+            SELECT
+                staged.external_id, movies.id, staged.title, staged.content,
+                staged.summary, staged.source_url, staged.image_url,
+                staged.author, staged.signal_type, staged.importance,
+                staged.sentiment, staged.sentiment_score::float,
+                staged.rating::float, staged.platform_rating,
+                staged.views_count::integer, staged.likes_count::integer,
+                staged.comments_count::integer, staged.shares_count::integer,
+                staged.keywords::jsonb, staged.published_at::timestamptz,
+                coalesce(staged.is_classified::boolean, staged.signal_type IS NOT NULL)
+            FROM staged
+            JOIN claimed USING (external_id)
+            LEFT JOIN movies ON movies.slug = staged.movie_slug
+            ON CONFLICT ON CONSTRAINT uq_signals_external_id DO NOTHING
+            RETURNING id, external_id, published_at
+        ),
+        payloads AS (
+            INSERT INTO signal_payloads (id, published_at, payload)
+            SELECT inserted.id, inserted.published_at, staged.payload
+            FROM inserted
+            JOIN staged USING (external_id)
+            WHERE staged.payload IS NOT NULL
+        )
+        SELECT count(*) FROM inserted
+        """,
+    partition_key="published_at",
+    invalidates=("signals",),
+)
+
+SCREENINGS = BackfillTarget(
+    table="screening_snapshots",
+    columns=(
+        "movie_slug",
+        "city",
+        "cinema_chain",
+        "snapshot_date",
+        "snapshot_time",
+        "screenings_count",
+        "cinemas_count",
+        "halls_count",
+        "avg_occupancy_percent",
+        "total_seats",
+        "sold_seats",
+        "morning_screenings",
+        "afternoon_screenings",
+        "evening_screenings",
+        "format_2d",
+        "format_3d",
+        "format_imax",
+        "format_dolby",
+        "min_price",
+        "max_price",
+        "avg_price",
+    ),
+    required=("movie_slug", "city", "snapshot_date"),
+    cold=("raw_data",),
+    payload_table="screening_payloads",
+    # Rows for unknown movies are skipped, as are snapshots already stored
+    # for the same movie, city, chain and time
+    merge_sql="""
+        WITH staged AS (
+            SELECT DISTINCT ON (movie_id, city, cinema_chain, snapshot_time) *
+            FROM (
+                SELECT
+                    staged.line,
+                    movies.id AS movie_id,
+                    staged.city,
+                    staged.cinema_chain,
+                    staged.snapshot_date::date AS snapshot_date,
+                    coalesce(
+                        staged.snapshot_time::timestamptz,
+                        staged.snapshot_date::date::timestamptz
+                    ) AS snapshot_time,
+                    staged.screenings_count,
+                    staged.cinemas_count,
+                    staged.halls_count,
+                    staged.avg_occupancy_percent,
+                    staged.total_seats,
+                    staged.sold_seats,
+                    staged.morning_screenings,
+                    staged.afternoon_screenings,
+                    staged.evening_screenings,
+                    staged.format_2d,
+                    staged.format_3d,
+                    staged.format_imax,
+                    staged.format_dolby,
+                    staged.min_price,
+                    staged.max_price,
+                    staged.avg_price,
+                    staged.payload
+                FROM backfill_screening_snapshots staged
+                JOIN movies ON movies.slug = staged.movie_slug
+            ) resolved
+            ORDER BY movie_id, city, cinema_chain, snapshot_time, line DESC
+        ),
+        inserted AS (
+            INSERT INTO screening_snapshots (
+                movie_id, city, cinema_chain, snapshot_date, snapshot_time,
+                screenings_count, cinemas_count, halls_count,
+                avg_occupancy_percent, total_seats, sold_seats,
+                morning_screenings, afternoon_screenings, evening_screenings,
+                format_2d, format_3d, format_imax, format_dolby,
+                min_price, max_price, avg_price
+            )
+            SELECT
+                movie_id, city, cinema_chain, snapshot_date, snapshot_time,
+                coalesce(screenings_count::integer, 0),
+                coalesce(cinemas_count::integer, 0),
+                coalesce(halls_count::integer, 0),
+                avg_occupancy_percent::float,
+                total_seats::integer,
+                sold_seats::integer,
+                coalesce(morning_screenings::integer, 0),
+                coalesce(afternoon_screenings::integer, 0),
+                coalesce(evening_screenings::integer, 0),
+                coalesce(format_2d::integer, 0),
+                coalesce(format_3d::integer, 0),
+                coalesce(format_imax::integer, 0),
+                coalesce(format_dolby::integer, 0),
+                min_price::integer,
+                max_price::integer,
+                avg_price::float
+            FROM staged
+            WHERE NOT EXISTS (
+                SELECT 1 FROM screening_snapshots existing
+                WHERE existing.movie_id = staged.movie_id
+                  AND existing.snapshot_date = staged.snapshot_date
+                  AND existing.city = staged.city
+                  AND existing.cinema_chain IS NOT DISTINCT FROM staged.cinema_chain
+                  AND existing.snapshot_time = staged.snapshot_time
+            )
+            RETURNING id, movie_id, city, cinema_chain, snapshot_date, snapshot_time
+        ),
+        payloads AS (
+            INSERT INTO screening_payloads (id, snapshot_date, payload)
+            SELECT inserted.id, inserted.snapshot_date, staged.payload
+            FROM inserted
+            JOIN staged
+              ON staged.movie_id = inserted.movie_id
+             AND staged.city = inserted.city
+             AND staged.cinema_chain IS NOT DISTINCT FROM inserted.cinema_chain
+             AND staged.snapshot_time = inserted.snapshot_time
+            WHERE staged.payload IS NOT NULL
+        )
+        SELECT count(*) FROM inserted
+        """,
+    partition_key="snapshot_date",
+    invalidates=("movies", "screenings"),
+)
+
+TARGETS = {"movies": MOVIES, "signals": SIGNALS, "screenings": SCREENINGS}
+
+
+# Readers
+
+
+def read_csv(path: str) -> Iterator[dict]:
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+def read_ndjson(path: str) -> Iterator[dict]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_parquet(path: str) -> Iterator[dict]:
+    if pq is None:
+        raise RuntimeError("Reading Parquet requires pyarrow (pip install pyarrow)")
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=CHUNK_SIZE):
+        yield from batch.to_pylist()
+
+
+READERS = {"csv": read_csv, "ndjson": read_ndjson, "parquet": read_parquet}
+
+
+def detect_format(path: str) -> str:
+    """File format from the extension (.jsonl counts as NDJSON)."""
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    if extension == "jsonl":
+        return "ndjson"
+    if extension in FORMATS:
+        return extension
+    raise ValueError(f"Cannot tell the format of {path}; pass --format")
+
+
+def _text(value) -> Optional[str]:
+    """Stage a field as text; empty values become NULL."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _payload(row: dict, fields: tuple[str, ...]) -> Optional[bytes]:
+    """Pack a row's cold fields; JSON text (e.g. from CSV) is decoded."""
+    data = {}
+    for field in fields:
+        value = row.get(field)
+        if isinstance(value, str) and value:
+            value = json.loads(value)
+        if value:
+            data[field] = value
+    return pack_payload(data) if data else None
+
+
+# Checkpoints
+
+
+@dataclass
+class Checkpoint:
+    """Progress of a load, saved after every committed chunk."""
+
+    path: str
+    target: str
+    source: str
+    rows: int = 0  # input rows consumed
+    merged: int = 0
+    invalid: int = 0
+    done: bool = False
+    # Dates of the partition key loaded so far (ISO), for rebuilding rollups
+    first_date: Optional[str] = None
+    last_date: Optional[str] = None
+
+    @classmethod
+    def load(cls, path: str, target: str, source: str) -> "Checkpoint":
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("target") == target and data.get("source") == source:
+                return cls(
+                    path=path,
+                    target=target,
+                    source=source,
+                    rows=data["rows"],
+                    merged=data["merged"],
+                    invalid=data["invalid"],
+                    done=data["done"],
+                    first_date=data.get("first_date"),
+                    last_date=data.get("last_date"),
+                )
+            logger.warning(f"Ignoring checkpoint {path} for another load")
+        return cls(path=path, target=target, source=source)
+
+    def save(self) -> None:
+        data = {
+            "target": self.target,
+            "source": self.source,
+            "rows": self.rows,
+            "merged": self.merged,
+            "invalid": self.invalid,
+            "done": self.done,
+            "first_date": self.first_date,
+            "last_date": self.last_date,
+            "updated_at": datetime.utcnow().isoformat(),
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def cover(self, first: Optional[date], last: Optional[date]) -> None:
+        """Widen the loaded date range to include [first, last]."""
+        if first is not None and (
+            self.first_date is None or first < date.fromisoformat(self.first_date)
+        ):
+            self.first_date = first.isoformat()
+        if last is not None and (
+            self.last_date is None or last > date.fromisoformat(self.last_date)
+        ):
+            self.last_date = last.isoformat()
+
+
+# Loading
+
+
+async def _create_staging(conn: AsyncConnection, target: BackfillTarget) -> str:
+    """
+    Create the staging table on this connection.
+
+    Timestamps without an offset are read as UTC, the timezone partitions
+    are bounded in.
+    """
+    staging = f"backfill_{target.table}"
+    columns = ", ".join(f"{column} TEXT" for column in target.columns)
+    if target.cold:
+        columns += ", payload BYTEA"
+    await conn.execute(text("SET TIME ZONE 'UTC'"))
+    await conn.execute(text(f"CREATE TEMP TABLE {staging} (line BIGINT, {columns})"))
+    await conn.commit()
+    return staging
+
+
+async def _drop_staging(conn: AsyncConnection, staging: str) -> None:
+    """Leave the pooled connection as it was."""
+    await conn.rollback()
+    await conn.execute(text(f"DROP TABLE IF EXISTS {staging}"))
+    await conn.execute(text("RESET TIME ZONE"))
+    await conn.commit()
+
+
+async def _ensure_months(
+    conn: AsyncConnection, target: BackfillTarget, staging: str
+) -> None:
+    """Create monthly partitions for staged rows so they skip the default."""
+    result = await conn.execute(
+        text(
+            f"SELECT DISTINCT date_trunc('month', {target.partition_key}::timestamptz)"
+            f"::date FROM {staging}"
+        )
+    )
+    parents = [target.table, target.payload_table] if target.cold else [target.table]
+    for month in result.scalars().all():
+        for parent in parents:
+            await conn.execute(
+                text("SELECT create_monthly_partition(:parent, :key_column, :month)"),
+                {"parent": parent, "key_column": target.partition_key, "month": month},
+            )
+
+
+async def _staged_dates(
+    conn: AsyncConnection, target: BackfillTarget, staging: str
+) -> tuple[Optional[date], Optional[date]]:
+    """First and last date of the partition key among the staged rows."""
+    key = f"({target.partition_key}::timestamptz)::date"
+    result = await conn.execute(text(f"SELECT min({key}), max({key}) FROM {staging}"))
+    first, last = result.one()
+    await conn.commit()
+    return first, last
+
+
+async def _load_chunk(
+    conn: AsyncConnection,
+    target: BackfillTarget,
+    staging: str,
+    records: list[tuple],
+) -> int:
+    """COPY a chunk into staging, merge it and commit. Returns rows merged."""
+    # Everything from here to the commit is one transaction
+    await conn.execute(text(f"TRUNCATE {staging}"))
+    raw = await conn.get_raw_connection()
+    columns = ["line", *target.columns] + (["payload"] if target.cold else [])
+    await raw.driver_connection.copy_records_to_table(
+        staging, records=records, columns=columns
+    )
+    if target.partition_key:
+        await _ensure_months(conn, target, staging)
+    merged = (await conn.execute(text(target.merge_sql))).scalar_one()
+    await conn.commit()
+    return merged
+
+
+async def _load(
+    conn: AsyncConnection,
+    target: BackfillTarget,
+    staging: str,
+    rows: Iterator[dict],
+    chunk_size: int,
+    checkpoint: Checkpoint,
+) -> int:
+    """Load `rows` chunk by chunk, checkpointing each. Returns rows read."""
+    started = time.monotonic()
+    read = 0
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return read
+
+        records = []
+        for offset, row in enumerate(chunk):
+            if any(_text(row.get(field)) is None for field in target.required):
+                checkpoint.invalid += 1
+                continue
+            record = (
+                checkpoint.rows + offset,
+                *(_text(row.get(column)) for column in target.columns),
+            )
+            if target.cold:
+                record += (_payload(row, target.cold),)
+            records.append(record)
+
+        if records:
+            checkpoint.merged += await _load_chunk(conn, target, staging, records)
+            if target.partition_key:
+                checkpoint.cover(*await _staged_dates(conn, target, staging))
+        checkpoint.rows += len(chunk)
+        checkpoint.save()
+
+        read += len(chunk)
+        elapsed = time.monotonic() - started
+        logger.info(
+            f"{checkpoint.target}: {checkpoint.rows} rows read, "
+            f"{checkpoint.merged} merged, {checkpoint.invalid} invalid "
+            f"({read / max(elapsed, 1e-6):.0f} rows/s)"
+        )
+
+
+async def backfill(
+    target_name: str,
+    path: str,
+    file_format: Optional[str] = None,
+    chunk_size: int = CHUNK_SIZE,
+    checkpoint_path: Optional[str] = None,
+    restart: bool = False,
+) -> Checkpoint:
+    """Load a file into a target table, resuming from its checkpoint."""
+    target = TARGETS[target_name]
+    rows = READERS[file_format or detect_format(path)](path)
+
+    checkpoint = Checkpoint.load(
+        checkpoint_path or f"{path}.checkpoint.json",
+        target_name,
+        os.path.abspath(path),
+    )
+    if restart:
+        checkpoint = Checkpoint(checkpoint.path, target_name, checkpoint.source)
+    if checkpoint.done:
+        logger.info(f"{path} is already loaded (see {checkpoint.path})")
+        return checkpoint
+    if checkpoint.rows:
+        logger.info(f"Resuming {path} after {checkpoint.rows} rows")
+        rows = islice(rows, checkpoint.rows, None)
+
+    started = time.monotonic()
+    async with engine.connect() as conn:
+        staging = await _create_staging(conn, target)
+        try:
+            read = await _load(conn, target, staging, rows, chunk_size, checkpoint)
+        finally:
+            await _drop_staging(conn, staging)
+
+    checkpoint.done = True
+    checkpoint.save()
+
+    elapsed = time.monotonic() - started
+    logger.info(
+        f"Loaded {path} into {target.table}: {read} rows in {elapsed:.1f}s "
+        f"({read / max(elapsed, 1e-6):.0f} rows/s), {checkpoint.merged} merged"
+    )
+    return checkpoint
+
+
+def screening_window(checkpoint: Optional[Checkpoint], today: date) -> Optional[int]:
+    """
+    Days of a trailing screening rollup window reaching back to the first
+    date loaded, when that is before the regular 7-day window.
+    """
+    if not checkpoint or not checkpoint.first_date:
+        return None
+    days = (today - date.fromisoformat(checkpoint.first_date)).days + 1
+    return days if days > 7 else None
+
+
+def reaches_retention(checkpoint: Optional[Checkpoint], today: date) -> bool:
+    """Whether signals were loaded that a retention policy would prune."""
+    if not checkpoint or not checkpoint.first_date:
+        return False
+    shortest = min(policy.max_age_days for policy in RETENTION_POLICIES)
+    return date.fromisoformat(checkpoint.first_date) < today - timedelta(days=shortest)
+
+
+async def rebuild_rollups(
+    target_name: str, checkpoint: Optional[Checkpoint] = None
+) -> None:
+    """
+    Rebuild the aggregates that depend on the loaded table.
+
+    Screenings get a rollup window reaching back to the first date loaded,
+    then the regular window that sets the movie columns. Signals older
+    than retention are detached or pruned right away, which adds them to
+    signal_daily_rollups, before movie metrics are recounted.
+    """
+    ctx = {"redis": await get_redis_pool()}
+    today = date.today()
+    if target_name == "signals" and reaches_retention(checkpoint, today):
+        await maintain_partitions(ctx)
+        await prune_signals(ctx)
+    await update_movie_metrics(ctx)
+    if target_name == "screenings":
+        days = screening_window(checkpoint, today)
+        if days:
+            await aggregate_screenings(ctx, days=days)
+        await aggregate_screenings(ctx)
+    await publish_invalidation(ctx["redis"], *TARGETS[target_name].invalidates)
+
+
+async def main(args: argparse.Namespace) -> None:
+    try:
+        checkpoint = await backfill(
+            args.target,
+            args.path,
+            file_format=args.format,
+            chunk_size=args.chunk_size,
+            checkpoint_path=args.checkpoint,
+            restart=args.restart,
+        )
+        if not args.skip_rollups:
+            await rebuild_rollups(args.target, checkpoint)
+    finally:
+        await close_redis_pool()
+        await engine.dispose()
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Backfill historical data with COPY and merge it."
+    )
+    parser.add_argument("target", choices=sorted(TARGETS))
+    parser.add_argument("path", help="CSV, NDJSON or Parquet file")
+    parser.add_argument("--format", choices=FORMATS, help="default: from extension")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument(
+        "--checkpoint", help="checkpoint file (default: <path>.checkpoint.json)"
+    )
+    parser.add_argument(
+        "--restart", action="store_true", help="ignore the checkpoint and start over"
+    )
+    parser.add_argument(
+        "--skip-rollups",
+        action="store_true",
+        help="do not rebuild metrics and rollups (e.g. between several files)",
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(parse_args()))
@@ -8,9 +8,17 @@ import logging
 from arq import run_worker
 
 from shared.queue.client import get_redis_settings
-from services.worker.app.tasks.collection import collect_by_type, collect_all
+from shared.queue.jobs import record_latency
+from services.worker.app.tasks.collection import (
+    collect_all,
+    collect_by_type,
+    collect_source,
+)
 from services.worker.app.tasks.classification import classify_batch
 from services.worker.app.tasks.metrics import update_movie_metrics
+from services.worker.app.tasks.screenings import aggregate_screenings
+from services.worker.app.tasks.partitions import maintain_partitions
+from services.worker.app.tasks.retention import prune_signals
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -22,10 +30,14 @@ class WorkerSettings:
     redis_settings = get_redis_settings()
 
     functions = [
+        collect_source,
         collect_by_type,
         collect_all,
         classify_batch,
         update_movie_metrics,
+        aggregate_screenings,
+        maintain_partitions,
+        prune_signals,
     ]
 
     max_jobs = 10
@@ -43,6 +55,11 @@ class WorkerSettings:
         """Worker shutdown handler."""
         logger.info("Worker stopped")
 
+    @staticmethod
+    async def after_job_end(ctx):
+        """Record the finished job's latency (its result is stored by now)."""
+        await record_latency(ctx["redis"], ctx["job_id"])
+
 
 if __name__ == "__main__":
     run_worker(WorkerSettings)
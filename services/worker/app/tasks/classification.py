@@ -4,16 +4,24 @@ Signal classification tasks using LLM.
 
 import json
 import logging
+from collections import Counter
 
 import google.generativeai as genai
 
 from shared.settings import get_settings
 from shared.db.database import async_session_factory
 from shared.db.repositories.signals import SignalRepository
+from shared.analytics.spikes import METRIC_NEGATIVE
+from shared.cache import publish_invalidation
+from shared.events import EVENT_CLASSIFIED, publish_signal_events, signal_event
+from shared.queue.jobs import report_progress
+from services.worker.app.tasks.spikes import detect_spikes
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+PROGRESS_EVERY = 10
+
 # Configure Gemini
 if settings.gemini_api_key:
     genai.configure(api_key=settings.gemini_api_key)
@@ -74,7 +82,11 @@ async def classify_batch(ctx, batch_size: int = 50):
         logger.info(f"Found {len(signals)} unclassified signals")
 
         classified = 0
-        for signal in signals:
+        negative_per_movie = Counter()
+        events = []
+        for done, signal in enumerate(signals):
+            if done % PROGRESS_EVERY == 0:
+                await report_progress(ctx, done, len(signals), classified=classified)
             try:
                 # Prepare text for classification
                 text = signal.title
@@ -106,7 +118,10 @@ async def classify_batch(ctx, batch_size: int = 50):
                 signal.summary = classification.get("summary")
                 signal.is_classified = True
 
+                events.append(signal_event(signal))
                 classified += 1
+                if signal.movie_id and signal.sentiment == "negative":
+                    negative_per_movie[signal.movie_id] += 1
 
             except json.JSONDecodeError as e:
                 logger.error(f"Failed to parse classification for {signal.id}: {e}")
@@ -115,5 +130,11 @@ async def classify_batch(ctx, batch_size: int = 50):
 
         await session.commit()
 
+        await detect_spikes(ctx, session, METRIC_NEGATIVE, negative_per_movie)
+
+    if classified:
+        await publish_invalidation(ctx["redis"], "signals")
+        await publish_signal_events(ctx["redis"], EVENT_CLASSIFIED, events)
+
     logger.info(f"Classified {classified} signals")
     return {"classified": classified}
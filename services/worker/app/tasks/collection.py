@@ -3,16 +3,137 @@ Signal collection tasks.
 """
 
 import logging
-from datetime import datetime
+from collections import Counter
+from datetime import date, datetime
+from typing import Sequence
+from uuid import UUID
 
 import httpx
 from bs4 import BeautifulSoup
 
 from shared.db.database import async_session_factory
+from shared.db.models.source import Source
+from shared.db.repositories.movies import MovieRepository
 from shared.db.repositories.sources import SourceRepository
 from shared.db.repositories.signals import SignalRepository
+from shared.analytics.collection import in_release_week, release_window
+from shared.analytics.spikes import METRIC_VOLUME
+from shared.cache import publish_invalidation
+from shared.events import EVENT_CREATED, publish_signal_events, signal_event
+from shared.queue.jobs import report_progress
+from shared.settings import get_settings
+from services.worker.app.tasks.spikes import detect_spikes
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+async def _release_slugs(session) -> set[str]:
+    """Slugs of movies in their release week."""
+    start, end = release_window(date.today())
+    return await MovieRepository(session).get_releasing_slugs(start, end)
+
+
+async def _movie_ids(session, sources: Sequence[Source]) -> dict[str, UUID]:
+    """Movie ids of the sources' movie slugs, loaded once per run."""
+    slugs = {source.movie_slug for source in sources if source.movie_slug}
+    return await MovieRepository(session).get_ids_by_slugs(slugs)
+
+
+async def _collect(source: Source) -> list[dict]:
+    """Fetch a source; errors propagate so the check is recorded as failed."""
+    if source.type == "news_site":
+        return await _collect_news(source.url)
+    elif source.type == "kinopoisk":
+        return await _collect_kinopoisk(source.url)
+    elif source.type == "telegram":
+        return await _collect_telegram(source.telegram_channel_id)
+    return []
+
+
+async def _check_source(
+    session,
+    source: Source,
+    releasing: set[str],
+    movie_ids: dict[str, UUID],
+    per_movie: Counter,
+    events: list,
+) -> int:
+    """
+    Collect one source, save its new signals and schedule its next check.
+
+    Signals from a movie's own source are linked to that movie.
+    """
+    source_repo = SourceRepository(session)
+    signal_repo = SignalRepository(session)
+    release_week = in_release_week(source, releasing)
+    movie_id = movie_ids.get(source.movie_slug)
+    error = None
+    created = []
+    try:
+        signals = await _collect(source)
+        # Save new signals in one statement; a failure only undoes these
+        async with session.begin_nested():
+            created = await signal_repo.create_new(
+                [
+                    {"source_id": source.id, "movie_id": movie_id, **data}
+                    for data in signals
+                ]
+            )
+    except Exception as e:
+        logger.error(f"Error collecting from {source.name}: {e}")
+        error = str(e)[:500]
+
+    for signal in created:
+        events.append(signal_event(signal))
+        if signal.movie_id:
+            per_movie[signal.movie_id] += 1
+
+    await source_repo.record_check(
+        source,
+        len(created),
+        error=error,
+        release_week=release_week,
+        boost=settings.collection_release_boost,
+    )
+    await session.commit()
+    return len(created)
+
+
+async def _publish(ctx, session, per_movie: Counter, events: list) -> None:
+    await detect_spikes(ctx, session, METRIC_VOLUME, per_movie)
+    if events:
+        await publish_invalidation(ctx["redis"], "signals")
+        await publish_signal_events(ctx["redis"], EVENT_CREATED, events)
+
+
+async def collect_source(ctx, source_id: str):
+    """
+    Collect one source; scheduled by the adaptive collection tick.
+
+    The check updates the source's change rate and next check time.
+    """
+    async with async_session_factory() as session:
+        source = await SourceRepository(session).get(UUID(str(source_id)))
+        if source is None or not source.is_active:
+            logger.info(f"Source {source_id} is gone or inactive, skipping")
+            return {"collected": 0}
+
+        per_movie = Counter()
+        events = []
+        releasing = await _release_slugs(session)
+        movie_ids = await _movie_ids(session, [source])
+        collected = await _check_source(
+            session, source, releasing, movie_ids, per_movie, events
+        )
+        await _publish(ctx, session, per_movie, events)
+
+    logger.info(f"Collected {collected} new signals from {source.name}")
+    return {
+        "collected": collected,
+        "change_rate": source.change_rate,
+        "next_check_at": source.next_check_at.isoformat(),
+    }
 
 
 async def collect_by_type(ctx, source_type: str):
@@ -20,41 +141,27 @@ async def collect_by_type(ctx, source_type: str):
     logger.info(f"Collecting signals from {source_type} sources")
 
     async with async_session_factory() as session:
-        source_repo = SourceRepository(session)
-        signal_repo = SignalRepository(session)
-
-        sources = await source_repo.get_active_by_type(source_type)
+        sources = await SourceRepository(session).get_active_by_type(source_type)
         logger.info(f"Found {len(sources)} active {source_type} sources")
 
+        releasing = await _release_slugs(session)
+        movie_ids = await _movie_ids(session, sources)
         collected = 0
-        for source in sources:
-            try:
-                if source_type == "news_site":
-                    signals = await _collect_news(source.url)
-                elif source_type == "kinopoisk":
-                    signals = await _collect_kinopoisk(source.url)
-                elif source_type == "telegram":
-                    signals = await _collect_telegram(source.telegram_channel_id)
-                else:
-                    signals = []
-
-                # Save signals
-                for signal_data in signals:
-                    external_id = signal_data.get("external_id")
-                    if not await signal_repo.exists_by_external_id(external_id):
-                        await signal_repo.create(
-                            source_id=source.id,
-                            **signal_data,
-                        )
-                        collected += 1
-
-                await source_repo.mark_checked(source)
-                await session.commit()
-
-            except Exception as e:
-                logger.error(f"Error collecting from {source.name}: {e}")
-                await source_repo.mark_checked(source, error=str(e))
-                await session.commit()
+        per_movie = Counter()
+        events = []
+        for done, source in enumerate(sources):
+            await report_progress(
+                ctx,
+                done,
+                len(sources),
+                source_type=source_type,
+                collected=collected,
+            )
+            collected += await _check_source(
+                session, source, releasing, movie_ids, per_movie, events
+            )
+
+        await _publish(ctx, session, per_movie, events)
 
     logger.info(f"Collected {collected} new signals")
     return {"collected": collected}
@@ -81,43 +188,39 @@ async def _collect_news(url: str) -> list[dict]:
     """Collect signals from a news site."""
     signals = []
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, timeout=30)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "lxml")
+    async with httpx.AsyncClient() as client:
+        response = await client.get(url, timeout=30)
+        response.raise_for_status()
 
-            # Generic news article extraction (customize per site)
-            articles = soup.find_all("article") or soup.find_all(
-                "div", class_=lambda x: x and "news" in x.lower()
-            )
+        soup = BeautifulSoup(response.text, "lxml")
 
-            for article in articles[:20]:  # Limit to 20 articles
-                title_el = article.find(["h1", "h2", "h3", "a"])
-                link_el = article.find("a", href=True)
+        # Generic news article extraction (customize per site)
+        articles = soup.find_all("article") or soup.find_all(
+            "div", class_=lambda x: x and "news" in x.lower()
+        )
 
-                if title_el and link_el:
-                    title = title_el.get_text(strip=True)
-                    link = link_el["href"]
+        for article in articles[:20]:  # Limit to 20 articles
+            title_el = article.find(["h1", "h2", "h3", "a"])
+            link_el = article.find("a", href=True)
 
-                    if not link.startswith("http"):
-                        # Relative URL
-                        from urllib.parse import urljoin
+            if title_el and link_el:
+                title = title_el.get_text(strip=True)
+                link = link_el["href"]
 
-                        link = urljoin(url, link)
+                if not link.startswith("http"):
+                    # Relative URL
+                    from urllib.parse import urljoin
 
-                    signals.append(
-                        {
-                            "external_id": f"news:{link}",
-                            "title": title[:500],
-                            "source_url": link,
-                            "published_at": datetime.utcnow(),
-                        }
-                    )
+                    link = urljoin(url, link)
 
-    except Exception as e:
-        logger.error(f"Error fetching news from {url}: {e}")
+                signals.append(
+                    {
+                        "external_id": f"news:{link}",
+                        "title": title[:500],
+                        "source_url": link,
+                        "published_at": datetime.utcnow(),
+                    }
+                )
 
     return signals
 
@@ -126,35 +229,31 @@ async def _collect_kinopoisk(url: str) -> list[dict]:
     """Collect signals from Kinopoisk."""
     signals = []
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url, timeout=30, headers={"User-Agent": "Mozilla/5.0"}
-            )
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "lxml")
+    async with httpx.AsyncClient() as client:
+        response = await client.get(
+            url, timeout=30, headers={"User-Agent": "Mozilla/5.0"}
+        )
+        response.raise_for_status()
 
-            # Find movie links
-            movie_links = soup.find_all("a", href=lambda x: x and "/film/" in str(x))
+        soup = BeautifulSoup(response.text, "lxml")
 
-            for link in movie_links[:20]:
-                title = link.get_text(strip=True)
-                href = link.get("href", "")
+        # Find movie links
+        movie_links = soup.find_all("a", href=lambda x: x and "/film/" in str(x))
 
-                if title and href:
-                    full_url = f"https://www.kinopoisk.ru{href}"
-                    signals.append(
-                        {
-                            "external_id": f"kp:{href}",
-                            "title": f"Кинопоиск: {title[:450]}",
-                            "source_url": full_url,
-                            "published_at": datetime.utcnow(),
-                        }
-                    )
+        for link in movie_links[:20]:
+            title = link.get_text(strip=True)
+            href = link.get("href", "")
 
-    except Exception as e:
-        logger.error(f"Error fetching from Kinopoisk {url}: {e}")
+            if title and href:
+                full_url = f"https://www.kinopoisk.ru{href}"
+                signals.append(
+                    {
+                        "external_id": f"kp:{href}",
+                        "title": f"Кинопоиск: {title[:450]}",
+                        "source_url": full_url,
+                        "published_at": datetime.utcnow(),
+                    }
+                )
 
     return signals
 
@@ -165,31 +264,30 @@ async def _collect_telegram(channel_id: str) -> list[dict]:
 
     # For now, use Telegram web preview
     # In production, use Telethon or Pyrogram
-    try:
-        url = f"https://t.me/s/{channel_id}"
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, timeout=30)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "lxml")
-
-            messages = soup.find_all("div", class_="tgme_widget_message_text")
-
-            for i, msg in enumerate(messages[:20]):
-                text = msg.get_text(strip=True)[:500]
-                if text:
-                    signals.append(
-                        {
-                            "external_id": f"tg:{channel_id}:{i}:{datetime.utcnow().timestamp()}",
-                            "title": text[:200],
-                            "content": text,
-                            "source_url": url,
-                            "published_at": datetime.utcnow(),
-                        }
-                    )
-
-    except Exception as e:
-        logger.error(f"Error fetching from Telegram {channel_id}: {e}")
+    url = f"https://t.me/s/{channel_id}"
+
+    async with httpx.AsyncClient() as client:
+        response = await client.get(url, timeout=30)
+        response.raise_for_status()
+
+        soup = BeautifulSoup(response.text, "lxml")
+
+        # Each message carries a stable "channel/message_id" in data-post
+        messages = soup.find_all("div", attrs={"data-post": True})
+
+        for msg in messages[-20:]:  # The preview lists oldest first
+            post = msg["data-post"]
+            text_el = msg.find("div", class_="tgme_widget_message_text")
+            text = text_el.get_text(strip=True)[:500] if text_el else ""
+            if text:
+                signals.append(
+                    {
+                        "external_id": f"tg:{post}",
+                        "title": text[:200],
+                        "content": text,
+                        "source_url": f"https://t.me/{post}",
+                        "published_at": datetime.utcnow(),
+                    }
+                )
 
     return signals
@@ -4,60 +4,95 @@ Metrics update tasks.
 
 import logging
 from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from shared.cache import publish_invalidation
 from shared.db.database import async_session_factory
 from shared.db.models.movie import Movie
-from shared.db.models.signal import Signal
+from shared.db.models.signal import Signal, SignalDailyRollup
+from shared.db.repositories.movies import MovieRepository
 
 logger = logging.getLogger(__name__)
 
 
+async def movie_metrics(session: AsyncSession) -> list[dict]:
+    """
+    Signal counters of every active movie, as rows for bulk_update.
+
+    Counts cover the full history: signals still stored plus those that
+    retention rolled up into signal_daily_rollups, so pruning a movie's
+    signals does not lower its counters.
+    """
+    result = await session.execute(select(Movie.id).where(Movie.is_active == True))
+    movie_ids = result.scalars().all()
+
+    # Signal counts and sentiment for every movie in one pass each:
+    # stored signals, plus those pruned or archived into daily rollups
+    result = await session.execute(
+        select(
+            Signal.movie_id,
+            func.count(),
+            func.count().filter(Signal.signal_type == "review"),
+            func.coalesce(func.sum(Signal.sentiment_score), 0),
+            func.count(Signal.sentiment_score),
+        )
+        .join(Movie, Movie.id == Signal.movie_id)
+        .where(Movie.is_active == True)
+        .group_by(Signal.movie_id)
+    )
+    live = {row[0]: row[1:] for row in result.all()}
+
+    result = await session.execute(
+        select(
+            SignalDailyRollup.movie_id,
+            func.sum(SignalDailyRollup.signals_count),
+            func.coalesce(
+                func.sum(SignalDailyRollup.signals_count).filter(
+                    SignalDailyRollup.signal_type == "review"
+                ),
+                0,
+            ),
+            func.sum(SignalDailyRollup.sentiment_sum),
+            func.sum(SignalDailyRollup.sentiment_count),
+        )
+        .join(Movie, Movie.id == SignalDailyRollup.movie_id)
+        .where(Movie.is_active == True)
+        .group_by(SignalDailyRollup.movie_id)
+    )
+    rolled_up = {row[0]: row[1:] for row in result.all()}
+
+    rows = []
+    for movie_id in movie_ids:
+        signals_count, reviews_count, sentiment_sum, sentiment_count = (
+            sum(values)
+            for values in zip(
+                live.get(movie_id, (0, 0, 0, 0)),
+                rolled_up.get(movie_id, (0, 0, 0, 0)),
+            )
+        )
+        rows.append(
+            {
+                "id": movie_id,
+                "signals_count": int(signals_count),
+                "reviews_count": int(reviews_count),
+                "sentiment_score": (
+                    float(sentiment_sum) / sentiment_count if sentiment_count else None
+                ),
+            }
+        )
+    return rows
+
+
 async def update_movie_metrics(ctx):
     """Update aggregated metrics for all movies."""
     logger.info("Updating movie metrics")
 
     async with async_session_factory() as session:
-        # Get all active movies
-        result = await session.execute(select(Movie).where(Movie.is_active == True))
-        movies = result.scalars().all()
-
-        updated = 0
-        for movie in movies:
-            try:
-                # Count signals
-                signals_count_result = await session.execute(
-                    select(func.count())
-                    .select_from(Signal)
-                    .where(Signal.movie_id == movie.id)
-                )
-                movie.signals_count = signals_count_result.scalar() or 0
-
-                # Count reviews
-                reviews_count_result = await session.execute(
-                    select(func.count())
-                    .select_from(Signal)
-                    .where(
-                        Signal.movie_id == movie.id,
-                        Signal.signal_type == "review",
-                    )
-                )
-                movie.reviews_count = reviews_count_result.scalar() or 0
-
-                # Calculate average sentiment score
-                sentiment_result = await session.execute(
-                    select(func.avg(Signal.sentiment_score)).where(
-                        Signal.movie_id == movie.id,
-                        Signal.sentiment_score != None,
-                    )
-                )
-                movie.sentiment_score = sentiment_result.scalar()
-
-                updated += 1
-
-            except Exception as e:
-                logger.error(f"Error updating metrics for movie {movie.id}: {e}")
-
+        rows = await movie_metrics(session)
+        updated = len(await MovieRepository(session).bulk_update(rows))
         await session.commit()
 
+    await publish_invalidation(ctx["redis"], "movies")
+
     logger.info(f"Updated metrics for {updated} movies")
     return {"updated": updated}
@@ -0,0 +1,47 @@
+"""
+Partition maintenance tasks.
+"""
+
+import logging
+from datetime import date
+
+from shared.db.database import async_session_factory
+from shared.db.partitions import (
+    PARTITIONED_TABLES,
+    detach_partitions,
+    ensure_partitions,
+    months_before,
+)
+from shared.db.retention import rollup_partition
+from shared.settings import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+async def maintain_partitions(ctx):
+    """
+    Create upcoming monthly partitions and detach expired ones.
+
+    Detached signals months are added to the daily rollups, like signals
+    removed by the retention policies.
+    """
+    logger.info("Maintaining partitions")
+
+    created, detached = [], []
+    async with async_session_factory() as session:
+        for table in PARTITIONED_TABLES:
+            created += await ensure_partitions(
+                session, table, settings.partition_months_ahead
+            )
+            if table.retention_months:
+                before = months_before(date.today(), table.retention_months)
+                names = await detach_partitions(session, table, before)
+                if table.name == "signals":
+                    for name in names:
+                        await rollup_partition(session, name)
+                detached += names
+            await session.commit()
+
+    logger.info(f"Created partitions {created}, detached {detached}")
+    return {"created": created, "detached": detached}
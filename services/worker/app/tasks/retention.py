@@ -0,0 +1,165 @@
+"""
+Signal retention tasks.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import exc
+
+from shared.cache import publish_invalidation
+from shared.config.retention import RETENTION_POLICIES
+from shared.db.database import async_session_factory
+from shared.db.partitions import months_before
+from shared.db.retention import (
+    is_lock_timeout,
+    prune_batch,
+    wal_bytes_since,
+    wal_position,
+)
+from shared.db.storage import table_storage
+from shared.queue.jobs import report_progress
+from shared.settings import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Give up on a policy after this many lock timeouts in a row
+MAX_LOCK_TIMEOUTS = 5
+
+PRUNED_TABLES = ("signals", "signal_payloads")
+
+
+async def _storage(session) -> dict:
+    sizes = {}
+    for table in PRUNED_TABLES:
+        stats = await table_storage(session, table)
+        sizes[table] = {
+            "table_bytes": stats["table_bytes"],
+            "index_bytes": stats["index_bytes"],
+        }
+    await session.commit()
+    return sizes
+
+
+async def prune_signals(ctx):
+    """
+    Apply the retention policies in small batches.
+
+    Batches pause between each other and stop once the run exceeds its
+    WAL or time budget; the next run picks up where this one stopped.
+    Space freed by deletes is reused after vacuum, so table sizes only
+    shrink when partitions are detached; `freed_bytes` is the size of the
+    rows removed.
+    """
+    logger.info("Pruning signals")
+    started = time.monotonic()
+    wal_budget = settings.retention_max_wal_mb * 1024 * 1024
+    pause = settings.retention_batch_pause_ms / 1000
+
+    # Policies reaching past partition retention are covered by detaching
+    partition_cutoff = None
+    if settings.signals_retention_months:
+        partition_cutoff = months_before(
+            date.today(), settings.signals_retention_months
+        )
+
+    report = {"policies": {}, "stopped": None}
+    async with async_session_factory() as session:
+        report["storage_before"] = await _storage(session)
+        wal_start = await wal_position(session)
+        await session.commit()
+
+        for policy in RETENTION_POLICIES:
+            if report["stopped"]:
+                break
+            cutoff = datetime.utcnow() - timedelta(days=policy.max_age_days)
+            summary = {
+                "action": policy.action,
+                "cutoff": cutoff.isoformat(),
+                "rows": 0,
+                "payloads": 0,
+                "freed_bytes": 0,
+                "batches": 0,
+                "lock_timeouts": 0,
+            }
+            report["policies"][policy.name] = summary
+            if partition_cutoff and cutoff.date() <= partition_cutoff:
+                summary["skipped"] = "covered by partition retention"
+                continue
+
+            policy_started = time.monotonic()
+            timeouts_in_row = 0
+            while True:
+                try:
+                    batch = await prune_batch(
+                        session,
+                        policy,
+                        cutoff,
+                        settings.retention_batch_size,
+                        settings.retention_lock_timeout_ms,
+                    )
+                except exc.DBAPIError as e:
+                    if not is_lock_timeout(e):
+                        raise
+                    await session.rollback()
+                    summary["lock_timeouts"] += 1
+                    timeouts_in_row += 1
+                    if timeouts_in_row >= MAX_LOCK_TIMEOUTS:
+                        logger.warning(f"Retention {policy.name}: rows stay locked")
+                        break
+                    await asyncio.sleep(pause)
+                    continue
+
+                timeouts_in_row = 0
+                summary["batches"] += 1
+                summary["rows"] += batch["rows"]
+                summary["payloads"] += batch["payloads"]
+                summary["freed_bytes"] += batch["row_bytes"] + batch["payload_bytes"]
+                await report_progress(
+                    ctx, summary["rows"], policy=policy.name, batches=summary["batches"]
+                )
+                if batch["rows"] < settings.retention_batch_size:
+                    break
+
+                wal_bytes = await wal_bytes_since(session, wal_start)
+                await session.commit()
+                if wal_bytes > wal_budget:
+                    report["stopped"] = "wal budget"
+                elif (
+                    time.monotonic() - started > settings.retention_max_runtime_seconds
+                ):
+                    report["stopped"] = "time budget"
+                if report["stopped"]:
+                    break
+                await asyncio.sleep(pause)
+
+            elapsed = time.monotonic() - policy_started
+            summary["seconds"] = round(elapsed, 1)
+            summary["rows_per_second"] = round(summary["rows"] / max(elapsed, 1e-6))
+            logger.info(
+                f"Retention {policy.name}: {summary['rows']} signals "
+                f"({policy.action}), {summary['freed_bytes']} bytes in "
+                f"{summary['batches']} batches, {elapsed:.1f}s"
+            )
+
+        report["wal_bytes"] = await wal_bytes_since(session, wal_start)
+        report["storage_after"] = await _storage(session)
+
+    pruned = sum(summary["rows"] for summary in report["policies"].values())
+    if pruned:
+        await publish_invalidation(ctx["redis"], "signals")
+
+    report["rows"] = pruned
+    report["freed_bytes"] = sum(
+        summary["freed_bytes"] for summary in report["policies"].values()
+    )
+    report["seconds"] = round(time.monotonic() - started, 1)
+    logger.info(
+        f"Pruned {pruned} signals ({report['freed_bytes']} bytes, "
+        f"{report['wal_bytes']} WAL bytes) in {report['seconds']}s"
+        + (f", stopped on {report['stopped']}" if report["stopped"] else "")
+    )
+    return report
@@ -0,0 +1,272 @@
+"""
+Screening snapshot aggregation tasks.
+
+Snapshots are streamed from Postgres in fixed-size chunks, turned into
+columnar frames and reduced with vectorized groupbys. Only mergeable
+partial aggregates (sums, mins, maxes) are kept between chunks, so memory
+is bounded by the number of groups rather than the number of snapshots.
+"""
+
+import logging
+import time
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from shared.cache import publish_invalidation
+from shared.db.database import async_session_factory
+from shared.db.models.movie import Movie
+from shared.db.models.screening import ScreeningRollup, ScreeningSnapshot
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 50_000
+WRITE_BATCH_SIZE = 1_000
+
+SNAPSHOT_COLUMNS = [
+    ScreeningSnapshot.movie_id,
+    ScreeningSnapshot.city,
+    ScreeningSnapshot.cinema_chain,
+    ScreeningSnapshot.screenings_count,
+    ScreeningSnapshot.total_seats,
+    ScreeningSnapshot.sold_seats,
+    ScreeningSnapshot.avg_occupancy_percent,
+    ScreeningSnapshot.morning_screenings,
+    ScreeningSnapshot.afternoon_screenings,
+    ScreeningSnapshot.evening_screenings,
+    ScreeningSnapshot.format_2d,
+    ScreeningSnapshot.format_3d,
+    ScreeningSnapshot.format_imax,
+    ScreeningSnapshot.format_dolby,
+    ScreeningSnapshot.min_price,
+    ScreeningSnapshot.max_price,
+    ScreeningSnapshot.avg_price,
+]
+COLUMN_NAMES = [column.key for column in SNAPSHOT_COLUMNS]
+
+COUNT_COLUMNS = [
+    "screenings_count",
+    "morning_screenings",
+    "afternoon_screenings",
+    "evening_screenings",
+    "format_2d",
+    "format_3d",
+    "format_imax",
+    "format_dolby",
+]
+# Partial sums used to derive weighted occupancy and price averages
+SUM_COLUMNS = COUNT_COLUMNS + [
+    "seats",
+    "sold",
+    "occupancy_seats",
+    "price_total",
+    "price_weight",
+]
+
+LEVELS = {
+    "movie": ["movie_id"],
+    "city": ["movie_id", "city"],
+    "chain": ["movie_id", "cinema_chain"],
+}
+
+
+def _prepare(rows: list) -> pd.DataFrame:
+    """Build a columnar frame with derived per-row weights."""
+    df = pd.DataFrame.from_records(rows, columns=COLUMN_NAMES)
+    numeric = COLUMN_NAMES[3:]
+    df[numeric] = df[numeric].apply(pd.to_numeric, errors="coerce")
+    df[COUNT_COLUMNS] = df[COUNT_COLUMNS].fillna(0)
+    df["cinema_chain"] = df["cinema_chain"].fillna("unknown")
+
+    # Sold seats fall back to reported occupancy when not given directly.
+    # Only rows where one of them is known contribute to the denominator.
+    sold = df["sold_seats"].fillna(
+        df["avg_occupancy_percent"] / 100 * df["total_seats"]
+    )
+    df["seats"] = df["total_seats"].fillna(0)
+    df["occupancy_seats"] = np.where(sold.notna(), df["seats"], 0)
+    df["sold"] = sold.fillna(0)
+
+    # Average price weighted by screenings
+    priced = df["avg_price"].notna()
+    df["price_weight"] = np.where(priced, df["screenings_count"], 0)
+    df["price_total"] = (df["avg_price"] * df["screenings_count"]).where(priced, 0)
+    return df
+
+
+def _reduce(df: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+    """Group to mergeable partial aggregates."""
+    return df.groupby(keys, as_index=False, sort=False).agg(
+        **{column: (column, "sum") for column in SUM_COLUMNS},
+        min_price=("min_price", "min"),
+        max_price=("max_price", "max"),
+    )
+
+
+def _finalize(df: pd.DataFrame) -> pd.DataFrame:
+    """Turn partial aggregates into rollup metrics."""
+    df = df.copy()
+    df["occupancy_percent"] = (
+        df["sold"] / df["occupancy_seats"].where(df["occupancy_seats"] > 0) * 100
+    ).round(2)
+    df["avg_price"] = (
+        df["price_total"] / df["price_weight"].where(df["price_weight"] > 0)
+    ).round(2)
+    df[COUNT_COLUMNS + ["seats", "sold"]] = (
+        df[COUNT_COLUMNS + ["seats", "sold"]].round().astype("int64")
+    )
+    df[["min_price", "max_price"]] = (
+        df[["min_price", "max_price"]].round().astype("Int64")
+    )
+    return df
+
+
+def _records(df: pd.DataFrame) -> list[dict]:
+    """Frame to dicts with NaN mapped to None."""
+    return df.astype(object).where(df.notna(), None).to_dict("records")
+
+
+async def aggregate_screenings(ctx, days: int = 7):
+    """
+    Roll up screening snapshots for the trailing window.
+
+    Writes per-movie, per-city and per-chain rows to screening_rollups and
+    updates Movie.total_screenings / Movie.avg_occupancy. Multiple snapshot
+    runs on the same day are collapsed to the latest one.
+    """
+    logger.info(f"Aggregating screening snapshots (days={days})")
+    started = time.monotonic()
+    period_end = date.today()
+    period_start = period_end - timedelta(days=days - 1)
+
+    query = (
+        select(*SNAPSHOT_COLUMNS)
+        .where(ScreeningSnapshot.snapshot_date >= period_start)
+        .distinct(
+            ScreeningSnapshot.movie_id,
+            ScreeningSnapshot.city,
+            ScreeningSnapshot.cinema_chain,
+            ScreeningSnapshot.snapshot_date,
+        )
+        .order_by(
+            ScreeningSnapshot.movie_id,
+            ScreeningSnapshot.city,
+            ScreeningSnapshot.cinema_chain,
+            ScreeningSnapshot.snapshot_date,
+            ScreeningSnapshot.snapshot_time.desc(),
+        )
+        .execution_options(yield_per=CHUNK_SIZE)
+    )
+
+    partials: dict[str, pd.DataFrame] = {}
+    rows_read = 0
+
+    async with async_session_factory() as session:
+        result = await session.stream(query)
+        async for chunk in result.partitions(CHUNK_SIZE):
+            df = _prepare(chunk)
+            rows_read += len(df)
+            for level, keys in LEVELS.items():
+                part = _reduce(df, keys)
+                if level in partials:
+                    part = _reduce(pd.concat([partials[level], part]), keys)
+                partials[level] = part
+
+        if not rows_read:
+            logger.info("No screening snapshots in window")
+            return {"rows": 0, "movies": 0, "rollups": 0}
+
+        rollups = []
+        for level, keys in LEVELS.items():
+            frame = _finalize(partials[level])
+            frame["dimension"] = level
+            frame["dimension_value"] = (
+                frame[keys[1]].astype(str) if len(keys) > 1 else "all"
+            )
+            rollups.append(frame)
+
+        # Movie columns
+        movies = rollups[0]
+        movie_records = _records(
+            movies[["movie_id", "screenings_count", "occupancy_percent"]].rename(
+                columns={
+                    "movie_id": "id",
+                    "screenings_count": "total_screenings",
+                    "occupancy_percent": "avg_occupancy",
+                }
+            )
+        )
+        for i in range(0, len(movie_records), WRITE_BATCH_SIZE):
+            await session.execute(
+                update(Movie), movie_records[i : i + WRITE_BATCH_SIZE]
+            )
+        await session.execute(
+            update(Movie)
+            .where(
+                Movie.total_screenings != 0,
+                Movie.id.not_in([record["id"] for record in movie_records]),
+            )
+            .values(total_screenings=0, avg_occupancy=None)
+        )
+
+        # Rollup table
+        frame = pd.concat(rollups, ignore_index=True).rename(
+            columns={"seats": "total_seats", "sold": "sold_seats"}
+        )
+        frame["window_days"] = days
+        frame["period_start"] = period_start
+        frame["period_end"] = period_end
+        columns = [
+            "movie_id",
+            "dimension",
+            "dimension_value",
+            "window_days",
+            "period_start",
+            "period_end",
+            *COUNT_COLUMNS,
+            "total_seats",
+            "sold_seats",
+            "occupancy_percent",
+            "min_price",
+            "max_price",
+            "avg_price",
+        ]
+        rollup_records = _records(frame[columns])
+
+        stmt = insert(ScreeningRollup)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_screening_rollups_key",
+            set_={
+                **{column: stmt.excluded[column] for column in columns[4:]},
+                "updated_at": func.now(),
+            },
+        )
+        for i in range(0, len(rollup_records), WRITE_BATCH_SIZE):
+            await session.execute(stmt, rollup_records[i : i + WRITE_BATCH_SIZE])
+
+        # Drop rollups for groups that disappeared from the window. now() is
+        # the transaction start, so everything refreshed above is kept.
+        await session.execute(
+            delete(ScreeningRollup).where(
+                ScreeningRollup.window_days == days,
+                ScreeningRollup.updated_at < func.now(),
+            )
+        )
+        await session.commit()
+
+    await publish_invalidation(ctx["redis"], "movies", "screenings")
+
+    elapsed = time.monotonic() - started
+    logger.info(
+        f"Aggregated {rows_read} snapshots into {len(rollup_records)} rollups "
+        f"for {len(movie_records)} movies in {elapsed:.1f}s "
+        f"({rows_read / max(elapsed, 1e-6):.0f} rows/s)"
+    )
+    return {
+        "rows": rows_read,
+        "movies": len(movie_records),
+        "rollups": len(rollup_records),
+    }
@@ -0,0 +1,83 @@
+"""
+Spike detection hooks for collection and classification tasks.
+"""
+
+import logging
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.analytics.spikes import METRIC_NEGATIVE, Spike, SpikeDetector
+from shared.db.models.movie import Movie
+from shared.db.models.signal import Signal
+from shared.db.repositories.signals import SignalRepository
+from shared.events import EVENT_CREATED, publish_signal_events, signal_event
+
+logger = logging.getLogger(__name__)
+
+SPIKE_TITLES = {
+    METRIC_NEGATIVE: "Всплеск негатива",
+}
+
+
+async def detect_spikes(
+    ctx,
+    session: AsyncSession,
+    metric: str,
+    counts: dict[UUID, int],
+) -> int:
+    """Feed per-movie counts to the detector and store spikes as signals."""
+    if not counts:
+        return 0
+
+    detector = SpikeDetector(ctx["redis"])
+    spikes = await detector.observe_many(metric, counts)
+
+    events = []
+    for spike in spikes:
+        signal = await _create_spike_signal(session, spike)
+        if signal:
+            events.append(signal_event(signal))
+
+    if spikes:
+        await session.commit()
+        await publish_signal_events(ctx["redis"], EVENT_CREATED, events)
+        logger.info(f"Detected {len(spikes)} {metric} spikes")
+    return len(spikes)
+
+
+async def _create_spike_signal(session: AsyncSession, spike: Spike) -> Optional[Signal]:
+    """Create a synthetic critical signal for a spike."""
+    signal_repo = SignalRepository(session)
+    external_id = f"spike:{spike.metric}:{spike.movie_id}:{spike.bucket}"
+    if await signal_repo.exists_by_external_id(external_id):
+        return None
+
+    movie = await session.get(Movie, spike.movie_id)
+    movie_title = movie.title if movie else str(spike.movie_id)
+    title = SPIKE_TITLES.get(spike.metric, "Всплеск упоминаний")
+
+    return await signal_repo.create(
+        external_id=external_id,
+        movie_id=spike.movie_id,
+        title=f"{title}: {movie_title}"[:500],
+        summary=(
+            f"{spike.count} сигналов за час при норме {spike.baseline:.1f} "
+            f"(z = {spike.zscore:.1f})"
+        ),
+        source_url=f"/signals?movie_slug={movie.slug}" if movie else "/signals",
+        signal_type="spike",
+        importance="critical",
+        sentiment="negative" if spike.metric == METRIC_NEGATIVE else None,
+        is_classified=True,
+        published_at=datetime.utcnow(),
+        raw_data={
+            "metric": spike.metric,
+            "bucket": spike.bucket,
+            "count": spike.count,
+            "baseline": spike.baseline,
+            "zscore": spike.zscore,
+        },
+    )
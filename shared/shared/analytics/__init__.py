@@ -0,0 +1,8 @@
+"""
+Analytics module - derived metrics computed from signals and screenings.
+"""
+
+from shared.analytics.spikes import Spike, SpikeDetector
+from shared.analytics.trends import Trend, TrendEngine
+
+__all__ = ["Spike", "SpikeDetector", "Trend", "TrendEngine"]
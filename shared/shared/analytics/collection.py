@@ -0,0 +1,109 @@
+"""
+Adaptive collection intervals from observed source change rates.
+
+Each source keeps an EWMA of new items per hour, folded in after every
+check with a weight that grows with the time since the previous check,
+so a check after a long gap counts for more than one a few minutes
+later. The next check is scheduled for when about `TARGET_NEW_ITEMS` new
+items are expected, clamped around the source's configured
+`check_frequency_hours`: busy sources are checked more often, quiet ones
+back off. During release weeks busy sources tighten further.
+
+The scheduler fetches due sources in order of expected new items, up to
+a global fetch budget per tick.
+"""
+
+import math
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, Sequence
+
+from shared.db.models.source import Source
+
+# Source types with a collector in the worker
+COLLECTED_TYPES = ("news_site", "kinopoisk", "telegram")
+
+TARGET_NEW_ITEMS = 3.0  # New items a check should find on average
+RATE_TAU_HOURS = 24.0  # EWMA time constant
+BUSY_RATE = 0.5  # New items per hour; busier sources get the release boost
+MIN_INTERVAL_HOURS = 0.25
+MAX_INTERVAL_HOURS = 24.0
+MAX_SPEEDUP = 4.0  # Interval bounds relative to check_frequency_hours
+MAX_BACKOFF = 4.0
+# Release window around a movie's release date
+RELEASE_LEAD = timedelta(days=3)
+RELEASE_TAIL = timedelta(days=7)
+
+
+def now_utc() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def prior_rate(source: Source) -> float:
+    """Change rate assumed before a source has been observed."""
+    return TARGET_NEW_ITEMS / max(source.check_frequency_hours or 1, 1)
+
+
+def current_rate(source: Source) -> float:
+    if source.change_rate is None:
+        return prior_rate(source)
+    return source.change_rate
+
+
+def update_rate(source: Source, new_items: int, now: datetime) -> float:
+    """Fold a check's new item count into the source's change rate."""
+    base_hours = max(source.check_frequency_hours or 1, 1)
+    if source.last_checked_at is None:
+        elapsed = float(base_hours)
+    else:
+        elapsed = (now - source.last_checked_at).total_seconds() / 3600
+        elapsed = max(elapsed, 1 / 60)
+    weight = 1 - math.exp(-elapsed / RATE_TAU_HOURS)
+    rate = current_rate(source)
+    return rate + weight * (new_items / elapsed - rate)
+
+
+def next_interval(source: Source, release_week: bool = False, boost: float = 1.0):
+    """Time until a source's next check, from its current change rate."""
+    base_hours = max(source.check_frequency_hours or 1, 1)
+    rate = current_rate(source)
+    hours = TARGET_NEW_ITEMS / rate if rate > 0 else MAX_INTERVAL_HOURS
+    hours = min(max(hours, base_hours / MAX_SPEEDUP), base_hours * MAX_BACKOFF)
+    if release_week and rate >= BUSY_RATE:
+        hours /= max(boost, 1.0)
+    hours = min(max(hours, MIN_INTERVAL_HOURS), MAX_INTERVAL_HOURS)
+    return timedelta(hours=hours)
+
+
+def expected_new_items(source: Source, now: datetime) -> float:
+    """New items a check would find now, going by the change rate."""
+    if source.last_checked_at is None:
+        return math.inf
+    hours = (now - source.last_checked_at).total_seconds() / 3600
+    return current_rate(source) * max(hours, 0)
+
+
+def release_window(today: date) -> tuple[date, date]:
+    """Release dates of movies currently in their release week."""
+    return today - RELEASE_TAIL, today + RELEASE_LEAD
+
+
+def in_release_week(source: Source, releasing: Optional[set[str]]) -> bool:
+    """
+    Whether a source covers a movie in its release week.
+
+    `releasing` are the slugs of movies in their release window; general
+    sources (no movie) count when any movie is.
+    """
+    if not releasing:
+        return False
+    return source.movie_slug is None or source.movie_slug in releasing
+
+
+def plan(sources: Sequence[Source], budget: int, now: datetime) -> list[Source]:
+    """Due sources to fetch this tick, most expected new items first."""
+    ranked = sorted(
+        sources,
+        key=lambda source: expected_new_items(source, now),
+        reverse=True,
+    )
+    return list(ranked[: max(budget, 0)])
@@ -0,0 +1,188 @@
+"""
+Streaming spike detection on per-movie signal volume and sentiment.
+
+Each (metric, movie) pair keeps a constant-size state in a Redis hash:
+an EWMA mean and variance over closed hourly buckets plus the count of
+the bucket currently filling. Observations are folded in as signals are
+ingested or classified, so detection never needs a rescan of `signals`.
+
+A bucket is flagged when its count is both large in absolute terms and
+far above the EWMA baseline. The variance is floored at the mean (the
+Poisson variance) so sparse movies with a flat history do not alert on
+a handful of items.
+"""
+
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.exceptions import WatchError
+
+logger = logging.getLogger(__name__)
+
+BUCKET_SECONDS = 3600
+ALPHA = 0.1  # EWMA smoothing per bucket
+Z_THRESHOLD = 3.0
+MIN_COUNT = 5  # Never alert on buckets smaller than this
+WARMUP_BUCKETS = 24  # Closed buckets required before alerting
+MAX_GAP_BUCKETS = 24 * 14  # Empty buckets folded in after a long silence
+STATE_TTL_SECONDS = 60 * 60 * 24 * 30
+
+METRIC_VOLUME = "volume"
+METRIC_NEGATIVE = "negative"
+
+
+@dataclass
+class SpikeState:
+    """EWMA state for one (metric, movie) pair."""
+
+    bucket: int
+    count: int = 0
+    mean: float = 0.0
+    var: float = 0.0
+    seen: int = 0
+    alerted: bool = False
+
+    @classmethod
+    def from_redis(cls, raw: dict) -> Optional["SpikeState"]:
+        if not raw:
+            return None
+        raw = {
+            (k.decode() if isinstance(k, bytes) else k): v for k, v in raw.items()
+        }
+        return cls(
+            bucket=int(raw["bucket"]),
+            count=int(raw["count"]),
+            mean=float(raw["mean"]),
+            var=float(raw["var"]),
+            seen=int(raw["seen"]),
+            alerted=raw["alerted"] in (b"1", "1"),
+        )
+
+    def to_redis(self) -> dict:
+        return {
+            "bucket": self.bucket,
+            "count": self.count,
+            "mean": self.mean,
+            "var": self.var,
+            "seen": self.seen,
+            "alerted": int(self.alerted),
+        }
+
+    def _fold(self, value: float) -> None:
+        diff = value - self.mean
+        self.mean += ALPHA * diff
+        self.var = (1 - ALPHA) * (self.var + ALPHA * diff * diff)
+        self.seen += 1
+
+    def advance(self, bucket: int) -> None:
+        """Close the current bucket and any empty ones up to `bucket`."""
+        if bucket <= self.bucket:
+            return
+        self._fold(self.count)
+        for _ in range(min(bucket - self.bucket - 1, MAX_GAP_BUCKETS)):
+            self._fold(0)
+        self.bucket = bucket
+        self.count = 0
+        self.alerted = False
+
+    def zscore(self) -> float:
+        """How far the filling bucket is above the baseline."""
+        std = math.sqrt(max(self.var, self.mean, 1.0))
+        return (self.count - self.mean) / std
+
+    def is_spike(self) -> bool:
+        return (
+            self.seen >= WARMUP_BUCKETS
+            and self.count >= MIN_COUNT
+            and self.zscore() >= Z_THRESHOLD
+        )
+
+
+@dataclass(frozen=True)
+class Spike:
+    """A detected spike for one movie and metric."""
+
+    movie_id: UUID
+    metric: str
+    bucket: int
+    count: int
+    baseline: float
+    zscore: float
+
+
+class SpikeDetector:
+    """Folds per-movie observations into Redis-held EWMA state."""
+
+    def __init__(self, redis: Redis, prefix: str = "spikes"):
+        self.redis = redis
+        self.prefix = prefix
+
+    def _key(self, metric: str, movie_id: UUID) -> str:
+        return f"{self.prefix}:{metric}:{movie_id}"
+
+    async def observe(
+        self,
+        metric: str,
+        movie_id: UUID,
+        count: int = 1,
+        at: Optional[float] = None,
+    ) -> Optional[Spike]:
+        """
+        Add `count` events for a movie and return a Spike the first time
+        the current bucket crosses the threshold.
+        """
+        bucket = int((at or time.time()) // BUCKET_SECONDS)
+        key = self._key(metric, movie_id)
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(key)
+                    state = SpikeState.from_redis(await pipe.hgetall(key))
+                    if state is None:
+                        state = SpikeState(bucket=bucket)
+                    state.advance(bucket)
+                    state.count += count
+
+                    spike = None
+                    if not state.alerted and state.is_spike():
+                        state.alerted = True
+                        spike = Spike(
+                            movie_id=movie_id,
+                            metric=metric,
+                            bucket=state.bucket,
+                            count=state.count,
+                            baseline=round(state.mean, 2),
+                            zscore=round(state.zscore(), 2),
+                        )
+
+                    pipe.multi()
+                    pipe.hset(key, mapping=state.to_redis())
+                    pipe.expire(key, STATE_TTL_SECONDS)
+                    await pipe.execute()
+                    return spike
+                except WatchError:
+                    continue
+
+    async def observe_many(
+        self,
+        metric: str,
+        counts: dict[UUID, int],
+        at: Optional[float] = None,
+    ) -> list[Spike]:
+        """Observe a batch of per-movie counts."""
+        spikes = []
+        for movie_id, count in counts.items():
+            try:
+                spike = await self.observe(metric, movie_id, count, at=at)
+            except Exception as e:
+                logger.error(f"Spike detection failed for movie {movie_id}: {e}")
+                continue
+            if spike:
+                spikes.append(spike)
+        return spikes
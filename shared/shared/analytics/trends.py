@@ -0,0 +1,179 @@
+"""
+Trend computation - current vs previous window deltas.
+
+Each metric family (signals, screenings) is answered by a single query that
+scans both windows at once and splits them with aggregate FILTER clauses.
+Results are cached per (family, window, movie) so repeated dashboard polls
+inside the same window cost one query per TTL.
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import and_, distinct, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.db.models.screening import ScreeningSnapshot
+from shared.db.models.signal import Signal
+
+# Window ends are aligned to this resolution so that requests arriving
+# within the same minute share a cache entry.
+WINDOW_RESOLUTION_SECONDS = 60
+DEFAULT_TTL_SECONDS = 60
+MAX_CACHE_ENTRIES = 1024
+
+_EPOCH = datetime(1970, 1, 1)
+_cache: dict[tuple, tuple[float, object]] = {}
+
+
+@dataclass(frozen=True)
+class Trend:
+    """A metric value in the current window and the one before it."""
+
+    current: float
+    previous: float
+
+    @property
+    def delta(self) -> float:
+        """Absolute change vs previous window."""
+        return self.current - self.previous
+
+    @property
+    def percent_change(self) -> float:
+        """Percent change vs previous window."""
+        if not self.previous:
+            return 100.0 if self.current else 0.0
+        return round((self.current - self.previous) / abs(self.previous) * 100, 1)
+
+
+def clear_cache() -> None:
+    """Drop all cached trend results."""
+    _cache.clear()
+
+
+def _window_bounds(window: timedelta) -> tuple[datetime, datetime, datetime]:
+    """Return (previous_start, current_start, end) aligned to the resolution."""
+    elapsed = int((datetime.utcnow() - _EPOCH).total_seconds())
+    end = _EPOCH + timedelta(
+        seconds=elapsed // WINDOW_RESOLUTION_SECONDS * WINDOW_RESOLUTION_SECONDS
+    )
+    current_start = end - window
+    return current_start - window, current_start, end
+
+
+class TrendEngine:
+    """Computes window-over-window trends with a per-window result cache."""
+
+    def __init__(self, session: AsyncSession, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        self.session = session
+        self.ttl_seconds = ttl_seconds
+
+    def _cached(self, key: tuple):
+        entry = _cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def _store(self, key: tuple, value) -> None:
+        if len(_cache) >= MAX_CACHE_ENTRIES:
+            now = time.monotonic()
+            for stale in [k for k, (expires, _) in _cache.items() if expires <= now]:
+                del _cache[stale]
+            if len(_cache) >= MAX_CACHE_ENTRIES:
+                _cache.pop(next(iter(_cache)))
+        _cache[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    async def signal_trends(
+        self,
+        window: timedelta,
+        *,
+        movie_id: Optional[UUID] = None,
+    ) -> dict[str, Trend]:
+        """
+        Signal volume and sentiment trends.
+
+        Returns trends keyed by "signals", "critical", "negative" and
+        "sentiment" (average sentiment_score).
+        """
+        key = ("signals", window.total_seconds(), movie_id)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+
+        previous_start, current_start, end = _window_bounds(window)
+        is_current = Signal.published_at >= current_start
+        is_previous = Signal.published_at < current_start
+
+        query = select(
+            func.count().filter(is_current),
+            func.count().filter(is_previous),
+            func.count().filter(and_(is_current, Signal.importance == "critical")),
+            func.count().filter(and_(is_previous, Signal.importance == "critical")),
+            func.count().filter(and_(is_current, Signal.sentiment == "negative")),
+            func.count().filter(and_(is_previous, Signal.sentiment == "negative")),
+            func.avg(Signal.sentiment_score).filter(is_current),
+            func.avg(Signal.sentiment_score).filter(is_previous),
+        ).where(
+            Signal.published_at >= previous_start,
+            Signal.published_at < end,
+            Signal.is_published == True,
+        )
+        if movie_id:
+            query = query.where(Signal.movie_id == movie_id)
+
+        row = (await self.session.execute(query)).one()
+        trends = {
+            "signals": Trend(row[0] or 0, row[1] or 0),
+            "critical": Trend(row[2] or 0, row[3] or 0),
+            "negative": Trend(row[4] or 0, row[5] or 0),
+            "sentiment": Trend(float(row[6] or 0), float(row[7] or 0)),
+        }
+        self._store(key, trends)
+        return trends
+
+    async def screening_trend(
+        self,
+        window: timedelta,
+        *,
+        movie_id: Optional[UUID] = None,
+    ) -> Trend:
+        """
+        Screenings trend as average screenings per snapshot day.
+
+        Averaging per distinct snapshot date keeps the comparison fair when
+        one window has more snapshot runs than the other.
+        """
+        key = ("screenings", window.total_seconds(), movie_id)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+
+        previous_start, current_start, end = _window_bounds(window)
+        current_from = current_start.date()
+        is_current = ScreeningSnapshot.snapshot_date >= current_from
+        is_previous = ScreeningSnapshot.snapshot_date < current_from
+
+        query = select(
+            func.sum(ScreeningSnapshot.screenings_count).filter(is_current),
+            func.count(distinct(ScreeningSnapshot.snapshot_date)).filter(is_current),
+            func.sum(ScreeningSnapshot.screenings_count).filter(is_previous),
+            func.count(distinct(ScreeningSnapshot.snapshot_date)).filter(is_previous),
+        ).where(
+            ScreeningSnapshot.snapshot_date >= previous_start.date(),
+            ScreeningSnapshot.snapshot_date <= end.date(),
+        )
+        if movie_id:
+            query = query.where(ScreeningSnapshot.movie_id == movie_id)
+
+        current_total, current_days, previous_total, previous_days = (
+            await self.session.execute(query)
+        ).one()
+        trend = Trend(
+            (current_total or 0) / current_days if current_days else 0.0,
+            (previous_total or 0) / previous_days if previous_days else 0.0,
+        )
+        self._store(key, trend)
+        return trend
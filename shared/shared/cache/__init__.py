@@ -0,0 +1,17 @@
+"""
+Cache invalidation shared by the API and worker.
+"""
+
+from shared.cache.invalidation import (
+    INVALIDATION_CHANNEL,
+    NAMESPACES,
+    get_versions,
+    publish_invalidation,
+)
+
+__all__ = [
+    "INVALIDATION_CHANNEL",
+    "NAMESPACES",
+    "get_versions",
+    "publish_invalidation",
+]
@@ -0,0 +1,39 @@
+"""
+Versioned cache invalidation over Redis.
+
+Each namespace has a version counter in Redis. Writers bump the counter
+and publish the new versions; readers fold the versions into their cache
+keys, so entries computed before a write are never served again from any
+tier, and the published message lets processes drop them from memory.
+"""
+
+import json
+import logging
+
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+VERSION_KEY = "cache:version:{namespace}"
+
+# What the API caches, by the data it is computed from
+NAMESPACES = ("signals", "movies", "screenings")
+
+
+async def get_versions(redis: Redis, namespaces=NAMESPACES) -> dict[str, int]:
+    """Get current versions for namespaces."""
+    values = await redis.mget([VERSION_KEY.format(namespace=ns) for ns in namespaces])
+    return {ns: int(value or 0) for ns, value in zip(namespaces, values)}
+
+
+async def publish_invalidation(redis: Redis, *namespaces: str) -> None:
+    """Bump namespace versions and notify subscribers. Never raises."""
+    try:
+        async with redis.pipeline(transaction=True) as pipe:
+            for ns in namespaces:
+                pipe.incr(VERSION_KEY.format(namespace=ns))
+            versions = dict(zip(namespaces, await pipe.execute()))
+        await redis.publish(INVALIDATION_CHANNEL, json.dumps(versions))
+    except Exception as e:
+        logger.warning(f"Failed to publish cache invalidation {namespaces}: {e}")
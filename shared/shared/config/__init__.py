@@ -3,5 +3,12 @@ Configuration module.
 """
 
 from shared.config.sources import SOURCES, MOVIES_SEED, DISTRIBUTORS_SEED
+from shared.config.retention import RETENTION_POLICIES, RetentionPolicy
 
-__all__ = ["SOURCES", "MOVIES_SEED", "DISTRIBUTORS_SEED"]
+__all__ = [
+    "SOURCES",
+    "MOVIES_SEED",
+    "DISTRIBUTORS_SEED",
+    "RETENTION_POLICIES",
+    "RetentionPolicy",
+]
@@ -0,0 +1,63 @@
+"""
+Signal retention policies.
+
+Each policy prunes signals from one source type whose importance is in
+`importance` (None matches unclassified signals) once they are older than
+`max_age_days`. Pruned signals are rolled up into signal_daily_rollups
+first, then deleted or moved to the archive schema. Critical/notable and
+featured signals are never pruned. Policies are applied in order.
+
+Partition retention (SIGNALS_RETENTION_MONTHS) detaches whole months
+regardless of these policies, so a policy only matters while it is
+shorter than that.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+ACTION_DELETE = "delete"
+ACTION_ARCHIVE = "archive"
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Which signals to prune, after how long, and how."""
+
+    name: str
+    source_type: str
+    importance: tuple[Optional[str], ...]
+    max_age_days: int
+    unlinked_only: bool = False  # only signals not matched to a movie
+    action: str = ACTION_DELETE
+
+
+RETENTION_POLICIES = [
+    # Channel chatter never matched to a movie
+    RetentionPolicy(
+        name="telegram_unlinked",
+        source_type="telegram",
+        importance=("minor", None),
+        max_age_days=30,
+        unlinked_only=True,
+    ),
+    RetentionPolicy(
+        name="telegram_minor",
+        source_type="telegram",
+        importance=("minor",),
+        max_age_days=90,
+    ),
+    RetentionPolicy(
+        name="news_minor",
+        source_type="news_site",
+        importance=("minor",),
+        max_age_days=180,
+        action=ACTION_ARCHIVE,
+    ),
+    RetentionPolicy(
+        name="kinopoisk_minor",
+        source_type="kinopoisk",
+        importance=("minor",),
+        max_age_days=365,
+        action=ACTION_ARCHIVE,
+    ),
+]
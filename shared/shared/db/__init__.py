@@ -2,6 +2,24 @@
 Database module.
 """
 
-from shared.db.database import get_session, engine, async_session_factory
+from shared.db.database import (
+    get_session,
+    get_read_session,
+    engine,
+    read_engine,
+    async_session_factory,
+    read_session_factory,
+    run_in_session,
+    pool_stats,
+)
 
-__all__ = ["get_session", "engine", "async_session_factory"]
+__all__ = [
+    "get_session",
+    "get_read_session",
+    "engine",
+    "read_engine",
+    "async_session_factory",
+    "read_session_factory",
+    "run_in_session",
+    "pool_stats",
+]
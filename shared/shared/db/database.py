@@ -1,25 +1,157 @@
 """
 Database connection and session management.
+
+Each service gets an engine profile for its workload, chosen by the
+`service_role` setting: the API runs many short reads, the worker fewer,
+longer writes. Individual settings override the profile.
+
+When `database_read_url` is set, read sessions go to that replica;
+otherwise they share the primary engine.
 """
 
-from typing import AsyncGenerator
+import time
+from dataclasses import dataclass
+from typing import AsyncGenerator, Awaitable, Callable, Optional, TypeVar
 
+from sqlalchemy import exc
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from shared.settings import get_settings
 
 settings = get_settings()
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class EngineProfile:
+    """Pool sizing and timeouts for one kind of service."""
+
+    pool_size: int
+    max_overflow: int
+    statement_timeout_ms: int
+
+
+ENGINE_PROFILES = {
+    # Many concurrent requests, each a few short queries
+    "api": EngineProfile(pool_size=10, max_overflow=20, statement_timeout_ms=15_000),
+    # Up to max_jobs concurrent tasks, some with long aggregations
+    "worker": EngineProfile(pool_size=10, max_overflow=5, statement_timeout_ms=300_000),
+    # Occasional bookkeeping queries
+    "scheduler": EngineProfile(
+        pool_size=2, max_overflow=2, statement_timeout_ms=30_000
+    ),
+}
+
+
+class PoolStats:
+    """Checkout counters and wait times for a pool."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        if timed_out:
+            self.timeouts += 1
+        else:
+            self.checkouts += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+
+    def as_dict(self) -> dict:
+        attempts = self.checkouts + self.timeouts
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_avg_ms": (
+                round(self.wait_total / attempts * 1000, 2) if attempts else 0.0
+            ),
+            "wait_max_ms": round(self.wait_max * 1000, 2),
+        }
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that times every checkout.
+
+    The wait includes opening a new connection when the pool grows.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.stats.record(time.perf_counter() - start)
+        return connection
+
+
+def get_engine_profile(role: Optional[str] = None) -> EngineProfile:
+    """Profile for a service role with setting overrides applied."""
+    profile = ENGINE_PROFILES.get(role or settings.service_role, ENGINE_PROFILES["api"])
+    return EngineProfile(
+        pool_size=settings.db_pool_size or profile.pool_size,
+        max_overflow=(
+            settings.db_max_overflow
+            if settings.db_max_overflow is not None
+            else profile.max_overflow
+        ),
+        statement_timeout_ms=(
+            settings.db_statement_timeout_ms
+            if settings.db_statement_timeout_ms is not None
+            else profile.statement_timeout_ms
+        ),
+    )
+
+
+def create_engine(url: str, profile: EngineProfile) -> AsyncEngine:
+    """Create an engine with an instrumented pool for a profile."""
+    return create_async_engine(
+        url,
+        echo=settings.sql_echo,
+        poolclass=InstrumentedPool,
+        pool_pre_ping=True,
+        pool_size=profile.pool_size,
+        max_overflow=profile.max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        connect_args={
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+            "server_settings": {
+                "statement_timeout": str(profile.statement_timeout_ms),
+                "application_name": f"cinema-radar-{settings.service_role}",
+            },
+        },
+    )
+
+
+engine_profile = get_engine_profile()
+
+engine = create_engine(settings.database_url, engine_profile)
+
+read_engine = (
+    create_engine(settings.database_read_url, engine_profile)
+    if settings.database_read_url
+    else engine
 )
 
 async_session_factory = async_sessionmaker(
@@ -28,6 +160,12 @@ async_session_factory = async_sessionmaker(
     expire_on_commit=False,
 )
 
+read_session_factory = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Get database session."""
@@ -36,3 +174,46 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             yield session
         finally:
             await session.close()
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get a session for reads, on the replica when one is configured."""
+    async with read_session_factory() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+async def run_in_session(
+    fn: Callable[[AsyncSession], Awaitable[T]], read: bool = False
+) -> T:
+    """
+    Run `fn` on its own session (a read session with `read=True`).
+
+    A session is bound to one connection and cannot run queries
+    concurrently; use this with asyncio.gather to run independent queries
+    in parallel on separate pooled connections.
+    """
+    factory = read_session_factory if read else async_session_factory
+    async with factory() as session:
+        return await fn(session)
+
+
+def pool_stats() -> dict:
+    """Checkout stats and current occupancy of each engine's pool."""
+    engines = {"primary": engine}
+    if read_engine is not engine:
+        engines["replica"] = read_engine
+
+    stats = {}
+    for name, db_engine in engines.items():
+        pool = db_engine.pool
+        stats[name] = {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "checked_in": pool.checkedin(),
+            **pool.stats.as_dict(),
+        }
+    return stats
@@ -5,9 +5,10 @@ Database models for Cinema Radar.
 from shared.db.models.base import Base, UUIDMixin, TimestampMixin
 from shared.db.models.movie import Movie
 from shared.db.models.source import Source
-from shared.db.models.signal import Signal
-from shared.db.models.screening import ScreeningSnapshot
+from shared.db.models.signal import Signal, SignalDailyRollup, SignalExternalId
+from shared.db.models.screening import ScreeningSnapshot, ScreeningRollup
 from shared.db.models.distributor import Distributor
+from shared.db.models.payload import ScreeningPayload, SignalPayload
 
 __all__ = [
     "Base",
@@ -16,6 +17,11 @@ __all__ = [
     "Movie",
     "Source",
     "Signal",
+    "SignalDailyRollup",
+    "SignalExternalId",
     "ScreeningSnapshot",
+    "ScreeningRollup",
     "Distributor",
+    "SignalPayload",
+    "ScreeningPayload",
 ]
@@ -6,7 +6,16 @@ from datetime import date, datetime
 from typing import Optional, TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import Boolean, Date, Integer, String, Text, Float, ForeignKey
+from sqlalchemy import (
+    Boolean,
+    Date,
+    Index,
+    Integer,
+    String,
+    Text,
+    Float,
+    ForeignKey,
+)
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -35,7 +44,7 @@ class Movie(Base, UUIDMixin, TimestampMixin):
     poster_url: Mapped[Optional[str]] = mapped_column(String(500))
 
     # Release info
-    release_date: Mapped[Optional[date]] = mapped_column(Date, index=True)
+    release_date: Mapped[Optional[date]] = mapped_column(Date)
     year: Mapped[Optional[int]] = mapped_column(Integer)
     runtime_minutes: Mapped[Optional[int]] = mapped_column(Integer)
     age_rating: Mapped[Optional[str]] = mapped_column(
@@ -80,3 +89,35 @@ class Movie(Base, UUIDMixin, TimestampMixin):
 
     def __repr__(self) -> str:
         return f"<Movie {self.title} ({self.year})>"
+
+
+Index("idx_movies_release_date", Movie.release_date)
+Index("idx_movies_distributor", Movie.distributor_id)
+
+# Trigram search (see migration 004)
+Index(
+    "idx_movies_title_trgm",
+    Movie.title,
+    postgresql_using="gin",
+    postgresql_ops={"title": "gin_trgm_ops"},
+)
+Index(
+    "idx_movies_original_title_trgm",
+    Movie.original_title,
+    postgresql_using="gin",
+    postgresql_ops={"original_title": "gin_trgm_ops"},
+)
+
+# Query-shaped indexes (see migration 006)
+Index(
+    "idx_movies_active_release",
+    Movie.release_date.desc().nullslast(),
+    Movie.id.desc(),
+    postgresql_where=Movie.is_active,
+)
+Index(
+    "idx_movies_featured_signals",
+    Movie.signals_count.desc(),
+    Movie.id,
+    postgresql_where=Movie.is_active & Movie.is_featured,
+)
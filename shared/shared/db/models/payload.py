@@ -0,0 +1,90 @@
+"""
+Cold payload models - bulky, rarely read data split off hot rows.
+
+Raw source payloads and embeddings are only needed by detail views, so
+they live in side tables keyed by the owning row's id and partitioned the
+same way, stored as compressed JSON. Feed and stats queries never touch
+them, which keeps more hot rows per page and in cache.
+"""
+
+import json
+import zlib
+from datetime import date, datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import Date, DateTime, LargeBinary, func
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column
+
+from shared.db.models.base import Base
+
+# First byte of a stored payload: its encoding
+PAYLOAD_ZLIB = b"z"
+PAYLOAD_JSON = b"j"  # moved over by the migration; TOAST compresses these
+
+COMPRESSION_LEVEL = 6
+
+
+def pack_payload(data: dict) -> bytes:
+    """Encode a payload as zlib-compressed JSON."""
+    raw = json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+    return PAYLOAD_ZLIB + zlib.compress(raw.encode(), COMPRESSION_LEVEL)
+
+
+def unpack_payload(blob: Optional[bytes]) -> dict:
+    """Decode a stored payload; missing payloads are empty."""
+    if not blob:
+        return {}
+    encoding, body = blob[:1], blob[1:]
+    if encoding == PAYLOAD_ZLIB:
+        body = zlib.decompress(body)
+    elif encoding != PAYLOAD_JSON:
+        raise ValueError(f"Unknown payload encoding {encoding!r}")
+    return json.loads(body)
+
+
+class PayloadMixin:
+    """Shared columns: the owning row's id and the encoded payload."""
+
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    @declared_attr.directive
+    def __mapper_args__(cls) -> dict:
+        return {"primary_key": [cls.__table__.c.id]}
+
+    @property
+    def data(self) -> dict:
+        return unpack_payload(self.payload)
+
+
+class SignalPayload(PayloadMixin, Base):
+    """Cold fields of a signal: raw_data and embedding."""
+
+    __tablename__ = "signal_payloads"
+    __table_args__ = {"postgresql_partition_by": "RANGE (published_at)"}
+
+    published_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True  # partition key
+    )
+
+    def __repr__(self) -> str:
+        return f"<SignalPayload {self.id}>"
+
+
+class ScreeningPayload(PayloadMixin, Base):
+    """Cold fields of a screening snapshot: raw_data."""
+
+    __tablename__ = "screening_payloads"
+    __table_args__ = {"postgresql_partition_by": "RANGE (snapshot_date)"}
+
+    snapshot_date: Mapped[date] = mapped_column(Date, primary_key=True)  # partition key
+
+    def __repr__(self) -> str:
+        return f"<ScreeningPayload {self.id}>"
@@ -6,9 +6,18 @@ from datetime import date, datetime
 from typing import Optional, TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import Date, DateTime, Float, Integer, String, ForeignKey
-from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    Date,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    ForeignKey,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column, relationship
 
 from shared.db.models.base import Base, UUIDMixin, TimestampMixin
 
@@ -21,26 +30,32 @@ class ScreeningSnapshot(Base, UUIDMixin, TimestampMixin):
     Snapshot of cinema screenings for a movie.
 
     Captured periodically to track screening availability and occupancy.
+    Partitioned by month of snapshot_date; see Signal for the keys. The
+    raw source data is kept in ScreeningPayload.
     """
 
     __tablename__ = "screening_snapshots"
+    __table_args__ = {"postgresql_partition_by": "RANGE (snapshot_date)"}
+
+    @declared_attr.directive
+    def __mapper_args__(cls) -> dict:
+        return {"primary_key": [cls.__table__.c.id]}
 
     # Movie reference
     movie_id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey("movies.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     # Location
-    city: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    city: Mapped[str] = mapped_column(String(100), nullable=False)
     cinema_chain: Mapped[Optional[str]] = mapped_column(
         String(100)
     )  # Karo, Cinema Park, Formula Kino, etc.
 
-    # Snapshot date
-    snapshot_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    # Snapshot date (partition key)
+    snapshot_date: Mapped[date] = mapped_column(Date, primary_key=True)
     snapshot_time: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False
     )
@@ -71,11 +86,81 @@ class ScreeningSnapshot(Base, UUIDMixin, TimestampMixin):
     max_price: Mapped[Optional[int]] = mapped_column(Integer)
     avg_price: Mapped[Optional[float]] = mapped_column(Float)
 
-    # Raw data
-    raw_data: Mapped[dict] = mapped_column(JSONB, default={})
-
     # Relationships
     movie: Mapped["Movie"] = relationship("Movie", back_populates="screenings")
 
     def __repr__(self) -> str:
         return f"<ScreeningSnapshot {self.movie_id} {self.city} {self.snapshot_date}>"
+
+
+Index(
+    "idx_screening_movie_date",
+    ScreeningSnapshot.movie_id,
+    ScreeningSnapshot.snapshot_date.desc(),
+    ScreeningSnapshot.snapshot_time.desc(),
+    postgresql_include=["screenings_count"],
+)
+Index("idx_screening_date", ScreeningSnapshot.snapshot_date)
+
+
+class ScreeningRollup(Base, UUIDMixin, TimestampMixin):
+    """
+    Aggregated screening metrics for a movie over a trailing window.
+
+    One row per (movie, dimension, dimension_value, window_days), where
+    dimension is "movie", "city" or "chain". Rebuilt by the worker from
+    screening_snapshots.
+    """
+
+    __tablename__ = "screening_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "movie_id",
+            "dimension",
+            "dimension_value",
+            "window_days",
+            name="uq_screening_rollups_key",
+        ),
+    )
+
+    movie_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("movies.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    dimension: Mapped[str] = mapped_column(String(20), nullable=False)
+    dimension_value: Mapped[str] = mapped_column(String(100), nullable=False)
+    window_days: Mapped[int] = mapped_column(Integer, nullable=False)
+    period_start: Mapped[date] = mapped_column(Date, nullable=False)
+    period_end: Mapped[date] = mapped_column(Date, nullable=False)
+
+    # Volume
+    screenings_count: Mapped[int] = mapped_column(Integer, default=0)
+    total_seats: Mapped[int] = mapped_column(Integer, default=0)
+    sold_seats: Mapped[int] = mapped_column(Integer, default=0)
+    occupancy_percent: Mapped[Optional[float]] = mapped_column(Float)
+
+    # Time distribution
+    morning_screenings: Mapped[int] = mapped_column(Integer, default=0)
+    afternoon_screenings: Mapped[int] = mapped_column(Integer, default=0)
+    evening_screenings: Mapped[int] = mapped_column(Integer, default=0)
+
+    # Format distribution
+    format_2d: Mapped[int] = mapped_column(Integer, default=0)
+    format_3d: Mapped[int] = mapped_column(Integer, default=0)
+    format_imax: Mapped[int] = mapped_column(Integer, default=0)
+    format_dolby: Mapped[int] = mapped_column(Integer, default=0)
+
+    # Price stats
+    min_price: Mapped[Optional[int]] = mapped_column(Integer)
+    max_price: Mapped[Optional[int]] = mapped_column(Integer)
+    avg_price: Mapped[Optional[float]] = mapped_column(Float)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ScreeningRollup {self.movie_id} {self.dimension}="
+            f"{self.dimension_value} {self.window_days}d>"
+        )
+
+
+Index("idx_screening_rollups_movie", ScreeningRollup.movie_id)
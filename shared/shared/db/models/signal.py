@@ -2,13 +2,28 @@
 Signal model - collected and classified market signals.
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional, TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import Boolean, String, Text, DateTime, Float, Integer, ForeignKey
-from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    Computed,
+    Date,
+    String,
+    Text,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    ForeignKey,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID as PG_UUID
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column, relationship
 
 from shared.db.models.base import Base, UUIDMixin, TimestampMixin
 
@@ -16,28 +31,45 @@ if TYPE_CHECKING:
     from shared.db.models.source import Source
     from shared.db.models.movie import Movie
 
+# Text search configuration for signal content
+SEARCH_CONFIG = "russian"
+
 
 class Signal(Base, UUIDMixin, TimestampMixin):
     """
     Market signal - review, news, rating change, etc.
 
     Classified by LLM with signal_type, importance, sentiment.
+
+    The table is partitioned by month of published_at, so its primary key
+    is (id, published_at); the mapper still identifies rows by id.
     """
 
     __tablename__ = "signals"
+    __table_args__ = (
+        UniqueConstraint("external_id", "published_at", name="uq_signals_external_id"),
+        {"postgresql_partition_by": "RANGE (published_at)"},
+    )
+
+    @declared_attr.directive
+    def __mapper_args__(cls) -> dict:
+        return {
+            "primary_key": [cls.__table__.c.id],
+            # Kept off the mapper so inserts/updates never return the tsvector
+            "exclude_properties": ["search_vector"],
+        }
 
     # Source reference
     source_id: Mapped[Optional[UUID]] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey("sources.id", ondelete="SET NULL"),
     )
-    external_id: Mapped[str] = mapped_column(String(500), unique=True, nullable=False)
+    external_id: Mapped[str] = mapped_column(String(500), nullable=False)
 
     # Movie reference
     movie_id: Mapped[Optional[UUID]] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey("movies.id", ondelete="SET NULL"),
-        index=True,
     )
 
     # Content
@@ -50,10 +82,10 @@ class Signal(Base, UUIDMixin, TimestampMixin):
 
     # Classification (LLM)
     signal_type: Mapped[Optional[str]] = mapped_column(
-        String(50), index=True
+        String(50)
     )  # review, rating_change, screening, news, promotion, box_office
     importance: Mapped[Optional[str]] = mapped_column(
-        String(20), index=True
+        String(20)
     )  # critical, notable, minor
     sentiment: Mapped[Optional[str]] = mapped_column(
         String(20)
@@ -72,11 +104,11 @@ class Signal(Base, UUIDMixin, TimestampMixin):
     comments_count: Mapped[Optional[int]] = mapped_column(Integer)
     shares_count: Mapped[Optional[int]] = mapped_column(Integer)
 
-    # Metadata
-    raw_data: Mapped[dict] = mapped_column(JSONB, default={})
-    published_at: Mapped[Optional[datetime]] = mapped_column(
+    # Metadata (raw_data and embedding are cold: see SignalPayload)
+    published_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        index=True,
+        primary_key=True,  # partition key
+        default=datetime.utcnow,
     )
     is_classified: Mapped[bool] = mapped_column(Boolean, default=False)
     is_published: Mapped[bool] = mapped_column(Boolean, default=True)
@@ -85,8 +117,17 @@ class Signal(Base, UUIDMixin, TimestampMixin):
     # Keywords extracted by LLM
     keywords: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
 
-    # Embedding for semantic search (JSONB since no pgvector)
-    embedding: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
+    # Full-text search vector, maintained by Postgres. Not mapped, but
+    # usable in queries as a plain column.
+    search_vector = Column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(summary, '')), 'B') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(content, '')), 'C')",
+            persisted=True,
+        ),
+    )
 
     # Relationships
     source: Mapped[Optional["Source"]] = relationship(
@@ -96,3 +137,116 @@ class Signal(Base, UUIDMixin, TimestampMixin):
 
     def __repr__(self) -> str:
         return f"<Signal {self.external_id[:30]}...>"
+
+
+# Query-shaped indexes (see migration 006)
+Index(
+    "idx_signals_feed",
+    Signal.published_at.desc(),
+    Signal.id.desc(),
+    postgresql_include=[
+        "movie_id",
+        "signal_type",
+        "importance",
+        "sentiment",
+        "sentiment_score",
+    ],
+    postgresql_where=Signal.is_published,
+)
+Index(
+    "idx_signals_critical",
+    Signal.published_at.desc(),
+    Signal.id.desc(),
+    postgresql_where=Signal.is_published & (Signal.importance == "critical"),
+)
+Index(
+    "idx_signals_movie_published",
+    Signal.movie_id,
+    Signal.published_at.desc(),
+    Signal.id.desc(),
+)
+Index(
+    "idx_signals_unclassified",
+    Signal.created_at,
+    postgresql_where=~Signal.is_classified,
+)
+Index("idx_signals_source_published", Signal.source_id, Signal.published_at)
+
+# Time ranges over all signals, published or not (exports, backfill)
+Index("idx_signals_published_at", Signal.published_at)
+
+
+class SignalExternalId(Base):
+    """
+    Claim on a signal external_id, unique across all partitions.
+
+    Inserted together with the signal; kept when the signal is pruned or
+    its partition detached.
+    """
+
+    __tablename__ = "signal_external_ids"
+
+    external_id: Mapped[str] = mapped_column(String(500), primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<SignalExternalId {self.external_id[:30]}>"
+
+
+class SignalDailyRollup(Base, UUIDMixin, TimestampMixin):
+    """
+    Daily signal counts that outlive pruned signals.
+
+    One row per (day, movie, source_type, signal_type, importance,
+    sentiment); any of them but day may be NULL. Counts are added as
+    signals are pruned or their partition is detached, so a day's totals
+    are these plus the signals still stored.
+    """
+
+    __tablename__ = "signal_daily_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "day",
+            "movie_id",
+            "source_type",
+            "signal_type",
+            "importance",
+            "sentiment",
+            name="uq_signal_daily_rollups_key",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    movie_id: Mapped[Optional[UUID]] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("movies.id", ondelete="CASCADE"),
+    )
+    source_type: Mapped[Optional[str]] = mapped_column(String(50))
+    signal_type: Mapped[Optional[str]] = mapped_column(String(50))
+    importance: Mapped[Optional[str]] = mapped_column(String(20))
+    sentiment: Mapped[Optional[str]] = mapped_column(String(20))
+
+    signals_count: Mapped[int] = mapped_column(Integer, default=0)
+    # Average sentiment is sentiment_sum / sentiment_count
+    sentiment_sum: Mapped[float] = mapped_column(Float, default=0)
+    sentiment_count: Mapped[int] = mapped_column(Integer, default=0)
+
+    views_count: Mapped[int] = mapped_column(BigInteger, default=0)
+    likes_count: Mapped[int] = mapped_column(BigInteger, default=0)
+    comments_count: Mapped[int] = mapped_column(BigInteger, default=0)
+    shares_count: Mapped[int] = mapped_column(BigInteger, default=0)
+
+    def __repr__(self) -> str:
+        return f"<SignalDailyRollup {self.day} {self.movie_id} {self.signal_type}>"
+
+
+Index(
+    "idx_signal_daily_rollups_movie_day",
+    SignalDailyRollup.movie_id,
+    SignalDailyRollup.day.desc(),
+)
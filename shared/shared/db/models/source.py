@@ -5,7 +5,7 @@ Source model - data sources for signal collection.
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import Boolean, Integer, String, DateTime
+from sqlalchemy import Boolean, Float, Index, Integer, String, DateTime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from shared.db.models.base import Base, UUIDMixin, TimestampMixin
@@ -38,6 +38,12 @@ class Source(Base, UUIDMixin, TimestampMixin):
     last_checked_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     last_error: Mapped[Optional[str]] = mapped_column(String(500))
 
+    # Adaptive scheduling (shared/analytics/collection.py); the frequency
+    # above is the baseline the interval adapts around
+    change_rate: Mapped[Optional[float]] = mapped_column(Float)  # new items/hour
+    last_new_items: Mapped[Optional[int]] = mapped_column(Integer)
+    next_check_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+
     # For Telegram sources
     telegram_channel_id: Mapped[Optional[str]] = mapped_column(String(100))
 
@@ -46,3 +52,14 @@ class Source(Base, UUIDMixin, TimestampMixin):
 
     def __repr__(self) -> str:
         return f"<Source {self.name} ({self.type})>"
+
+
+# Active sources of a type (see migration 006)
+Index("idx_sources_active_type", Source.type, postgresql_where=Source.is_active)
+
+# Due active sources (see migration 009)
+Index(
+    "idx_sources_due",
+    Source.next_check_at.asc().nullsfirst(),
+    postgresql_where=Source.is_active,
+)
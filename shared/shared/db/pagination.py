@@ -0,0 +1,61 @@
+"""
+Keyset pagination helpers.
+
+Cursors are opaque URL-safe strings encoding the sort key of the last row
+of a page. Seeking past that key costs the same on every page, unlike
+OFFSET which has to walk all skipped rows.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Optional, Sequence
+from uuid import UUID
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor cannot be decoded."""
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _decode_value(value: Any, type_: type) -> Any:
+    if value is None:
+        return None
+    if type_ is datetime:
+        return datetime.fromisoformat(value)
+    if type_ is date:
+        return date.fromisoformat(value)
+    return type_(value)
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode a sort key into an opaque cursor."""
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> list:
+    """Decode a cursor produced by `encode_cursor` into typed values."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("wrong cursor shape")
+        return [_decode_value(v, t) for v, t in zip(values, types)]
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor}") from e
+
+
+def next_cursor(rows: Sequence, limit: int, *keys: str) -> Optional[str]:
+    """Cursor for the page after `rows`, if there may be one."""
+    if len(rows) < limit or not rows:
+        return None
+    last = rows[-1]
+    return encode_cursor(*(getattr(last, key) for key in keys))
@@ -0,0 +1,84 @@
+"""
+Monthly partition maintenance for time-partitioned tables.
+
+The partitioning itself lives in the SQL migrations; these helpers call
+its functions to create upcoming months and detach expired ones.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.settings import get_settings
+
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class PartitionedTable:
+    """A table partitioned by month of `key_column`."""
+
+    name: str
+    key_column: str
+    retention_months: int  # 0 keeps every partition attached
+
+
+PARTITIONED_TABLES = (
+    PartitionedTable("signals", "published_at", settings.signals_retention_months),
+    PartitionedTable(
+        "signal_payloads", "published_at", settings.signals_retention_months
+    ),
+    PartitionedTable(
+        "screening_snapshots", "snapshot_date", settings.screenings_retention_months
+    ),
+    PartitionedTable(
+        "screening_payloads", "snapshot_date", settings.screenings_retention_months
+    ),
+)
+
+
+def months_before(day: date, months: int) -> date:
+    """First day of the month `months` before `day`'s month."""
+    index = day.year * 12 + day.month - 1 - months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+async def ensure_partitions(
+    session: AsyncSession, table: PartitionedTable, months_ahead: int
+) -> list[str]:
+    """Create partitions through `months_ahead` months from now."""
+    result = await session.execute(
+        text("SELECT ensure_monthly_partitions(:parent, :key_column, :months)"),
+        {"parent": table.name, "key_column": table.key_column, "months": months_ahead},
+    )
+    return list(result.scalars())
+
+
+async def detach_partitions(
+    session: AsyncSession, table: PartitionedTable, before: date
+) -> list[str]:
+    """Detach partitions that end by `before` into the archive schema."""
+    result = await session.execute(
+        text("SELECT detach_monthly_partitions(:parent, :before)"),
+        {"parent": table.name, "before": before},
+    )
+    return list(result.scalars())
+
+
+async def list_partitions(session: AsyncSession, table: PartitionedTable) -> list[dict]:
+    """Attached partitions with their bounds and approximate row counts."""
+    result = await session.execute(
+        text("""
+            SELECT child.relname AS name,
+                   pg_get_expr(child.relpartbound, child.oid) AS bounds,
+                   child.reltuples::bigint AS estimated_rows
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = CAST(:parent AS regclass)
+            ORDER BY child.relname
+            """),
+        {"parent": table.name},
+    )
+    return [dict(row._mapping) for row in result]
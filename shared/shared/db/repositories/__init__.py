@@ -4,12 +4,14 @@ Database repositories.
 
 from shared.db.repositories.base import BaseRepository
 from shared.db.repositories.movies import MovieRepository
+from shared.db.repositories.screenings import ScreeningRepository
 from shared.db.repositories.signals import SignalRepository
 from shared.db.repositories.sources import SourceRepository
 
 __all__ = [
     "BaseRepository",
     "MovieRepository",
+    "ScreeningRepository",
     "SignalRepository",
     "SourceRepository",
 ]
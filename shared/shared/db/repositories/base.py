@@ -2,16 +2,47 @@
 Base repository with common CRUD operations.
 """
 
-from typing import Generic, TypeVar, Type, Optional, Sequence
+import json
+from typing import Any, Generic, Iterator, TypeVar, Type, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select, func
+from sqlalchemy import (
+    Select,
+    cast,
+    column,
+    delete,
+    select,
+    func,
+    literal_column,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from shared.db.models.base import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 
+# Above this many matches, counts come from the planner estimate
+EXACT_COUNT_LIMIT = 10_000
+
+# asyncpg binds at most 32767 parameters per statement; bulk writes size
+# their batches to stay under it, up to MAX_BATCH_ROWS rows
+MAX_BIND_PARAMS = 32_767
+MAX_BATCH_ROWS = 5_000
+
+
+def batches(rows: Sequence, columns: int) -> Iterator[Sequence]:
+    """Split rows into statement-sized batches for `columns` per row."""
+    size = max(1, min(MAX_BATCH_ROWS, MAX_BIND_PARAMS // max(columns, 1)))
+    for i in range(0, len(rows), size):
+        yield rows[i : i + size]
+
+
+def _width(rows: Sequence[dict]) -> int:
+    return max((len(row) for row in rows), default=1)
+
 
 class BaseRepository(Generic[ModelType]):
     """Base repository with common CRUD operations."""
@@ -43,6 +74,42 @@ class BaseRepository(Generic[ModelType]):
         )
         return result.scalar() or 0
 
+    async def count_query(
+        self,
+        query: Select,
+        *,
+        exact_limit: int = EXACT_COUNT_LIMIT,
+    ) -> tuple[int, bool]:
+        """
+        Count rows matched by a query's filters.
+
+        Counts exactly up to `exact_limit` rows, then falls back to the
+        planner's row estimate. Returns (total, is_estimate).
+        """
+        query = (
+            query.with_only_columns(literal_column("1"), maintain_column_froms=True)
+            .order_by(None)
+            .offset(None)
+            .limit(None)
+        )
+        result = await self.session.execute(
+            select(func.count()).select_from(query.limit(exact_limit + 1).subquery())
+        )
+        total = result.scalar() or 0
+        if total <= exact_limit:
+            return total, False
+
+        connection = await self.session.connection()
+        compiled = query.compile(
+            dialect=connection.dialect,
+            compile_kwargs={"literal_binds": True},
+        )
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return max(int(plan[0]["Plan"]["Plan Rows"]), total), True
+
     async def create(self, **kwargs) -> ModelType:
         """Create new entity."""
         entity = self.model(**kwargs)
@@ -61,3 +128,120 @@ class BaseRepository(Generic[ModelType]):
         """Delete entity."""
         await self.session.delete(entity)
         await self.session.flush()
+
+    async def bulk_create(
+        self, rows: Sequence[dict], *, returning: bool = True
+    ) -> list[ModelType]:
+        """
+        Insert many rows with multi-row INSERT ... RETURNING.
+
+        Rows are dicts of column values; Python-side defaults apply.
+        Returns the created entities in input order, or nothing with
+        `returning=False`.
+        """
+        created = []
+        for batch in batches(rows, _width(rows)):
+            stmt = insert(self.model)
+            if returning:
+                result = await self.session.execute(
+                    stmt.returning(self.model, sort_by_parameter_order=True), batch
+                )
+                created.extend(result.scalars().all())
+            else:
+                await self.session.execute(stmt, batch)
+        return created
+
+    async def bulk_upsert(
+        self,
+        rows: Sequence[dict],
+        *,
+        conflict: Optional[Sequence[str]] = None,
+        constraint: Optional[str] = None,
+        update_columns: Optional[Sequence[str]] = None,
+        returning: bool = True,
+    ) -> list[ModelType]:
+        """
+        Insert many rows, resolving conflicts on the `conflict` columns or a
+        named `constraint`.
+
+        Conflicting rows get `update_columns` from the new values (default:
+        every column in the rows except the conflict and primary keys).
+        With `update_columns=()` they are skipped, and only the inserted
+        rows are returned. Returned entities are in no particular order.
+        """
+        keys = set(conflict or ()) | {c.key for c in self.model.__mapper__.primary_key}
+        if update_columns is None:
+            present = dict.fromkeys(key for row in rows for key in row)
+            update_columns = [key for key in present if key not in keys]
+
+        upserted = []
+        for batch in batches(rows, _width(rows)):
+            stmt = insert(self.model)
+            target = {"index_elements": conflict, "constraint": constraint}
+            if update_columns:
+                set_ = {key: stmt.excluded[key] for key in update_columns}
+                if "updated_at" in self.model.__table__.c:
+                    set_["updated_at"] = func.now()
+                stmt = stmt.on_conflict_do_update(**target, set_=set_)
+            else:
+                stmt = stmt.on_conflict_do_nothing(**target)
+            if returning:
+                result = await self.session.execute(stmt.returning(self.model), batch)
+                upserted.extend(result.scalars().all())
+            else:
+                await self.session.execute(stmt, batch)
+        return upserted
+
+    async def bulk_update(self, rows: Sequence[dict]) -> list[Any]:
+        """
+        Update many rows by primary key in one UPDATE ... FROM (VALUES ...)
+        per batch.
+
+        Every row must have the primary key and the same set of columns.
+        Entities already in the session are not refreshed. Returns the
+        primary keys of the rows updated.
+        """
+        if not rows:
+            return []
+        table = self.model.__table__
+        pk = self.model.__mapper__.primary_key[0]
+        names = list(rows[0])
+        if pk.key not in names:
+            raise ValueError(f"Rows must include the primary key {pk.key!r}")
+
+        updated = []
+        for batch in batches(rows, len(names)):
+            data = values(
+                *(column(name, table.c[name].type) for name in names), name="data"
+            ).data([tuple(row[name] for name in names) for row in batch])
+            # Casts keep column types when a whole column of values is NULL
+            stmt = (
+                update(self.model)
+                .where(pk == cast(data.c[pk.key], pk.type))
+                .values(
+                    {
+                        name: cast(data.c[name], table.c[name].type)
+                        for name in names
+                        if name != pk.key
+                    }
+                )
+                .returning(pk)
+                .execution_options(synchronize_session=False)
+            )
+            result = await self.session.execute(stmt)
+            updated.extend(result.scalars().all())
+        return updated
+
+    async def bulk_delete(self, ids: Sequence[Any]) -> list[Any]:
+        """Delete many rows by primary key. Returns the keys deleted."""
+        pk = self.model.__mapper__.primary_key[0]
+        deleted = []
+        for batch in batches(ids, 1):
+            result = await self.session.execute(
+                delete(self.model)
+                .where(pk.in_(batch))
+                .returning(pk)
+                .execution_options(synchronize_session=False)
+            )
+            deleted.extend(result.scalars().all())
+        return deleted
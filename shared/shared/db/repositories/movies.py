@@ -4,10 +4,11 @@ Movie repository.
 
 from typing import Optional, Sequence
 from datetime import date
+from uuid import UUID
 
-from sqlalchemy import select, and_, or_
+from sqlalchemy import Row, Select, select, func, and_, or_, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, selectinload
 
 from shared.db.models.movie import Movie
 from shared.db.repositories.base import BaseRepository
@@ -28,6 +29,28 @@ class MovieRepository(BaseRepository[Movie]):
         )
         return result.scalar_one_or_none()
 
+    async def get_ids_by_slugs(self, slugs: Sequence[str]) -> dict[str, UUID]:
+        """Ids of the movies with these slugs, by slug."""
+        if not slugs:
+            return {}
+        result = await self.session.execute(
+            select(Movie.slug, Movie.id).where(Movie.slug.in_(list(slugs)))
+        )
+        return dict(result.all())
+
+    async def get_releasing_slugs(self, start: date, end: date) -> set[str]:
+        """Slugs of active movies released between `start` and `end`."""
+        result = await self.session.execute(
+            select(Movie.slug).where(
+                and_(
+                    Movie.is_active == True,
+                    Movie.release_date >= start,
+                    Movie.release_date <= end,
+                )
+            )
+        )
+        return set(result.scalars().all())
+
     async def get_by_kinopoisk_id(self, kinopoisk_id: str) -> Optional[Movie]:
         """Get movie by Kinopoisk ID."""
         result = await self.session.execute(
@@ -35,15 +58,74 @@ class MovieRepository(BaseRepository[Movie]):
         )
         return result.scalar_one_or_none()
 
-    async def get_active(
+    def _page(
         self,
+        query: Select,
         *,
-        offset: int = 0,
-        limit: int = 50,
+        cursor: Optional[tuple[Optional[date], UUID]],
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Select:
+        """
+        Order by release date (newest first, undated last) and paginate.
+
+        `cursor` is the (release_date, id) of the last row seen; when given
+        the query seeks past it instead of skipping `offset` rows. `fields`
+        restricts the loaded columns (see `_load_fields`).
+        """
+        query = self._load_fields(query, fields)
+        if cursor:
+            release_date, movie_id = cursor
+            if release_date is None:
+                query = query.where(
+                    Movie.release_date.is_(None),
+                    Movie.id < movie_id,
+                )
+            else:
+                query = query.where(
+                    or_(
+                        Movie.release_date < release_date,
+                        and_(
+                            Movie.release_date == release_date,
+                            Movie.id < movie_id,
+                        ),
+                        Movie.release_date.is_(None),
+                    )
+                )
+            offset = 0
+
+        return (
+            query.order_by(Movie.release_date.desc().nullslast(), Movie.id.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+
+    def _load_fields(self, query: Select, fields: Optional[Sequence[str]]) -> Select:
+        """
+        Load only `fields`; "distributor_name" loads the distributor.
+
+        Without `fields` the whole movie is loaded, distributor included,
+        since full responses carry its name.
+        """
+        if not fields:
+            return query.options(selectinload(Movie.distributor))
+        columns = Movie.__table__.columns
+        query = query.options(
+            load_only(
+                *(getattr(Movie, name) for name in fields if name in columns),
+                raiseload=True,
+            )
+        )
+        if "distributor_name" in fields:
+            query = query.options(selectinload(Movie.distributor))
+        return query
+
+    def _active_query(
+        self,
         release_from: Optional[date] = None,
         release_to: Optional[date] = None,
-    ) -> Sequence[Movie]:
-        """Get active movies with optional date filters."""
+    ) -> Select:
         query = select(Movie).where(Movie.is_active == True)
 
         if release_from:
@@ -51,21 +133,102 @@ class MovieRepository(BaseRepository[Movie]):
         if release_to:
             query = query.where(Movie.release_date <= release_to)
 
-        query = (
-            query.order_by(Movie.release_date.desc().nullslast())
-            .offset(offset)
-            .limit(limit)
+        return query
+
+    def _featured_query(self) -> Select:
+        return select(Movie).where(
+            and_(Movie.is_active == True, Movie.is_featured == True)
+        )
+
+    def _search_rank(self, query: str):
+        """Trigram similarity of the best-matching title."""
+        return func.greatest(
+            func.similarity(Movie.title, query),
+            func.coalesce(func.similarity(Movie.original_title, query), 0),
+        )
+
+    def _search_query(self, query: str, *columns) -> Select:
+        # Substring and fuzzy (pg_trgm `%`) matches; both use the trigram
+        # GIN indexes on title and original_title.
+        search_pattern = f"%{query}%"
+        return select(Movie, *columns).where(
+            or_(
+                Movie.title.ilike(search_pattern),
+                Movie.original_title.ilike(search_pattern),
+                Movie.title.op("%")(query),
+                Movie.original_title.op("%")(query),
+            )
         )
 
-        result = await self.session.execute(query)
+    def _distributor_query(self, distributor_slug: str) -> Select:
+        from shared.db.models.distributor import Distributor
+
+        return (
+            select(Movie)
+            .join(Movie.distributor)
+            .where(Distributor.slug == distributor_slug)
+        )
+
+    async def get_active(
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        release_from: Optional[date] = None,
+        release_to: Optional[date] = None,
+        cursor: Optional[tuple[Optional[date], UUID]] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Sequence[Movie]:
+        """Get active movies with optional date filters."""
+        result = await self.session.execute(
+            self._page(
+                self._active_query(release_from, release_to),
+                cursor=cursor,
+                offset=offset,
+                limit=limit,
+                fields=fields,
+            )
+        )
         return result.scalars().all()
 
-    async def get_featured(self, limit: int = 10) -> Sequence[Movie]:
+    async def count_active(
+        self,
+        *,
+        release_from: Optional[date] = None,
+        release_to: Optional[date] = None,
+    ) -> tuple[int, bool]:
+        """Count active movies matching date filters."""
+        return await self.count_query(self._active_query(release_from, release_to))
+
+    async def get_featured(
+        self,
+        limit: int = 10,
+        *,
+        offset: int = 0,
+        cursor: Optional[tuple[Optional[date], UUID]] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Sequence[Movie]:
         """Get featured movies."""
         result = await self.session.execute(
-            select(Movie)
-            .where(and_(Movie.is_active == True, Movie.is_featured == True))
-            .order_by(Movie.release_date.desc().nullslast())
+            self._page(
+                self._featured_query(),
+                cursor=cursor,
+                offset=offset,
+                limit=limit,
+                fields=fields,
+            )
+        )
+        return result.scalars().all()
+
+    async def count_featured(self) -> tuple[int, bool]:
+        """Count featured movies."""
+        return await self.count_query(self._featured_query())
+
+    async def get_leaderboard(self, limit: int = 10) -> Sequence[Movie]:
+        """Featured movies with the most signals first."""
+        result = await self.session.execute(
+            self._featured_query()
+            .order_by(Movie.signals_count.desc(), Movie.id)
             .limit(limit)
         )
         return result.scalars().all()
@@ -76,22 +239,29 @@ class MovieRepository(BaseRepository[Movie]):
         *,
         offset: int = 0,
         limit: int = 20,
-    ) -> Sequence[Movie]:
-        """Search movies by title."""
-        search_pattern = f"%{query}%"
+        cursor: Optional[tuple[float, UUID]] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Sequence[Row]:
+        """
+        Fuzzy search movies by title, best matches first.
+
+        Rows are (Movie, rank); `cursor` is the (rank, id) of the last row
+        seen.
+        """
+        rank = self._search_rank(query)
+        stmt = self._load_fields(self._search_query(query, rank.label("rank")), fields)
+        if cursor:
+            stmt = stmt.where(tuple_(rank, Movie.id) < tuple_(*cursor))
+            offset = 0
+
         result = await self.session.execute(
-            select(Movie)
-            .where(
-                or_(
-                    Movie.title.ilike(search_pattern),
-                    Movie.original_title.ilike(search_pattern),
-                )
-            )
-            .order_by(Movie.release_date.desc().nullslast())
-            .offset(offset)
-            .limit(limit)
+            stmt.order_by(rank.desc(), Movie.id.desc()).offset(offset).limit(limit)
         )
-        return result.scalars().all()
+        return result.all()
+
+    async def count_search(self, query: str) -> tuple[int, bool]:
+        """Count movies matching a title search."""
+        return await self.count_query(self._search_query(query))
 
     async def get_by_distributor(
         self,
@@ -99,16 +269,21 @@ class MovieRepository(BaseRepository[Movie]):
         *,
         offset: int = 0,
         limit: int = 50,
+        cursor: Optional[tuple[Optional[date], UUID]] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> Sequence[Movie]:
         """Get movies by distributor."""
-        from shared.db.models.distributor import Distributor
-
         result = await self.session.execute(
-            select(Movie)
-            .join(Movie.distributor)
-            .where(Distributor.slug == distributor_slug)
-            .order_by(Movie.release_date.desc().nullslast())
-            .offset(offset)
-            .limit(limit)
+            self._page(
+                self._distributor_query(distributor_slug),
+                cursor=cursor,
+                offset=offset,
+                limit=limit,
+                fields=fields,
+            )
         )
         return result.scalars().all()
+
+    async def count_by_distributor(self, distributor_slug: str) -> tuple[int, bool]:
+        """Count movies by distributor."""
+        return await self.count_query(self._distributor_query(distributor_slug))
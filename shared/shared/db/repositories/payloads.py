@@ -0,0 +1,94 @@
+"""
+Cold payload repositories.
+"""
+
+from datetime import date, datetime
+from typing import Optional, Sequence, Type, Union
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.db.models.payload import (
+    ScreeningPayload,
+    SignalPayload,
+    pack_payload,
+    unpack_payload,
+)
+from shared.db.repositories.base import BaseRepository, ModelType, batches
+
+
+class PayloadRepository(BaseRepository[ModelType]):
+    """
+    Repository for a payload side table.
+
+    Rows are addressed by the owning row's id; passing its partition key
+    as well limits the lookup to one partition.
+    """
+
+    partition_key: str
+
+    def __init__(self, session: AsyncSession, model: Type[ModelType]):
+        super().__init__(session, model)
+        self.key_column = model.__table__.c[self.partition_key]
+
+    async def save(self, rows: Sequence[dict]) -> None:
+        """
+        Store payloads, replacing existing ones.
+
+        Rows are dicts of `id`, the partition key and `data`; rows with
+        empty data are skipped.
+        """
+        packed = [
+            {
+                "id": row["id"],
+                self.partition_key: row[self.partition_key],
+                "payload": pack_payload(row["data"]),
+            }
+            for row in rows
+            if row["data"]
+        ]
+        await self.bulk_upsert(
+            packed,
+            conflict=["id", self.partition_key],
+            update_columns=["payload"],
+            returning=False,
+        )
+
+    async def load(self, id: UUID, key: Optional[Union[date, datetime]] = None) -> dict:
+        """A row's payload; empty when it has none."""
+        query = select(self.model.payload).where(self.model.id == id)
+        if key is not None:
+            query = query.where(self.key_column == key)
+        result = await self.session.execute(query)
+        return unpack_payload(result.scalars().first())
+
+    async def load_many(self, ids: Sequence[UUID]) -> dict[UUID, dict]:
+        """Payloads of many rows by id; rows without one are left out."""
+        payloads = {}
+        for batch in batches(ids, 1):
+            result = await self.session.execute(
+                select(self.model.id, self.model.payload).where(
+                    self.model.id.in_(batch)
+                )
+            )
+            payloads.update({id: unpack_payload(blob) for id, blob in result.all()})
+        return payloads
+
+
+class SignalPayloadRepository(PayloadRepository[SignalPayload]):
+    """Raw data and embeddings of signals."""
+
+    partition_key = "published_at"
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, SignalPayload)
+
+
+class ScreeningPayloadRepository(PayloadRepository[ScreeningPayload]):
+    """Raw data of screening snapshots."""
+
+    partition_key = "snapshot_date"
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, ScreeningPayload)
@@ -0,0 +1,75 @@
+"""
+Screening snapshot repository.
+"""
+
+from datetime import date, timedelta
+from typing import Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.db.models.screening import ScreeningRollup, ScreeningSnapshot
+from shared.db.repositories.base import BaseRepository
+from shared.db.repositories.payloads import ScreeningPayloadRepository
+
+
+class ScreeningRepository(BaseRepository[ScreeningSnapshot]):
+    """Repository for ScreeningSnapshot model."""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, ScreeningSnapshot)
+        self.payloads = ScreeningPayloadRepository(session)
+
+    async def get_raw_data(
+        self, snapshots: Sequence[ScreeningSnapshot]
+    ) -> dict[UUID, dict]:
+        """Raw source data of snapshots by id, for those that have it."""
+        payloads = await self.payloads.load_many([s.id for s in snapshots])
+        return {id: payload["raw_data"] for id, payload in payloads.items()}
+
+    async def get_for_movie(
+        self,
+        movie_id: UUID,
+        days: int = 7,
+        city: Optional[str] = None,
+        limit: int = 1000,
+    ) -> Sequence[ScreeningSnapshot]:
+        """
+        Get recent snapshots for a movie, newest first.
+
+        Raw source data is not loaded; see `get_raw_data`.
+        """
+        query = select(ScreeningSnapshot).where(
+            ScreeningSnapshot.movie_id == movie_id,
+            ScreeningSnapshot.snapshot_date >= date.today() - timedelta(days=days),
+        )
+        if city:
+            query = query.where(ScreeningSnapshot.city == city)
+
+        query = query.order_by(
+            ScreeningSnapshot.snapshot_date.desc(),
+            ScreeningSnapshot.snapshot_time.desc(),
+        ).limit(limit)
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def get_rollups(
+        self,
+        movie_id: UUID,
+        dimension: str = "city",
+        window_days: int = 7,
+        limit: int = 20,
+    ) -> Sequence[ScreeningRollup]:
+        """Get a movie's screening rollups for a dimension, busiest first."""
+        result = await self.session.execute(
+            select(ScreeningRollup)
+            .where(
+                ScreeningRollup.movie_id == movie_id,
+                ScreeningRollup.dimension == dimension,
+                ScreeningRollup.window_days == window_days,
+            )
+            .order_by(ScreeningRollup.screenings_count.desc())
+            .limit(limit)
+        )
+        return result.scalars().all()
@@ -2,15 +2,93 @@
 Signal repository.
 """
 
-from typing import Optional, Sequence
+from typing import Optional, Sequence, Union
 from datetime import datetime, timedelta
 from uuid import UUID
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import Row, Select, literal_column, select, func, and_, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
-from shared.db.models.signal import Signal
-from shared.db.repositories.base import BaseRepository
+from shared.db.models.movie import Movie
+from shared.db.models.signal import SEARCH_CONFIG, Signal, SignalExternalId
+from shared.db.models.source import Source
+from shared.db.repositories.base import BaseRepository, batches
+from shared.db.repositories.payloads import SignalPayloadRepository
+
+# Loading profiles: which heavy columns each use case skips. Skipped
+# columns raise on access instead of lazy-loading, which AsyncSession
+# cannot do anyway. Use PROFILE_DETAIL to opt in to everything.
+PROFILE_LIST = "list"
+PROFILE_CLASSIFICATION = "classification"
+PROFILE_DETAIL = "detail"
+
+HEAVY_COLUMNS = {
+    "content": Signal.content,
+    "keywords": Signal.keywords,
+}
+
+LOAD_PROFILES = {
+    PROFILE_LIST: ("content", "keywords"),
+    PROFILE_CLASSIFICATION: ("keywords",),
+    PROFILE_DETAIL: (),
+}
+
+# Fields stored in signal_payloads rather than on the signal row. Writes
+# through this repository split them off; read them with get_payload.
+COLD_FIELDS = ("raw_data", "embedding")
+
+
+def load_profile(profile: str) -> list:
+    """Loader options deferring the heavy columns a profile skips."""
+    return [
+        defer(HEAVY_COLUMNS[name], raiseload=True) for name in LOAD_PROFILES[profile]
+    ]
+
+
+# Columns served by signal listings, plus related names joined in
+FEED_COLUMNS = (
+    Signal.id,
+    Signal.external_id,
+    Signal.title,
+    Signal.content,
+    Signal.summary,
+    Signal.source_url,
+    Signal.image_url,
+    Signal.author,
+    Signal.created_at,
+    Signal.published_at,
+    Signal.signal_type,
+    Signal.importance,
+    Signal.sentiment,
+    Signal.sentiment_score,
+    Signal.rating,
+    Signal.platform_rating,
+    Signal.views_count,
+    Signal.likes_count,
+    Signal.comments_count,
+    Signal.shares_count,
+    Signal.is_classified,
+    Signal.is_published,
+    Signal.is_featured,
+    Movie.title.label("movie_title"),
+    Source.name.label("source_name"),
+)
+FEED_FIELDS = {column.key: column for column in FEED_COLUMNS}
+
+
+def _split_cold(row: dict) -> tuple[dict, dict]:
+    """Split signal values into row columns and the cold payload."""
+    hot = {key: value for key, value in row.items() if key not in COLD_FIELDS}
+    cold = {key: row[key] for key in COLD_FIELDS if row.get(key)}
+    return hot, cold
+
+
+def _tsquery(search: str):
+    """Parse user search input (quotes, OR, -word) into a tsquery."""
+    config = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+    return func.websearch_to_tsquery(config, search)
 
 
 class SignalRepository(BaseRepository[Signal]):
@@ -18,22 +96,101 @@ class SignalRepository(BaseRepository[Signal]):
 
     def __init__(self, session: AsyncSession):
         super().__init__(session, Signal)
+        self.payloads = SignalPayloadRepository(session)
 
-    async def get_by_external_id(self, external_id: str) -> Optional[Signal]:
+    async def create(self, **kwargs) -> Optional[Signal]:
+        """
+        Create a signal, storing raw_data/embedding as its payload.
+
+        Returns None if its external_id is already claimed.
+        """
+        if not await self.claim_external_ids([kwargs["external_id"]]):
+            return None
+        values, cold = _split_cold(kwargs)
+        signal = await super().create(**values)
+        await self.payloads.save(
+            [{"id": signal.id, "published_at": signal.published_at, "data": cold}]
+        )
+        return signal
+
+    async def get_payload(self, signal: Signal) -> dict:
+        """A signal's cold fields (raw_data, embedding) if it has any."""
+        return await self.payloads.load(signal.id, signal.published_at)
+
+    async def get_by_external_id(
+        self,
+        external_id: str,
+        *,
+        profile: str = PROFILE_DETAIL,
+    ) -> Optional[Signal]:
         """Get signal by external ID."""
         result = await self.session.execute(
-            select(Signal).where(Signal.external_id == external_id)
+            select(Signal)
+            .where(Signal.external_id == external_id)
+            .options(*load_profile(profile))
         )
         return result.scalar_one_or_none()
 
     async def exists_by_external_id(self, external_id: str) -> bool:
-        """Check if signal with external ID exists."""
+        """Check if a signal with external ID was ever stored."""
         result = await self.session.execute(
-            select(func.count())
-            .select_from(Signal)
-            .where(Signal.external_id == external_id)
+            select(SignalExternalId.external_id).where(
+                SignalExternalId.external_id == external_id
+            )
         )
-        return (result.scalar() or 0) > 0
+        return result.first() is not None
+
+    async def claim_external_ids(self, external_ids: Sequence[str]) -> set[str]:
+        """
+        Claim external IDs for new signals. Returns those claimed.
+
+        Claims are unique across partitions; a concurrent claim of the same
+        ID waits for this transaction and then gets nothing, so the caller
+        must insert the claimed signals before committing.
+        """
+        claimed = set()
+        for batch in batches(list(dict.fromkeys(external_ids)), 1):
+            stmt = (
+                insert(SignalExternalId)
+                .values([{"external_id": external_id} for external_id in batch])
+                .on_conflict_do_nothing()
+                .returning(SignalExternalId.external_id)
+            )
+            result = await self.session.execute(stmt)
+            claimed.update(result.scalars())
+        return claimed
+
+    async def create_new(self, rows: Sequence[dict]) -> list[Signal]:
+        """
+        Insert the signals whose external_id is not stored yet.
+
+        external_id is only unique per published_at on the partitioned
+        table, so IDs are claimed in signal_external_ids first and only
+        claimed rows are inserted. Cold fields go to signal_payloads.
+        Returns the signals inserted.
+        """
+        rows = list({row["external_id"]: row for row in rows}.values())
+        claimed = await self.claim_external_ids([row["external_id"] for row in rows])
+        rows = [row for row in rows if row["external_id"] in claimed]
+
+        values, cold = [], {}
+        for row in rows:
+            hot, cold[row["external_id"]] = _split_cold(row)
+            values.append(hot)
+        created = await self.bulk_upsert(
+            values, constraint="uq_signals_external_id", update_columns=()
+        )
+        await self.payloads.save(
+            [
+                {
+                    "id": signal.id,
+                    "published_at": signal.published_at,
+                    "data": cold[signal.external_id],
+                }
+                for signal in created
+            ]
+        )
+        return created
 
     async def get_for_movie(
         self,
@@ -43,9 +200,14 @@ class SignalRepository(BaseRepository[Signal]):
         importance: Optional[str] = None,
         offset: int = 0,
         limit: int = 50,
+        profile: str = PROFILE_LIST,
     ) -> Sequence[Signal]:
         """Get signals for a movie."""
-        query = select(Signal).where(Signal.movie_id == movie_id)
+        query = (
+            select(Signal)
+            .where(Signal.movie_id == movie_id)
+            .options(*load_profile(profile))
+        )
 
         if signal_type:
             query = query.where(Signal.signal_type == signal_type)
@@ -53,7 +215,7 @@ class SignalRepository(BaseRepository[Signal]):
             query = query.where(Signal.importance == importance)
 
         query = (
-            query.order_by(Signal.published_at.desc().nullslast())
+            query.order_by(Signal.published_at.desc(), Signal.id.desc())
             .offset(offset)
             .limit(limit)
         )
@@ -61,29 +223,35 @@ class SignalRepository(BaseRepository[Signal]):
         result = await self.session.execute(query)
         return result.scalars().all()
 
-    async def get_unclassified(self, limit: int = 100) -> Sequence[Signal]:
+    async def get_unclassified(
+        self,
+        limit: int = 100,
+        *,
+        profile: str = PROFILE_CLASSIFICATION,
+    ) -> Sequence[Signal]:
         """Get unclassified signals."""
         result = await self.session.execute(
             select(Signal)
+            .options(*load_profile(profile))
             .where(Signal.is_classified == False)
             .order_by(Signal.created_at)
             .limit(limit)
         )
         return result.scalars().all()
 
-    async def get_recent(
+    def _recent_query(
         self,
         *,
-        hours: int = 24,
-        signal_type: Optional[str] = None,
-        importance: Optional[str] = None,
-        movie_id: Optional[UUID] = None,
-        offset: int = 0,
-        limit: int = 100,
-    ) -> Sequence[Signal]:
-        """Get recent signals."""
+        hours: int,
+        signal_type: Optional[str],
+        importance: Optional[str],
+        movie_id: Optional[UUID],
+        search: Optional[str] = None,
+        columns: Sequence = (Signal,),
+    ) -> Select:
+        """Build the filtered query for recent published signals."""
         since = datetime.utcnow() - timedelta(hours=hours)
-        query = select(Signal).where(
+        query = select(*columns).where(
             Signal.published_at >= since,
             Signal.is_published == True,
         )
@@ -94,12 +262,129 @@ class SignalRepository(BaseRepository[Signal]):
             query = query.where(Signal.importance == importance)
         if movie_id:
             query = query.where(Signal.movie_id == movie_id)
+        if search:
+            query = query.where(Signal.search_vector.op("@@")(_tsquery(search)))
+
+        return query
+
+    async def get_recent(
+        self,
+        *,
+        hours: int = 24,
+        signal_type: Optional[str] = None,
+        importance: Optional[str] = None,
+        movie_id: Optional[UUID] = None,
+        cursor: Optional[tuple[datetime, UUID]] = None,
+        offset: int = 0,
+        limit: int = 100,
+        profile: str = PROFILE_LIST,
+    ) -> Sequence[Signal]:
+        """
+        Get recent signals, newest first.
 
-        query = query.order_by(Signal.published_at.desc()).offset(offset).limit(limit)
+        Pass the (published_at, id) of the last row seen as `cursor` to
+        seek to the next page instead of using `offset`.
+        """
+        query = self._recent_query(
+            hours=hours,
+            signal_type=signal_type,
+            importance=importance,
+            movie_id=movie_id,
+        ).options(*load_profile(profile))
+        if cursor:
+            query = query.where(
+                tuple_(Signal.published_at, Signal.id) < tuple_(*cursor)
+            )
+
+        query = (
+            query.order_by(Signal.published_at.desc(), Signal.id.desc())
+            .offset(offset)
+            .limit(limit)
+        )
 
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    async def list_feed(
+        self,
+        *,
+        hours: int = 24,
+        signal_type: Optional[str] = None,
+        importance: Optional[str] = None,
+        movie_id: Optional[UUID] = None,
+        search: Optional[str] = None,
+        cursor: Optional[tuple[Union[datetime, float], UUID]] = None,
+        offset: int = 0,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Sequence[Row]:
+        """
+        Read model for signal listings.
+
+        Same filters and ordering as `get_recent`, but one query joining
+        movie and source names and selecting only FEED_COLUMNS. Rows are
+        plain tuples with attribute access, not ORM entities.
+
+        `fields` narrows the projection to a subset of FEED_FIELDS; joins
+        are skipped when their names are not requested.
+
+        With `search`, only full-text matches are returned, best first.
+        Rows then carry a `rank` and `cursor` is (rank, id).
+        """
+        columns = (
+            tuple(FEED_FIELDS[name] for name in fields) if fields else FEED_COLUMNS
+        )
+        keys = {column.key for column in columns}
+        if search:
+            order_key = func.ts_rank_cd(Signal.search_vector, _tsquery(search))
+            columns = (*columns, order_key.label("rank"))
+        else:
+            order_key = Signal.published_at
+
+        query = self._recent_query(
+            hours=hours,
+            signal_type=signal_type,
+            importance=importance,
+            movie_id=movie_id,
+            search=search,
+            columns=columns,
+        )
+        if "movie_title" in keys:
+            query = query.outerjoin(Movie, Signal.movie_id == Movie.id)
+        if "source_name" in keys:
+            query = query.outerjoin(Source, Signal.source_id == Source.id)
+        if cursor:
+            query = query.where(tuple_(order_key, Signal.id) < tuple_(*cursor))
+
+        query = (
+            query.order_by(order_key.desc(), Signal.id.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+
+        result = await self.session.execute(query)
+        return result.all()
+
+    async def count_recent(
+        self,
+        *,
+        hours: int = 24,
+        signal_type: Optional[str] = None,
+        importance: Optional[str] = None,
+        movie_id: Optional[UUID] = None,
+        search: Optional[str] = None,
+    ) -> tuple[int, bool]:
+        """Count recent signals matching filters. Returns (total, is_estimate)."""
+        return await self.count_query(
+            self._recent_query(
+                hours=hours,
+                signal_type=signal_type,
+                importance=importance,
+                movie_id=movie_id,
+                search=search,
+            )
+        )
+
     async def get_stats(
         self,
         *,
@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from shared.analytics.collection import next_interval, now_utc, update_rate
 from shared.db.models.source import Source
 from shared.db.repositories.base import BaseRepository
 
@@ -53,6 +54,43 @@ class SourceRepository(BaseRepository[Source]):
         )
         return result.scalars().all()
 
+    async def get_due(self, source_types: Sequence[str]) -> Sequence[Source]:
+        """Active sources of the given types whose next check is due."""
+        result = await self.session.execute(
+            select(Source).where(
+                and_(
+                    Source.is_active == True,
+                    Source.type.in_(source_types),
+                    (Source.next_check_at == None)
+                    | (Source.next_check_at <= now_utc()),
+                )
+            )
+        )
+        return result.scalars().all()
+
+    async def record_check(
+        self,
+        source: Source,
+        new_items: int,
+        error: Optional[str] = None,
+        release_week: bool = False,
+        boost: float = 1.0,
+    ) -> Source:
+        """
+        Mark a source as checked and schedule its next check.
+
+        A failed check leaves the change rate as it was.
+        """
+        now = now_utc()
+        if error is None:
+            source.change_rate = update_rate(source, new_items, now)
+            source.last_new_items = new_items
+        source.last_checked_at = now
+        source.last_error = error
+        source.next_check_at = now + next_interval(source, release_week, boost)
+        await self.session.flush()
+        return source
+
     async def mark_checked(self, source: Source, error: Optional[str] = None) -> Source:
         """Mark source as checked."""
         source.last_checked_at = datetime.utcnow()
@@ -0,0 +1,185 @@
+"""
+Signal retention: roll up, then delete or archive aged signals.
+
+Each batch is one statement: it locks the oldest matching signals
+(skipping rows locked by others), deletes them and their payloads, adds
+them to signal_daily_rollups and, for archive policies, copies them into
+the archive schema. A batch either happens entirely or not at all.
+"""
+
+import re
+from datetime import datetime
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.config.retention import ACTION_ARCHIVE, RetentionPolicy
+from shared.db.models.signal import Signal
+
+# Add rows of `{source}` (a CTE or table with signal columns) to the
+# daily rollups
+ROLLUP_SQL = """
+    INSERT INTO signal_daily_rollups (
+        day, movie_id, source_type, signal_type, importance, sentiment,
+        signals_count, sentiment_sum, sentiment_count,
+        views_count, likes_count, comments_count, shares_count
+    )
+    SELECT
+        (rolled.published_at AT TIME ZONE 'UTC')::date,
+        rolled.movie_id,
+        sources.type,
+        rolled.signal_type,
+        rolled.importance,
+        rolled.sentiment,
+        count(*),
+        coalesce(sum(rolled.sentiment_score), 0),
+        count(rolled.sentiment_score),
+        coalesce(sum(rolled.views_count), 0),
+        coalesce(sum(rolled.likes_count), 0),
+        coalesce(sum(rolled.comments_count), 0),
+        coalesce(sum(rolled.shares_count), 0)
+    FROM {source} rolled
+    LEFT JOIN sources ON sources.id = rolled.source_id
+    GROUP BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT ON CONSTRAINT uq_signal_daily_rollups_key DO UPDATE SET
+        signals_count = signal_daily_rollups.signals_count + EXCLUDED.signals_count,
+        sentiment_sum = signal_daily_rollups.sentiment_sum + EXCLUDED.sentiment_sum,
+        sentiment_count = signal_daily_rollups.sentiment_count + EXCLUDED.sentiment_count,
+        views_count = signal_daily_rollups.views_count + EXCLUDED.views_count,
+        likes_count = signal_daily_rollups.likes_count + EXCLUDED.likes_count,
+        comments_count = signal_daily_rollups.comments_count + EXCLUDED.comments_count,
+        shares_count = signal_daily_rollups.shares_count + EXCLUDED.shares_count
+"""
+
+# Stored signal columns (search_vector is generated)
+ARCHIVE_COLUMNS = ", ".join(
+    column.name for column in Signal.__table__.columns if column.computed is None
+)
+
+PRUNE_SQL = """
+    WITH batch AS (
+        SELECT signals.id, signals.published_at
+        FROM signals
+        WHERE signals.source_id IN (
+                SELECT id FROM sources WHERE type = :source_type
+            )
+          AND signals.published_at < :cutoff
+          AND {importance_filter}
+          AND {link_filter}
+          AND NOT coalesce(signals.is_featured, FALSE)
+        ORDER BY signals.published_at
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    ),
+    pruned AS (
+        DELETE FROM signals USING batch
+        WHERE signals.id = batch.id AND signals.published_at = batch.published_at
+        RETURNING signals.*
+    ),
+    pruned_payloads AS (
+        DELETE FROM signal_payloads USING batch
+        WHERE signal_payloads.id = batch.id
+          AND signal_payloads.published_at = batch.published_at
+        RETURNING signal_payloads.*
+    ),
+    rolled_up AS ({rollup}){archive}
+    SELECT
+        (SELECT count(*) FROM pruned) AS rows,
+        (SELECT coalesce(sum(pg_column_size(pruned.*)), 0) FROM pruned) AS row_bytes,
+        (SELECT count(*) FROM pruned_payloads) AS payloads,
+        (
+            SELECT coalesce(sum(pg_column_size(pruned_payloads.*)), 0)
+            FROM pruned_payloads
+        ) AS payload_bytes
+"""
+
+ARCHIVE_SQL = f""",
+    archived AS (
+        INSERT INTO archive.pruned_signals ({ARCHIVE_COLUMNS})
+        SELECT {ARCHIVE_COLUMNS} FROM pruned
+    ),
+    archived_payloads AS (
+        INSERT INTO archive.pruned_signal_payloads (id, published_at, payload, created_at)
+        SELECT id, published_at, payload, created_at FROM pruned_payloads
+    )"""
+
+SIGNAL_PARTITION = re.compile(r"^signals_\d{4}_\d{2}$")
+
+LOCK_NOT_AVAILABLE = "55P03"
+
+
+def _prune_statement(policy: RetentionPolicy):
+    importance = [value for value in policy.importance if value is not None]
+    importance_filter = "signals.importance IN :importance"
+    if None in policy.importance:
+        importance_filter = f"({importance_filter} OR signals.importance IS NULL)"
+    sql = PRUNE_SQL.format(
+        importance_filter=importance_filter,
+        link_filter="signals.movie_id IS NULL" if policy.unlinked_only else "TRUE",
+        rollup=ROLLUP_SQL.format(source="pruned"),
+        archive=ARCHIVE_SQL if policy.action == ACTION_ARCHIVE else "",
+    )
+    return text(sql).bindparams(
+        bindparam("importance", value=importance, expanding=True)
+    )
+
+
+def is_lock_timeout(error: Exception) -> bool:
+    """Whether a DBAPI error is a lock_timeout expiring."""
+    return getattr(getattr(error, "orig", None), "pgcode", None) == LOCK_NOT_AVAILABLE
+
+
+async def prune_batch(
+    session: AsyncSession,
+    policy: RetentionPolicy,
+    cutoff: datetime,
+    batch_size: int,
+    lock_timeout_ms: int,
+) -> dict:
+    """
+    Prune one batch of a policy's signals older than `cutoff` and commit.
+
+    Raises on lock_timeout (see `is_lock_timeout`); the session must then
+    be rolled back. Returns rows and payloads removed and their sizes.
+    """
+    await session.execute(text(f"SET LOCAL lock_timeout = {int(lock_timeout_ms)}"))
+    result = await session.execute(
+        _prune_statement(policy),
+        {
+            "source_type": policy.source_type,
+            "cutoff": cutoff,
+            "batch_size": batch_size,
+        },
+    )
+    stats = dict(result.one()._mapping)
+    await session.commit()
+    return stats
+
+
+async def rollup_partition(session: AsyncSession, name: str) -> int:
+    """
+    Add a detached signals partition (now in the archive schema) to the
+    daily rollups. Returns the number of rollup rows written.
+    """
+    if not SIGNAL_PARTITION.match(name):
+        raise ValueError(f"Not a signals month partition: {name}")
+    result = await session.execute(text(ROLLUP_SQL.format(source=f'archive."{name}"')))
+    return result.rowcount
+
+
+async def wal_position(session: AsyncSession) -> str:
+    """Current WAL insert position."""
+    result = await session.execute(text("SELECT pg_current_wal_lsn()::text"))
+    return result.scalar_one()
+
+
+async def wal_bytes_since(session: AsyncSession, position: str) -> int:
+    """
+    WAL written since `position`, by every session on the server; an upper
+    bound on what pruning wrote.
+    """
+    result = await session.execute(
+        text("SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), CAST(:position AS pg_lsn))"),
+        {"position": position},
+    )
+    return int(result.scalar_one())
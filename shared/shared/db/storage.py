@@ -0,0 +1,58 @@
+"""
+Table storage statistics.
+
+Sizes, row density and buffer cache hit rates per table, summed over
+partitions, for judging how wide the hot tables are and how well they
+stay cached.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Hot tables and their cold payload tables
+STORAGE_TABLES = (
+    "signals",
+    "signal_payloads",
+    "screening_snapshots",
+    "screening_payloads",
+    "movies",
+)
+
+
+async def table_storage(session: AsyncSession, table: str) -> dict:
+    """
+    Storage stats for a table and its partitions.
+
+    `rows_per_page` is rows per 8 kB heap page, from the planner's
+    estimates (current after ANALYZE). Hit rates count heap block reads
+    served from shared buffers since the statistics were last reset.
+    """
+    result = await session.execute(
+        text("""
+            SELECT
+                coalesce(sum(greatest(c.reltuples, 0)), 0)::bigint AS estimated_rows,
+                coalesce(sum(c.relpages), 0)::bigint AS heap_pages,
+                coalesce(sum(pg_relation_size(c.oid)), 0)::bigint AS heap_bytes,
+                coalesce(sum(pg_table_size(c.oid)), 0)::bigint AS table_bytes,
+                coalesce(sum(pg_indexes_size(c.oid)), 0)::bigint AS index_bytes,
+                coalesce(sum(io.heap_blks_hit), 0)::bigint AS heap_blks_hit,
+                coalesce(sum(io.heap_blks_read), 0)::bigint AS heap_blks_read,
+                coalesce(sum(io.toast_blks_hit), 0)::bigint AS toast_blks_hit,
+                coalesce(sum(io.toast_blks_read), 0)::bigint AS toast_blks_read
+            FROM pg_partition_tree(CAST(:table AS regclass)) tree
+            JOIN pg_class c ON c.oid = tree.relid
+            LEFT JOIN pg_statio_user_tables io ON io.relid = tree.relid
+            WHERE tree.isleaf
+            """),
+        {"table": table},
+    )
+    stats = dict(result.one()._mapping)
+
+    pages = stats["heap_pages"]
+    stats["rows_per_page"] = (
+        round(stats["estimated_rows"] / pages, 1) if pages else None
+    )
+    for kind in ("heap", "toast"):
+        hit, read = stats[f"{kind}_blks_hit"], stats[f"{kind}_blks_read"]
+        stats[f"{kind}_hit_rate"] = round(hit / (hit + read), 4) if hit + read else None
+    return stats
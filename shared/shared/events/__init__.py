@@ -0,0 +1,19 @@
+"""
+Live events published by the worker and streamed by the API.
+"""
+
+from shared.events.signals import (
+    EVENT_CLASSIFIED,
+    EVENT_CREATED,
+    SIGNAL_EVENTS_CHANNEL,
+    publish_signal_events,
+    signal_event,
+)
+
+__all__ = [
+    "EVENT_CLASSIFIED",
+    "EVENT_CREATED",
+    "SIGNAL_EVENTS_CHANNEL",
+    "publish_signal_events",
+    "signal_event",
+]
@@ -0,0 +1,59 @@
+"""
+Signal events over Redis pub/sub.
+
+Every event gets a monotonically increasing id from a Redis counter, so
+subscribers can resume after a reconnect by asking for everything after
+the last id they saw.
+"""
+
+import json
+import logging
+from typing import Sequence
+
+from redis.asyncio import Redis
+
+from shared.db.models.signal import Signal
+
+logger = logging.getLogger(__name__)
+
+SIGNAL_EVENTS_CHANNEL = "signals:events"
+EVENT_ID_KEY = "signals:events:id"
+
+EVENT_CREATED = "created"
+EVENT_CLASSIFIED = "classified"
+
+
+def signal_event(signal: Signal) -> dict:
+    """Event payload for a signal: the listing fields clients render."""
+    return {
+        "id": str(signal.id),
+        "movie_id": str(signal.movie_id) if signal.movie_id else None,
+        "title": signal.title,
+        "summary": signal.summary,
+        "source_url": signal.source_url,
+        "image_url": signal.image_url,
+        "signal_type": signal.signal_type,
+        "importance": signal.importance,
+        "sentiment": signal.sentiment,
+        "published_at": (
+            signal.published_at.isoformat() if signal.published_at else None
+        ),
+    }
+
+
+async def publish_signal_events(
+    redis: Redis, event: str, payloads: Sequence[dict]
+) -> None:
+    """Assign event ids and publish payloads. Never raises."""
+    if not payloads:
+        return
+    try:
+        last_id = await redis.incrby(EVENT_ID_KEY, len(payloads))
+        first_id = last_id - len(payloads) + 1
+        async with redis.pipeline(transaction=False) as pipe:
+            for offset, payload in enumerate(payloads):
+                message = {"id": first_id + offset, "event": event, "data": payload}
+                pipe.publish(SIGNAL_EVENTS_CHANNEL, json.dumps(message))
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to publish {len(payloads)} {event} events: {e}")
@@ -2,6 +2,19 @@
 Queue module for background jobs.
 """
 
-from shared.queue.client import get_redis_pool, enqueue_task
+from shared.queue.client import (
+    close_redis_pool,
+    enqueue_many,
+    enqueue_task,
+    get_redis_pool,
+)
+from shared.queue.jobs import get_progress, report_progress
 
-__all__ = ["get_redis_pool", "enqueue_task"]
+__all__ = [
+    "get_redis_pool",
+    "close_redis_pool",
+    "enqueue_task",
+    "enqueue_many",
+    "report_progress",
+    "get_progress",
+]
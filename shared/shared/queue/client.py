@@ -1,12 +1,20 @@
 """
 Redis queue client for ARQ.
+
+The pool is a process-wide singleton: services open it at startup, every
+enqueue reuses it, and it is closed on shutdown.
 """
 
-from typing import Any, Optional
+import asyncio
+from typing import Any, Iterable, Optional, Sequence
 from functools import lru_cache
+from uuid import uuid4
 
 from arq import create_pool
 from arq.connections import RedisSettings, ArqRedis
+from arq.constants import job_key_prefix, result_key_prefix
+from arq.jobs import serialize_job
+from arq.utils import timestamp_ms
 
 from shared.settings import get_settings
 
@@ -38,23 +46,100 @@ def get_redis_settings() -> RedisSettings:
         return RedisSettings(host=host, port=port)
 
 
+_pool: Optional[ArqRedis] = None
+_pool_lock = asyncio.Lock()
+
+
 async def get_redis_pool() -> ArqRedis:
-    """Get Redis connection pool."""
-    return await create_pool(get_redis_settings())
+    """Get the shared Redis connection pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        async with _pool_lock:
+            if _pool is None:
+                _pool = await create_pool(get_redis_settings())
+    return _pool
+
+
+async def close_redis_pool() -> None:
+    """Close the shared pool. The next enqueue opens a new one."""
+    global _pool
+    if _pool is not None:
+        pool, _pool = _pool, None
+        await pool.aclose()
 
 
 async def enqueue_task(
     task_name: str,
     *args: Any,
+    _job_id: Optional[str] = None,
     _queue_name: Optional[str] = None,
     **kwargs: Any,
 ) -> str:
-    """Enqueue a task to be processed by worker."""
+    """
+    Enqueue a task to be processed by worker.
+
+    With `_job_id`, enqueueing is idempotent: if a job with that id is
+    queued, running or has a kept result, nothing is enqueued and an empty
+    string is returned.
+    """
     pool = await get_redis_pool()
     job = await pool.enqueue_job(
         task_name,
         *args,
+        _job_id=_job_id,
         _queue_name=_queue_name,
         **kwargs,
     )
     return job.job_id if job else ""
+
+
+async def enqueue_many(
+    task_name: str,
+    arg_sets: Iterable[Sequence[Any]],
+    _job_ids: Optional[Sequence[Optional[str]]] = None,
+    _queue_name: Optional[str] = None,
+) -> list[str]:
+    """
+    Enqueue one job per argument tuple in two round trips.
+
+    Returns job ids in input order, with an empty string for jobs skipped
+    because their `_job_ids` entry already exists (as in `enqueue_task`).
+    """
+    pool = await get_redis_pool()
+    queue_name = _queue_name or pool.default_queue_name
+    arg_sets = [tuple(args) for args in arg_sets]
+    job_ids = list(_job_ids) if _job_ids else [None] * len(arg_sets)
+    job_ids = [job_id or uuid4().hex for job_id in job_ids]
+    if not arg_sets:
+        return []
+
+    async with pool.pipeline(transaction=False) as pipe:
+        for job_id in job_ids:
+            pipe.exists(job_key_prefix + job_id, result_key_prefix + job_id)
+        existing = await pipe.execute()
+
+    enqueue_time_ms = timestamp_ms()
+    enqueued = []
+    results = []
+    async with pool.pipeline(transaction=False) as pipe:
+        for job_id, args, exists in zip(job_ids, arg_sets, existing):
+            if exists:
+                continue
+            job = serialize_job(
+                task_name,
+                args,
+                {},
+                None,
+                enqueue_time_ms,
+                serializer=pool.job_serializer,
+            )
+            # NX on both keys keeps a concurrent enqueue of the same id intact
+            pipe.set(job_key_prefix + job_id, job, px=pool.expires_extra_ms, nx=True)
+            pipe.zadd(queue_name, {job_id: enqueue_time_ms}, nx=True)
+            enqueued.append(job_id)
+        if enqueued:
+            results = await pipe.execute()
+
+    # Results alternate SET, ZADD per job
+    created = {job_id for job_id, was_set in zip(enqueued, results[::2]) if was_set}
+    return [job_id if job_id in created else "" for job_id in job_ids]
@@ -0,0 +1,151 @@
+"""
+Job progress and latency tracking.
+
+Long tasks report progress into a Redis hash keyed by job id, which the
+API reads next to ARQ's own job info. The worker records the queue wait
+and run time of every finished job into a capped per-task list, which
+gives a rolling latency histogram.
+"""
+
+import json
+import logging
+from datetime import datetime
+from typing import Any, Optional
+
+from arq.jobs import Job, JobDef, JobResult, JobStatus
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_KEY = "job:progress:{job_id}"
+PROGRESS_TTL = 3600  # seconds, same as the worker's keep_result
+
+LATENCY_KEY = "job:latency:{function}"
+LATENCY_FUNCTIONS_KEY = "job:latency:functions"
+LATENCY_SAMPLES = 500
+
+# Upper bounds in seconds; the last bucket is open-ended
+LATENCY_BUCKETS = (1, 5, 15, 30, 60, 120, 300, 600)
+
+IN_FLIGHT = (JobStatus.deferred, JobStatus.queued, JobStatus.in_progress)
+
+
+async def report_progress(
+    ctx: dict, done: int, total: Optional[int] = None, **fields: Any
+) -> None:
+    """
+    Record a running job's progress. A no-op outside a job.
+
+    Never raises: progress reporting must not fail the task.
+    """
+    job_id = ctx.get("job_id")
+    if not job_id:
+        return
+
+    mapping = {"done": done, "updated_at": datetime.utcnow().isoformat(), **fields}
+    if total is not None:
+        mapping["total"] = total
+
+    key = PROGRESS_KEY.format(job_id=job_id)
+    try:
+        async with ctx["redis"].pipeline(transaction=False) as pipe:
+            pipe.hset(key, mapping={k: str(v) for k, v in mapping.items()})
+            pipe.expire(key, PROGRESS_TTL)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to report progress for job {job_id}: {e}")
+
+
+async def get_progress(redis: Redis, job_id: str) -> Optional[dict]:
+    """Last reported progress of a job, if any."""
+    raw = await redis.hgetall(PROGRESS_KEY.format(job_id=job_id))
+    if not raw:
+        return None
+    progress = {}
+    for key, value in raw.items():
+        key, value = key.decode(), value.decode()
+        progress[key] = int(value) if value.lstrip("-").isdigit() else value
+    return progress
+
+
+async def job_in_flight(redis: Redis, job_id: str) -> bool:
+    """Whether a job is still queued or running."""
+    return await Job(job_id, redis).status() in IN_FLIGHT
+
+
+def job_timings(job: JobDef) -> dict:
+    """Queue wait and run time of a finished job, in seconds."""
+    if not isinstance(job, JobResult):
+        return {"queue_wait": None, "duration": None}
+    return {
+        "queue_wait": (job.start_time - job.enqueue_time).total_seconds(),
+        "duration": (job.finish_time - job.start_time).total_seconds(),
+    }
+
+
+async def record_latency(redis: Redis, job_id: str) -> None:
+    """Add a finished job to its task's latency samples."""
+    try:
+        result = await Job(job_id, redis).result_info()
+        if result is None:
+            return
+        sample = {**job_timings(result), "success": result.success}
+        key = LATENCY_KEY.format(function=result.function)
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.lpush(key, json.dumps(sample))
+            pipe.ltrim(key, 0, LATENCY_SAMPLES - 1)
+            pipe.sadd(LATENCY_FUNCTIONS_KEY, result.function)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to record latency for job {job_id}: {e}")
+
+
+def _percentile(values: list[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile of sorted values."""
+    if not values:
+        return None
+    index = min(len(values) - 1, max(0, round(q * len(values)) - 1))
+    return round(values[index], 3)
+
+
+def _summary(values: list[float]) -> dict:
+    values = sorted(values)
+    return {
+        "p50": _percentile(values, 0.5),
+        "p95": _percentile(values, 0.95),
+        "max": round(values[-1], 3) if values else None,
+    }
+
+
+async def latency_histogram(redis: Redis, function: str) -> dict:
+    """Histogram and percentiles over a task's recent runs."""
+    raw = await redis.lrange(LATENCY_KEY.format(function=function), 0, -1)
+    samples = [json.loads(sample) for sample in raw]
+    durations = [s["duration"] for s in samples if s["duration"] is not None]
+    waits = [s["queue_wait"] for s in samples if s["queue_wait"] is not None]
+
+    buckets = {f"le_{bound}": 0 for bound in LATENCY_BUCKETS}
+    buckets["gt_" + str(LATENCY_BUCKETS[-1])] = 0
+    for duration in durations:
+        for bound in LATENCY_BUCKETS:
+            if duration <= bound:
+                buckets[f"le_{bound}"] += 1
+                break
+        else:
+            buckets["gt_" + str(LATENCY_BUCKETS[-1])] += 1
+
+    return {
+        "samples": len(samples),
+        "failed": sum(1 for s in samples if not s["success"]),
+        "duration": _summary(durations),
+        "queue_wait": _summary(waits),
+        "buckets": buckets,
+    }
+
+
+async def latency_histograms(redis: Redis) -> dict[str, dict]:
+    """Latency histograms for every task that has finished recently."""
+    functions = sorted(f.decode() for f in await redis.smembers(LATENCY_FUNCTIONS_KEY))
+    return {
+        function: await latency_histogram(redis, function) for function in functions
+    }
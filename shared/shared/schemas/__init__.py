@@ -12,9 +12,16 @@ from shared.schemas.signal import (
     SignalBase,
     SignalCreate,
     SignalResponse,
+    SignalDetailResponse,
     SignalListResponse,
 )
 from shared.schemas.stats import OverviewStats, MovieStats
+from shared.schemas.dashboard import (
+    DashboardHome,
+    DashboardMovie,
+    LeaderboardEntry,
+    ScreeningRollupResponse,
+)
 
 __all__ = [
     "MovieBase",
@@ -24,7 +31,12 @@ __all__ = [
     "SignalBase",
     "SignalCreate",
     "SignalResponse",
+    "SignalDetailResponse",
     "SignalListResponse",
     "OverviewStats",
     "MovieStats",
+    "DashboardHome",
+    "DashboardMovie",
+    "LeaderboardEntry",
+    "ScreeningRollupResponse",
 ]
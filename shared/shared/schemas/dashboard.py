@@ -0,0 +1,53 @@
+"""
+Dashboard page schemas.
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from shared.schemas.signal import SignalResponse
+from shared.schemas.stats import MovieStats, OverviewStats
+
+
+class LeaderboardEntry(BaseModel):
+    """Featured movie row on the home page."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    slug: str
+    title: str
+    poster_url: Optional[str] = None
+    signals_count: int = 0
+    reviews_count: int = 0
+    sentiment_score: Optional[float] = None
+    total_screenings: int = 0
+    avg_occupancy: Optional[float] = None
+
+
+class ScreeningRollupResponse(BaseModel):
+    """Screening aggregates for one city or chain."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    dimension_value: str
+    screenings_count: int = 0
+    occupancy_percent: Optional[float] = None
+    avg_price: Optional[float] = None
+
+
+class DashboardHome(BaseModel):
+    """Everything the home page renders."""
+
+    overview: OverviewStats
+    critical_signals: list[SignalResponse]
+    latest_signals: list[SignalResponse]
+    leaderboard: list[LeaderboardEntry]
+
+
+class DashboardMovie(BaseModel):
+    """Everything a movie page renders."""
+
+    stats: MovieStats
+    signals: list[SignalResponse]
+    cities: list[ScreeningRollupResponse]
@@ -68,3 +68,5 @@ class MovieListResponse(BaseModel):
     total: int
     page: int
     per_page: int
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
@@ -65,6 +65,16 @@ class SignalResponse(SignalBase):
     movie_title: Optional[str] = None
     source_name: Optional[str] = None
 
+    # Search relevance (search results only)
+    rank: Optional[float] = None
+
+
+class SignalDetailResponse(SignalResponse):
+    """Schema for a single signal with its keywords and raw source data."""
+
+    keywords: Optional[list] = None
+    raw_data: dict = {}
+
 
 class SignalListResponse(BaseModel):
     """Schema for paginated signal list."""
@@ -73,3 +83,5 @@ class SignalListResponse(BaseModel):
     total: int
     page: int
     per_page: int
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
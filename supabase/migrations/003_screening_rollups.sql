@@ -0,0 +1,34 @@
+-- Screening rollups: per-movie, per-city and per-chain aggregates
+-- rebuilt by the worker from screening_snapshots.
+
+CREATE TABLE screening_rollups (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    movie_id UUID NOT NULL REFERENCES movies(id) ON DELETE CASCADE,
+    dimension VARCHAR(20) NOT NULL,
+    dimension_value VARCHAR(100) NOT NULL,
+    window_days INTEGER NOT NULL,
+    period_start DATE NOT NULL,
+    period_end DATE NOT NULL,
+    screenings_count INTEGER DEFAULT 0,
+    total_seats INTEGER DEFAULT 0,
+    sold_seats INTEGER DEFAULT 0,
+    occupancy_percent FLOAT,
+    morning_screenings INTEGER DEFAULT 0,
+    afternoon_screenings INTEGER DEFAULT 0,
+    evening_screenings INTEGER DEFAULT 0,
+    format_2d INTEGER DEFAULT 0,
+    format_3d INTEGER DEFAULT 0,
+    format_imax INTEGER DEFAULT 0,
+    format_dolby INTEGER DEFAULT 0,
+    min_price INTEGER,
+    max_price INTEGER,
+    avg_price FLOAT,
+    created_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+    CONSTRAINT uq_screening_rollups_key
+        UNIQUE (movie_id, dimension, dimension_value, window_days)
+);
+
+CREATE INDEX idx_screening_rollups_movie ON screening_rollups(movie_id);
+
+CREATE TRIGGER update_screening_rollups_updated_at BEFORE UPDATE ON screening_rollups FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
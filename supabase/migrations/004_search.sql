@@ -0,0 +1,15 @@
+-- Search: trigram indexes for fuzzy movie titles and a Russian full-text
+-- vector on signals (title > summary > content).
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX idx_movies_title_trgm ON movies USING GIN (title gin_trgm_ops);
+CREATE INDEX idx_movies_original_title_trgm ON movies USING GIN (original_title gin_trgm_ops);
+
+ALTER TABLE signals ADD COLUMN search_vector TSVECTOR GENERATED ALWAYS AS (
+    setweight(to_tsvector('russian', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('russian', coalesce(summary, '')), 'B') ||
+    setweight(to_tsvector('russian', coalesce(content, '')), 'C')
+) STORED;
+
+CREATE INDEX idx_signals_search ON signals USING GIN (search_vector);
@@ -0,0 +1,248 @@
+-- Monthly range partitioning for signals (by published_at) and
+-- screening_snapshots (by snapshot_date).
+--
+-- Partitions are named <table>_YYYY_MM. A DEFAULT partition catches rows
+-- outside the pre-created months (e.g. old articles); creating a month
+-- moves its rows out of the default. The worker's maintain_partitions job
+-- keeps future months created and detaches expired ones into the archive
+-- schema.
+--
+-- Primary keys and unique constraints on a partitioned table must include
+-- the partition key, so they become (id, published_at) / (id,
+-- snapshot_date), and external_id is unique per published_at. Collection
+-- already checks external_id before inserting.
+
+CREATE SCHEMA IF NOT EXISTS archive;
+
+-- Create the month partition of `parent` containing `month`. Returns the
+-- partition name, or NULL if it already exists.
+CREATE OR REPLACE FUNCTION create_monthly_partition(parent TEXT, key_column TEXT, month DATE)
+RETURNS TEXT AS $$
+DECLARE
+    start_date DATE := date_trunc('month', month)::date;
+    end_date DATE := (date_trunc('month', month) + INTERVAL '1 month')::date;
+    partition_name TEXT := format('%s_%s', parent, to_char(start_date, 'YYYY_MM'));
+    default_name TEXT := parent || '_default';
+    has_default_rows BOOLEAN := FALSE;
+    column_list TEXT;
+BEGIN
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN NULL;
+    END IF;
+
+    IF to_regclass(default_name) IS NOT NULL THEN
+        EXECUTE format(
+            'SELECT EXISTS (SELECT 1 FROM %I WHERE %I >= %L AND %I < %L)',
+            default_name, key_column, start_date, key_column, end_date
+        ) INTO has_default_rows;
+    END IF;
+
+    IF NOT has_default_rows THEN
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            partition_name, parent, start_date, end_date
+        );
+        RETURN partition_name;
+    END IF;
+
+    -- The default holds rows for this month: detach it, create the month,
+    -- move the rows over and re-attach the default
+    SELECT string_agg(quote_ident(attname), ', ' ORDER BY attnum) INTO column_list
+    FROM pg_attribute
+    WHERE attrelid = parent::regclass AND attnum > 0
+      AND NOT attisdropped AND attgenerated = '';
+
+    EXECUTE format('ALTER TABLE %I DETACH PARTITION %I', parent, default_name);
+    EXECUTE format(
+        'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+        partition_name, parent, start_date, end_date
+    );
+    EXECUTE format(
+        'INSERT INTO %I (%s) SELECT %s FROM %I WHERE %I >= %L AND %I < %L',
+        parent, column_list, column_list, default_name,
+        key_column, start_date, key_column, end_date
+    );
+    EXECUTE format(
+        'DELETE FROM %I WHERE %I >= %L AND %I < %L',
+        default_name, key_column, start_date, key_column, end_date
+    );
+    EXECUTE format('ALTER TABLE %I ATTACH PARTITION %I DEFAULT', parent, default_name);
+    RETURN partition_name;
+END;
+$$ LANGUAGE plpgsql SET timezone = 'UTC';
+
+-- Create partitions from the current month through `months_ahead` months
+-- from now. Returns the names of partitions created.
+CREATE OR REPLACE FUNCTION ensure_monthly_partitions(parent TEXT, key_column TEXT, months_ahead INTEGER)
+RETURNS SETOF TEXT AS $$
+    SELECT created
+    FROM generate_series(
+        date_trunc('month', now()),
+        date_trunc('month', now()) + make_interval(months => months_ahead),
+        INTERVAL '1 month'
+    ) AS month,
+    LATERAL create_monthly_partition(parent, key_column, month::date) AS created
+    WHERE created IS NOT NULL;
+$$ LANGUAGE sql SET timezone = 'UTC';
+
+-- Detach month partitions that end on or before `before` and move them to
+-- the archive schema. Returns the names of partitions detached.
+CREATE OR REPLACE FUNCTION detach_monthly_partitions(parent TEXT, before DATE)
+RETURNS SETOF TEXT AS $$
+DECLARE
+    partition_name TEXT;
+    month DATE;
+BEGIN
+    FOR partition_name IN
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE pg_inherits.inhparent = parent::regclass
+          AND child.relname ~ ('^' || parent || '_\d{4}_\d{2}$')
+        ORDER BY child.relname
+    LOOP
+        month := to_date(right(partition_name, 7), 'YYYY_MM');
+        IF month + INTERVAL '1 month' <= before THEN
+            EXECUTE format('ALTER TABLE %I DETACH PARTITION %I', parent, partition_name);
+            EXECUTE format('ALTER TABLE %I SET SCHEMA archive', partition_name);
+            RETURN NEXT partition_name;
+        END IF;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql SET timezone = 'UTC';
+
+-- Signals
+
+ALTER TABLE signals RENAME TO signals_unpartitioned;
+ALTER TABLE signals_unpartitioned RENAME CONSTRAINT signals_pkey TO signals_unpartitioned_pkey;
+DROP INDEX idx_signals_movie, idx_signals_type, idx_signals_importance,
+    idx_signals_published_at, idx_signals_search;
+
+UPDATE signals_unpartitioned SET published_at = created_at WHERE published_at IS NULL;
+
+CREATE TABLE signals (
+    id UUID NOT NULL DEFAULT uuid_generate_v4(),
+    source_id UUID REFERENCES sources(id) ON DELETE SET NULL,
+    movie_id UUID REFERENCES movies(id) ON DELETE SET NULL,
+    external_id VARCHAR(500) NOT NULL,
+    title VARCHAR(500) NOT NULL,
+    content TEXT,
+    summary TEXT,
+    source_url VARCHAR(500) NOT NULL,
+    image_url VARCHAR(500),
+    author VARCHAR(200),
+    signal_type VARCHAR(50),
+    importance VARCHAR(20),
+    sentiment VARCHAR(20),
+    sentiment_score FLOAT,
+    rating FLOAT,
+    platform_rating VARCHAR(20),
+    views_count INTEGER,
+    likes_count INTEGER,
+    comments_count INTEGER,
+    shares_count INTEGER,
+    raw_data JSONB DEFAULT '{}',
+    published_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    is_classified BOOLEAN DEFAULT FALSE,
+    is_published BOOLEAN DEFAULT TRUE,
+    is_featured BOOLEAN DEFAULT FALSE,
+    keywords JSONB,
+    embedding JSONB,
+    created_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('russian', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('russian', coalesce(summary, '')), 'B') ||
+        setweight(to_tsvector('russian', coalesce(content, '')), 'C')
+    ) STORED,
+    PRIMARY KEY (id, published_at),
+    CONSTRAINT uq_signals_external_id UNIQUE (external_id, published_at)
+) PARTITION BY RANGE (published_at);
+
+CREATE TABLE signals_default PARTITION OF signals DEFAULT;
+
+SELECT create_monthly_partition('signals', 'published_at', month::date)
+FROM generate_series(
+    date_trunc('month', coalesce((SELECT min(published_at) FROM signals_unpartitioned), now())),
+    date_trunc('month', now()) + INTERVAL '3 months',
+    INTERVAL '1 month'
+) AS month;
+
+INSERT INTO signals (
+    id, source_id, movie_id, external_id, title, content, summary, source_url,
+    image_url, author, signal_type, importance, sentiment, sentiment_score,
+    rating, platform_rating, views_count, likes_count, comments_count,
+    shares_count, raw_data, published_at, is_classified, is_published,
+    is_featured, keywords, embedding, created_at, updated_at
+)
+SELECT
+    id, source_id, movie_id, external_id, title, content, summary, source_url,
+    image_url, author, signal_type, importance, sentiment, sentiment_score,
+    rating, platform_rating, views_count, likes_count, comments_count,
+    shares_count, raw_data, published_at, is_classified, is_published,
+    is_featured, keywords, embedding, created_at, updated_at
+FROM signals_unpartitioned;
+
+DROP TABLE signals_unpartitioned;
+
+CREATE INDEX idx_signals_movie ON signals(movie_id);
+CREATE INDEX idx_signals_type ON signals(signal_type);
+CREATE INDEX idx_signals_importance ON signals(importance);
+CREATE INDEX idx_signals_published_at ON signals(published_at);
+CREATE INDEX idx_signals_search ON signals USING GIN (search_vector);
+
+CREATE TRIGGER update_signals_updated_at BEFORE UPDATE ON signals FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+-- Screening snapshots
+
+ALTER TABLE screening_snapshots RENAME TO screening_snapshots_unpartitioned;
+ALTER TABLE screening_snapshots_unpartitioned RENAME CONSTRAINT screening_snapshots_pkey TO screening_snapshots_unpartitioned_pkey;
+DROP INDEX idx_screening_movie, idx_screening_city, idx_screening_date;
+
+CREATE TABLE screening_snapshots (
+    id UUID NOT NULL DEFAULT uuid_generate_v4(),
+    movie_id UUID NOT NULL REFERENCES movies(id) ON DELETE CASCADE,
+    city VARCHAR(100) NOT NULL,
+    cinema_chain VARCHAR(100),
+    snapshot_date DATE NOT NULL,
+    snapshot_time TIMESTAMPTZ NOT NULL,
+    screenings_count INTEGER DEFAULT 0,
+    cinemas_count INTEGER DEFAULT 0,
+    halls_count INTEGER DEFAULT 0,
+    avg_occupancy_percent FLOAT,
+    total_seats INTEGER,
+    sold_seats INTEGER,
+    morning_screenings INTEGER DEFAULT 0,
+    afternoon_screenings INTEGER DEFAULT 0,
+    evening_screenings INTEGER DEFAULT 0,
+    format_2d INTEGER DEFAULT 0,
+    format_3d INTEGER DEFAULT 0,
+    format_imax INTEGER DEFAULT 0,
+    format_dolby INTEGER DEFAULT 0,
+    min_price INTEGER,
+    max_price INTEGER,
+    avg_price FLOAT,
+    raw_data JSONB DEFAULT '{}',
+    created_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+    PRIMARY KEY (id, snapshot_date)
+) PARTITION BY RANGE (snapshot_date);
+
+CREATE TABLE screening_snapshots_default PARTITION OF screening_snapshots DEFAULT;
+
+SELECT create_monthly_partition('screening_snapshots', 'snapshot_date', month::date)
+FROM generate_series(
+    date_trunc('month', coalesce((SELECT min(snapshot_date) FROM screening_snapshots_unpartitioned), now())),
+    date_trunc('month', now()) + INTERVAL '3 months',
+    INTERVAL '1 month'
+) AS month;
+
+INSERT INTO screening_snapshots SELECT * FROM screening_snapshots_unpartitioned;
+
+DROP TABLE screening_snapshots_unpartitioned;
+
+CREATE INDEX idx_screening_movie ON screening_snapshots(movie_id);
+CREATE INDEX idx_screening_city ON screening_snapshots(city);
+CREATE INDEX idx_screening_date ON screening_snapshots(snapshot_date);
+
+CREATE TRIGGER update_screening_snapshots_updated_at BEFORE UPDATE ON screening_snapshots FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
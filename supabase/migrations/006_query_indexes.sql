@@ -0,0 +1,57 @@
+-- Indexes shaped around the repository queries. Replaces single-column
+-- indexes that the planner could only combine with a sort or heap filter.
+--
+-- Signal indexes are created on the partitioned parent and cascade to every
+-- partition (including ones created later). Building them locks writes
+-- for the duration, so run this off-peak.
+
+-- Signals
+
+-- Feed, counts, stats and trends: published signals in a time window,
+-- newest first with id as the keyset tie-breaker. The INCLUDE columns let
+-- counts and group-bys over a window run as index-only scans.
+CREATE INDEX idx_signals_feed ON signals (published_at DESC, id DESC)
+    INCLUDE (movie_id, signal_type, importance, sentiment, sentiment_score)
+    WHERE is_published;
+
+-- Critical signals (dashboard and /signals/critical): a small slice
+CREATE INDEX idx_signals_critical ON signals (published_at DESC, id DESC)
+    WHERE is_published AND importance = 'critical';
+
+-- Per-movie feed, get_for_movie and per-movie trends
+CREATE INDEX idx_signals_movie_published ON signals (movie_id, published_at DESC, id DESC);
+DROP INDEX idx_signals_movie;
+
+-- Classification queue: oldest unclassified first
+CREATE INDEX idx_signals_unclassified ON signals (created_at)
+    WHERE NOT is_classified;
+
+-- Low-cardinality columns; always combined with a time window above
+DROP INDEX idx_signals_type;
+DROP INDEX idx_signals_importance;
+
+-- Screening snapshots
+
+-- A movie's recent snapshots, newest first; screenings_count covers the
+-- per-movie screenings trend
+CREATE INDEX idx_screening_movie_date ON screening_snapshots
+    (movie_id, snapshot_date DESC, snapshot_time DESC)
+    INCLUDE (screenings_count);
+DROP INDEX idx_screening_movie;
+DROP INDEX idx_screening_city;
+
+-- Movies
+
+-- Active movie listing in (release_date, id) keyset order
+CREATE INDEX idx_movies_active_release ON movies (release_date DESC NULLS LAST, id DESC)
+    WHERE is_active;
+
+-- Featured movies and the leaderboard
+CREATE INDEX idx_movies_featured_signals ON movies (signals_count DESC, id)
+    WHERE is_active AND is_featured;
+
+-- Sources
+
+-- Active sources of a type (collection)
+CREATE INDEX idx_sources_active_type ON sources (type) WHERE is_active;
+DROP INDEX idx_sources_type;
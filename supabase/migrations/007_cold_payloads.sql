@@ -0,0 +1,69 @@
+-- Hot/cold split: move raw source payloads and embeddings out of signals
+-- and screening_snapshots into side tables read only by detail views.
+--
+-- Payloads are keyed by the owning row's id and partitioned by the same
+-- month key, so partition maintenance creates and detaches them together.
+-- The payload column holds JSON prefixed with its encoding: 'z' for
+-- zlib-compressed (written by the application), 'j' for plain JSON (rows
+-- moved here, which TOAST compresses).
+--
+-- Dropping the columns does not shrink existing rows; the space is
+-- reclaimed as rows are rewritten, or right away with VACUUM FULL on each
+-- partition (which locks it).
+
+-- Signals
+
+CREATE TABLE signal_payloads (
+    id UUID NOT NULL,
+    published_at TIMESTAMPTZ NOT NULL,
+    payload BYTEA NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+    PRIMARY KEY (id, published_at)
+) PARTITION BY RANGE (published_at);
+
+CREATE TABLE signal_payloads_default PARTITION OF signal_payloads DEFAULT;
+
+SELECT create_monthly_partition('signal_payloads', 'published_at', month::date)
+FROM generate_series(
+    date_trunc('month', coalesce((SELECT min(published_at) FROM signals), now())),
+    date_trunc('month', now()) + INTERVAL '3 months',
+    INTERVAL '1 month'
+) AS month;
+
+INSERT INTO signal_payloads (id, published_at, payload)
+SELECT id, published_at,
+       '\x6a'::bytea || convert_to(
+           jsonb_strip_nulls(jsonb_build_object('raw_data', raw_data, 'embedding', embedding))::text,
+           'UTF8'
+       )
+FROM signals
+WHERE raw_data <> '{}' OR embedding IS NOT NULL;
+
+ALTER TABLE signals DROP COLUMN raw_data, DROP COLUMN embedding;
+
+-- Screening snapshots
+
+CREATE TABLE screening_payloads (
+    id UUID NOT NULL,
+    snapshot_date DATE NOT NULL,
+    payload BYTEA NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+    PRIMARY KEY (id, snapshot_date)
+) PARTITION BY RANGE (snapshot_date);
+
+CREATE TABLE screening_payloads_default PARTITION OF screening_payloads DEFAULT;
+
+SELECT create_monthly_partition('screening_payloads', 'snapshot_date', month::date)
+FROM generate_series(
+    date_trunc('month', coalesce((SELECT min(snapshot_date) FROM screening_snapshots), now())),
+    date_trunc('month', now()) + INTERVAL '3 months',
+    INTERVAL '1 month'
+) AS month;
+
+INSERT INTO screening_payloads (id, snapshot_date, payload)
+SELECT id, snapshot_date,
+       '\x6a'::bytea || convert_to(jsonb_build_object('raw_data', raw_data)::text, 'UTF8')
+FROM screening_snapshots
+WHERE raw_data <> '{}';
+
+ALTER TABLE screening_snapshots DROP COLUMN raw_data;
@@ -0,0 +1,43 @@
+-- Signal retention: daily rollups that outlive pruned signals, archive
+-- tables for policies that keep pruned rows, and an index for finding a
+-- source's oldest signals.
+--
+-- Rollups are additive: each pruned batch (and each month partition
+-- detached by maintenance) adds its counts, so together with the live
+-- signals they cover the full history.
+
+CREATE TABLE signal_daily_rollups (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    day DATE NOT NULL,
+    movie_id UUID REFERENCES movies(id) ON DELETE CASCADE,
+    source_type VARCHAR(50),
+    signal_type VARCHAR(50),
+    importance VARCHAR(20),
+    sentiment VARCHAR(20),
+    signals_count INTEGER DEFAULT 0 NOT NULL,
+    sentiment_sum FLOAT DEFAULT 0 NOT NULL,
+    sentiment_count INTEGER DEFAULT 0 NOT NULL,
+    views_count BIGINT DEFAULT 0 NOT NULL,
+    likes_count BIGINT DEFAULT 0 NOT NULL,
+    comments_count BIGINT DEFAULT 0 NOT NULL,
+    shares_count BIGINT DEFAULT 0 NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+    CONSTRAINT uq_signal_daily_rollups_key UNIQUE NULLS NOT DISTINCT
+        (day, movie_id, source_type, signal_type, importance, sentiment)
+);
+
+CREATE INDEX idx_signal_daily_rollups_movie_day ON signal_daily_rollups (movie_id, day DESC);
+
+CREATE TRIGGER update_signal_daily_rollups_updated_at BEFORE UPDATE ON signal_daily_rollups FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+-- Pruned rows kept by archive policies. Plain tables: nothing reads them
+-- on the hot path.
+CREATE TABLE archive.pruned_signals (LIKE signals INCLUDING DEFAULTS);
+ALTER TABLE archive.pruned_signals DROP COLUMN search_vector;
+ALTER TABLE archive.pruned_signals ADD COLUMN pruned_at TIMESTAMPTZ DEFAULT NOW() NOT NULL;
+
+CREATE TABLE archive.pruned_signal_payloads (LIKE signal_payloads INCLUDING DEFAULTS);
+
+-- A source's signals, oldest first (retention batches)
+CREATE INDEX idx_signals_source_published ON signals (source_id, published_at);
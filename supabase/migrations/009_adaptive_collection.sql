@@ -0,0 +1,15 @@
+-- Adaptive collection: each source keeps an EWMA of new items per hour and
+-- the time of its next check, which the scheduler polls for due sources.
+-- check_frequency_hours stays as the baseline the interval adapts around.
+
+ALTER TABLE sources ADD COLUMN change_rate DOUBLE PRECISION;
+ALTER TABLE sources ADD COLUMN last_new_items INTEGER;
+ALTER TABLE sources ADD COLUMN next_check_at TIMESTAMPTZ;
+
+-- Keep the current schedule until each source has been observed
+UPDATE sources
+SET next_check_at = last_checked_at + make_interval(hours => check_frequency_hours)
+WHERE last_checked_at IS NOT NULL;
+
+-- Due active sources (NULL: never checked, due now)
+CREATE INDEX idx_sources_due ON sources (next_check_at NULLS FIRST) WHERE is_active;
@@ -0,0 +1,22 @@
+-- Global uniqueness of signal external_ids.
+--
+-- On the partitioned signals table external_id is only unique per
+-- published_at, and collectors stamp published_at with the collection
+-- time, so the constraint never catches a re-collected item. Inserting a
+-- signal first claims its external_id here, in the same transaction: a
+-- concurrent claim of the same id waits for the first to commit and then
+-- finds the conflict.
+--
+-- Claims outlive pruned and detached signals, so retention never lets an
+-- item already counted in signal_daily_rollups be collected again.
+
+CREATE TABLE signal_external_ids (
+    external_id VARCHAR(500) PRIMARY KEY,
+    created_at TIMESTAMPTZ DEFAULT NOW() NOT NULL
+);
+
+INSERT INTO signal_external_ids (external_id)
+SELECT external_id FROM signals
+UNION
+SELECT external_id FROM archive.pruned_signals
+ON CONFLICT DO NOTHING;
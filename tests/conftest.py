@@ -0,0 +1,287 @@
+"""
+Database fixtures.
+
+Tests that need Postgres run against the database in DATABASE_URL, which
+must have the supabase migrations applied, and are skipped when it is not
+set. Each test module gets one connection inside a transaction that is
+rolled back at teardown, so seeded rows never persist.
+
+Benchmarks record their measurements with the `benchmark` fixture; they
+are printed in a summary at the end of the run and kept as properties in
+JUnit XML reports.
+"""
+
+import asyncio
+import json
+import os
+import sys
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+# The shared package is installed in the service images; make it
+# importable from a checkout as well
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "shared"))
+
+from sqlalchemy import event, text  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+
+from shared.db.partitions import months_before  # noqa: E402
+
+DATABASE_URL = os.environ.get("DATABASE_URL")
+
+requires_database = pytest.mark.skipif(
+    not DATABASE_URL, reason="DATABASE_URL is not set (needs a migrated database)"
+)
+
+SEED_URL = "https://seed.example"
+
+# (test, measurements) recorded by benchmarks during the run
+BENCHMARKS: list[tuple[str, dict]] = []
+
+
+class Database:
+    """A connection in a rolled-back transaction, driven by its own loop."""
+
+    def __init__(self, url: str):
+        self.loop = asyncio.new_event_loop()
+        self.engine = create_async_engine(url)
+        self.connection = self.run(self.engine.connect())
+        self.transaction = self.run(self.connection.begin())
+
+    def run(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def session(self) -> AsyncSession:
+        """A session on the test transaction; its commits are savepoints."""
+        return AsyncSession(
+            bind=self.connection,
+            join_transaction_mode="create_savepoint",
+            expire_on_commit=False,
+        )
+
+    @contextmanager
+    def capture(self):
+        """Collect (statement, parameters) of every statement executed."""
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        sync_connection = self.connection.sync_connection
+        event.listen(sync_connection, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(sync_connection, "before_cursor_execute", record)
+
+    def close(self) -> None:
+        self.run(self.transaction.rollback())
+        self.run(self.connection.close())
+        self.run(self.engine.dispose())
+        self.loop.close()
+
+
+def plan_nodes(plan: dict):
+    """A plan node and all nodes below it."""
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def explain(database: Database, call) -> list[dict]:
+    """Run `call(session)` and EXPLAIN every statement it executed."""
+
+    async def run():
+        async with database.session() as session:
+            with database.capture() as statements:
+                await call(session)
+            plans = []
+            for statement, parameters in statements:
+                if statement.lstrip().upper().startswith("EXPLAIN"):
+                    continue
+                result = await database.connection.exec_driver_sql(
+                    f"EXPLAIN (FORMAT JSON) {statement}", parameters
+                )
+                plan = result.scalar()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                plans.append(plan[0]["Plan"])
+            return plans
+
+    return database.run(run())
+
+
+async def result_bytes(connection, statement: str, parameters) -> int:
+    """Size of a statement's result rows in Postgres' text encoding."""
+    result = await connection.exec_driver_sql(
+        f"SELECT coalesce(sum(octet_length(r::text)), 0) FROM ({statement}) AS r",
+        parameters,
+    )
+    return int(result.scalar())
+
+
+async def seed(
+    connection,
+    *,
+    movies: int,
+    sources: int,
+    signals: int,
+    snapshots: int,
+    days: int = 90,
+) -> None:
+    """
+    Insert synthetic movies, sources, signals and screening snapshots.
+
+    Signals are spread evenly over the last `days` days: 2% critical, 18%
+    notable, 5% unclassified, a fifth not linked to a movie. Titles carry
+    one of ten common words, and one in a thousand the rare word
+    "премьера", for search. Snapshots
+    cover the last `days` days for every movie. Tables are analyzed so
+    the planner sees the seeded volume.
+    """
+    today = date.today()
+    first_month = months_before(today - timedelta(days=days), 0)
+    for parent, key in (
+        ("signals", "published_at"),
+        ("screening_snapshots", "snapshot_date"),
+    ):
+        await connection.execute(
+            text(
+                "SELECT create_monthly_partition(:parent, :key, month::date) "
+                "FROM generate_series(CAST(:first AS date), "
+                "date_trunc('month', now()), INTERVAL '1 month') AS month"
+            ),
+            {"parent": parent, "key": key, "first": first_month},
+        )
+
+    await connection.execute(text(f"""
+            INSERT INTO movies (
+                title, slug, release_date, is_active, is_featured, signals_count
+            )
+            SELECT
+                'Seed movie ' || i,
+                'seed-' || i,
+                current_date - 720 + (i * 1440 / {int(movies)}),
+                i % 10 <> 0,
+                i % 20 = 0,
+                (i * 7919) % 5000
+            FROM generate_series(1, {int(movies)}) AS i
+            """))
+    await connection.execute(text(f"""
+            INSERT INTO sources (name, url, type, check_frequency_hours, is_active)
+            SELECT
+                'Seed source ' || i,
+                '{SEED_URL}/' || i,
+                (ARRAY['news_site', 'kinopoisk', 'afisha', 'telegram',
+                       'cinema_chain'])[1 + i % 5],
+                1 + i % 12,
+                i % 10 <> 0
+            FROM generate_series(1, {int(sources)}) AS i
+            """))
+    await connection.execute(text(f"""
+            WITH movie_ids AS (
+                SELECT array_agg(id ORDER BY slug) AS ids
+                FROM movies WHERE slug LIKE 'seed-%'
+            ),
+            source_ids AS (
+                SELECT array_agg(id ORDER BY url) AS ids
+                FROM sources WHERE url LIKE '{SEED_URL}/%'
+            ),
+            seeded AS (
+                SELECT
+                    i,
+                    now() - make_interval(
+                        secs => i::float / {int(signals)} * {int(days)} * 86400
+                    ) AS at
+                FROM generate_series(1, {int(signals)}) AS i
+            )
+            INSERT INTO signals (
+                source_id, movie_id, external_id, title, source_url,
+                signal_type, importance, sentiment, sentiment_score,
+                published_at, is_classified, is_published, created_at
+            )
+            SELECT
+                source_ids.ids[1 + i % cardinality(source_ids.ids)],
+                CASE WHEN i % 5 = 0 THEN NULL
+                     ELSE movie_ids.ids[1 + (i * 7919) % cardinality(movie_ids.ids)]
+                END,
+                'seed:' || i,
+                'Seed signal ' || i || ' '
+                    || (ARRAY['рецензия', 'трейлер', 'сборы', 'актёр', 'режиссёр',
+                              'фестиваль', 'прокат', 'сиквел', 'зрители',
+                              'критики'])[1 + (i * 31) % 10]
+                    || CASE WHEN i % 1000 = 0 THEN ' премьера' ELSE '' END,
+                '{SEED_URL}/signals/' || i,
+                (ARRAY['review', 'news', 'rating_change', 'promotion',
+                       'box_office'])[1 + i % 5],
+                CASE WHEN i % 50 = 0 THEN 'critical'
+                     WHEN i % 5 = 0 THEN 'notable'
+                     ELSE 'minor'
+                END,
+                (ARRAY['positive', 'neutral', 'negative'])[1 + i % 3],
+                ((i % 21) - 10) / 10.0,
+                at,
+                i % 20 <> 0,
+                TRUE,
+                at
+            FROM seeded, movie_ids, source_ids
+            """))
+    await connection.execute(text(f"""
+            WITH movie_ids AS (
+                SELECT array_agg(id ORDER BY slug) AS ids
+                FROM movies WHERE slug LIKE 'seed-%'
+            )
+            INSERT INTO screening_snapshots (
+                movie_id, city, cinema_chain, snapshot_date, snapshot_time,
+                screenings_count, cinemas_count, avg_occupancy_percent
+            )
+            SELECT
+                movie_ids.ids[1 + i % cardinality(movie_ids.ids)],
+                (ARRAY['Москва', 'Санкт-Петербург', 'Казань', 'Екатеринбург'])
+                    [1 + (i / cardinality(movie_ids.ids)) % 4],
+                (ARRAY['Karo', 'Cinema Park', 'Formula Kino'])[1 + i % 3],
+                current_date - (i * {int(days)} / {int(snapshots)}),
+                now() - make_interval(days => i * {int(days)} / {int(snapshots)}),
+                i % 40,
+                i % 12,
+                (i % 100)::float
+            FROM generate_series(1, {int(snapshots)}) AS i, movie_ids
+            """))
+    await connection.execute(
+        text("ANALYZE movies, sources, signals, screening_snapshots")
+    )
+
+
+@pytest.fixture(scope="module")
+def database():
+    if not DATABASE_URL:
+        pytest.skip("DATABASE_URL is not set (needs a migrated database)")
+    db = Database(DATABASE_URL)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def benchmark(request, record_property):
+    """Record a benchmark's measurements: `benchmark(rows=..., bytes=...)`."""
+
+    def record(**measurements):
+        BENCHMARKS.append((request.node.name, measurements))
+        for name, value in measurements.items():
+            record_property(name, value)
+
+    return record
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not BENCHMARKS:
+        return
+    terminalreporter.section("benchmarks")
+    for name, measurements in BENCHMARKS:
+        values = ", ".join(f"{key}={value}" for key, value in measurements.items())
+        terminalreporter.write_line(f"{name}: {values}")
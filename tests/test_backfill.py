@@ -0,0 +1,94 @@
+"""
+Rollup rebuilds after a backfill cover the dates it loaded.
+"""
+
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+
+from services.worker.app import backfill
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Record the aggregate tasks rebuild_rollups runs, in order."""
+    recorded = []
+
+    def task(name):
+        async def run(ctx, **kwargs):
+            recorded.append((name, kwargs))
+
+        return run
+
+    async def redis_pool():
+        return object()
+
+    async def publish(redis, *namespaces):
+        recorded.append(("invalidate", namespaces))
+
+    monkeypatch.setattr(backfill, "get_redis_pool", redis_pool)
+    monkeypatch.setattr(backfill, "publish_invalidation", publish)
+    for name in (
+        "update_movie_metrics",
+        "aggregate_screenings",
+        "maintain_partitions",
+        "prune_signals",
+    ):
+        monkeypatch.setattr(backfill, name, task(name))
+    return recorded
+
+
+def _checkpoint(tmp_path, target, first=None, last=None):
+    checkpoint = backfill.Checkpoint(str(tmp_path / "load.json"), target, "load.csv")
+    checkpoint.cover(first, last)
+    return checkpoint
+
+
+def test_checkpoint_keeps_loaded_range(tmp_path):
+    checkpoint = _checkpoint(tmp_path, "screenings", date(2024, 3, 5), date(2024, 3, 9))
+    checkpoint.cover(date(2024, 1, 20), date(2024, 2, 1))
+    checkpoint.cover(None, None)
+    checkpoint.save()
+
+    loaded = backfill.Checkpoint.load(checkpoint.path, "screenings", "load.csv")
+    assert (loaded.first_date, loaded.last_date) == ("2024-01-20", "2024-03-09")
+
+
+def test_historical_screenings_rebuild_their_window(tmp_path, calls):
+    first = date.today() - timedelta(days=59)
+    checkpoint = _checkpoint(tmp_path, "screenings", first, first + timedelta(days=10))
+
+    asyncio.run(backfill.rebuild_rollups("screenings", checkpoint))
+
+    aggregates = [kwargs for name, kwargs in calls if name == "aggregate_screenings"]
+    # The loaded dates first, then the regular window for movie columns
+    assert aggregates == [{"days": 60}, {}]
+
+
+def test_recent_screenings_rebuild_the_regular_window(tmp_path, calls):
+    checkpoint = _checkpoint(tmp_path, "screenings", date.today(), date.today())
+
+    asyncio.run(backfill.rebuild_rollups("screenings", checkpoint))
+
+    assert [kwargs for name, kwargs in calls if name == "aggregate_screenings"] == [{}]
+
+
+def test_old_signals_are_rolled_up(tmp_path, calls):
+    first = date.today() - timedelta(days=400)
+    checkpoint = _checkpoint(tmp_path, "signals", first, date.today())
+
+    asyncio.run(backfill.rebuild_rollups("signals", checkpoint))
+
+    names = [name for name, _ in calls]
+    assert names[:3] == ["maintain_partitions", "prune_signals", "update_movie_metrics"]
+    assert "aggregate_screenings" not in names
+
+
+def test_recent_signals_skip_retention(tmp_path, calls):
+    checkpoint = _checkpoint(tmp_path, "signals", date.today(), date.today())
+
+    asyncio.run(backfill.rebuild_rollups("signals", checkpoint))
+
+    assert [name for name, _ in calls][0] == "update_movie_metrics"
+    assert "prune_signals" not in [name for name, _ in calls]
@@ -0,0 +1,131 @@
+"""
+Response cache: keys, ETags, invalidation and response_model validation.
+
+Runs against the in-process tier only (no Redis).
+"""
+
+from itertools import count
+from typing import Optional
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from services.api.app.cache import CachedResponse, cached, response_cache
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    price: Optional[float] = None
+
+
+class ItemList(BaseModel):
+    items: list[Item]
+    total: int
+
+
+calls = count()
+router = APIRouter()
+
+
+@router.get("/items", response_model=ItemList)
+@cached("movies", ttl=60)
+async def list_items(
+    q: Optional[str] = None, fields: Optional[str] = None, broken: bool = False
+):
+    version = next(calls)
+    if broken:
+        return {"items": [{"id": "not a number", "name": "x"}], "total": 1}
+    if fields:
+        return {"items": [{"id": 1, "name": f"item {version}"}], "total": 1}
+    return {
+        "items": [{"id": 1, "name": f"item {version}", "price": 10, "secret": "x"}],
+        "total": 1,
+    }
+
+
+app = FastAPI()
+app.include_router(router)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    response_cache._local.clear()
+    response_cache.versions = {ns: 0 for ns in response_cache.versions}
+    yield
+    response_cache._local.clear()
+
+
+@pytest.fixture
+def client():
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_key_ignores_parameter_order_and_unset_parameters():
+    key = response_cache.key("/items", {"q": "a", "page": 1}, ("movies",))
+    assert key == response_cache.key(
+        "/items", {"page": 1, "q": "a", "fields": None}, ("movies",)
+    )
+    assert key != response_cache.key("/items", {"q": "b", "page": 1}, ("movies",))
+    assert key != response_cache.key("/other", {"q": "a", "page": 1}, ("movies",))
+
+
+def test_key_follows_namespace_versions():
+    key = response_cache.key("/items", {}, ("movies", "signals"))
+    response_cache._apply({"signals": 3})
+    assert response_cache.key("/items", {}, ("movies", "signals")) != key
+    assert response_cache.key("/items", {}, ("movies",)) == key.replace("#v0.0", "#v0")
+
+
+def test_version_bump_drops_dependent_entries():
+    response_cache._store_local("a", CachedResponse(b"{}", '"a"', ("movies",)), 60)
+    response_cache._store_local("b", CachedResponse(b"{}", '"b"', ("signals",)), 60)
+
+    response_cache._apply({"movies": 1})
+
+    assert list(response_cache._local) == ["b"]
+
+
+def test_etag_and_not_modified(client):
+    first = client.get("/items")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    cached_response = client.get("/items", headers={"If-None-Match": etag})
+    assert cached_response.status_code == 304
+    assert cached_response.headers["etag"] == etag
+
+    # Another tag in the list still matches
+    listed = client.get("/items", headers={"If-None-Match": f'"other", {etag}'})
+    assert listed.status_code == 304
+
+
+def test_invalidation_serves_a_new_body(client):
+    first = client.get("/items")
+    assert client.get("/items").json() == first.json()
+
+    response_cache._apply({"movies": 1})
+
+    second = client.get("/items", headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 200
+    assert second.json() != first.json()
+    assert second.headers["etag"] != first.headers["etag"]
+
+
+def test_response_model_filters_undeclared_fields(client):
+    item = client.get("/items").json()["items"][0]
+    assert "secret" not in item
+    assert item["price"] == 10.0
+
+
+def test_trimmed_payload_keeps_only_its_fields(client):
+    item = client.get("/items", params={"fields": "id,name"}).json()["items"][0]
+    assert set(item) == {"id", "name"}
+
+
+def test_invalid_result_is_a_server_error(client):
+    response = client.get("/items", params={"broken": True})
+    assert response.status_code == 500
+    assert not response_cache._local
@@ -0,0 +1,139 @@
+"""
+Hot/cold split benchmark: rows per page and buffers per scan.
+
+Builds the signals layout from before migration 007 (raw_data and
+embedding inline) and the current one (hot row plus a payload table)
+from the same seeded signals, then records, for each, rows per heap page
+and heap size as GET /admin/storage reports them, and the buffers a
+stats-style scan of the last week touches with their hit rate. Fewer
+buffers per scan is what lets more of the hot table stay in
+shared_buffers; on a warm test database both layouts hit the cache, so
+the buffer counts are the comparison that carries over.
+"""
+
+import json
+
+import pytest
+from sqlalchemy import text
+
+from shared.db.storage import table_storage
+from tests.conftest import requires_database, seed
+
+pytestmark = requires_database
+
+SIGNALS = 100_000
+EMBEDDING_DIMENSIONS = 256
+
+INLINE = "bench_signals_inline"
+HOT = "bench_signals_hot"
+PAYLOADS = "bench_signal_payloads"
+
+SCAN_SQL = """
+    SELECT signal_type, count(*), avg(sentiment_score)
+    FROM {table}
+    WHERE published_at >= now() - INTERVAL '7 days'
+    GROUP BY signal_type
+"""
+
+
+@pytest.fixture(scope="module")
+def layouts(database):
+    async def prepare():
+        connection = database.connection
+        await seed(
+            connection,
+            movies=200,
+            sources=20,
+            signals=SIGNALS,
+            snapshots=0,
+            days=30,
+        )
+        # Before: a ~1 kB raw source record and an embedding on every row
+        await connection.execute(text(f"""
+                CREATE TABLE {INLINE} AS
+                SELECT
+                    signals.*,
+                    jsonb_build_object(
+                        'source', 'seed',
+                        'html', (
+                            SELECT string_agg(md5(signals.external_id || n), '')
+                            FROM generate_series(1, 30) AS n
+                        )
+                    ) AS raw_data,
+                    (
+                        -- Correlated, so each row gets its own vector
+                        SELECT jsonb_agg(round(random()::numeric, 6))
+                        FROM generate_series(1, {EMBEDDING_DIMENSIONS})
+                        WHERE signals.id IS NOT NULL
+                    ) AS embedding
+                FROM signals
+                WHERE external_id LIKE 'seed:%'
+                """))
+        # After: the same rows without them, plus the payload table
+        columns = [
+            name
+            for name in (
+                await connection.execute(text(f"SELECT * FROM {INLINE} LIMIT 0"))
+            ).keys()
+            if name not in ("raw_data", "embedding")
+        ]
+        await connection.execute(
+            text(f"CREATE TABLE {HOT} AS SELECT {', '.join(columns)} FROM {INLINE}")
+        )
+        await connection.execute(text(f"""
+                CREATE TABLE {PAYLOADS} AS
+                SELECT
+                    id,
+                    published_at,
+                    '\\x6a'::bytea || convert_to(
+                        jsonb_build_object(
+                            'raw_data', raw_data, 'embedding', embedding
+                        )::text,
+                        'UTF8'
+                    ) AS payload
+                FROM {INLINE}
+                """))
+        await connection.execute(text(f"ANALYZE {INLINE}, {HOT}, {PAYLOADS}"))
+
+    database.run(prepare())
+
+    async def measure(table: str) -> dict:
+        async with database.session() as session:
+            storage = await table_storage(session, table)
+            measured = {
+                "rows_per_page": storage["rows_per_page"],
+                "heap_bytes": storage["heap_bytes"],
+                "table_bytes": storage["table_bytes"],
+            }
+            if table == PAYLOADS:
+                # Only detail views read payloads, one row at a time
+                return measured
+            result = await session.execute(
+                text(
+                    "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) "
+                    + SCAN_SQL.format(table=table)
+                )
+            )
+            plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        plan = plan[0]["Plan"]
+        hit, read = plan["Shared Hit Blocks"], plan["Shared Read Blocks"]
+        measured["scan_buffers"] = hit + read
+        measured["scan_hit_rate"] = round(hit / (hit + read), 4) if hit + read else None
+        return measured
+
+    return {table: database.run(measure(table)) for table in (INLINE, HOT, PAYLOADS)}
+
+
+@pytest.mark.parametrize("table", [INLINE, HOT, PAYLOADS])
+def test_layout(layouts, benchmark, table):
+    benchmark(table=table, signals=SIGNALS, **layouts[table])
+
+
+def test_hot_rows_pack_denser(layouts):
+    assert layouts[HOT]["rows_per_page"] >= 2 * layouts[INLINE]["rows_per_page"]
+
+
+def test_scans_touch_fewer_buffers(layouts):
+    assert layouts[HOT]["scan_buffers"] < layouts[INLINE]["scan_buffers"] / 2
@@ -0,0 +1,179 @@
+"""
+Adaptive collection: change-rate EWMA, interval clamps and the fetch plan.
+"""
+
+import math
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from shared.analytics.collection import (
+    BUSY_RATE,
+    MAX_BACKOFF,
+    MAX_INTERVAL_HOURS,
+    MAX_SPEEDUP,
+    MIN_INTERVAL_HOURS,
+    RATE_TAU_HOURS,
+    TARGET_NEW_ITEMS,
+    in_release_week,
+    next_interval,
+    plan,
+    update_rate,
+)
+
+NOW = datetime(2026, 10, 1, 12, tzinfo=timezone.utc)
+
+
+def _source(
+    check_frequency_hours=6,
+    change_rate=None,
+    last_checked_at=None,
+    movie_slug=None,
+    name="source",
+):
+    return SimpleNamespace(
+        name=name,
+        check_frequency_hours=check_frequency_hours,
+        change_rate=change_rate,
+        last_checked_at=last_checked_at,
+        movie_slug=movie_slug,
+    )
+
+
+def _hours(interval: timedelta) -> float:
+    return interval.total_seconds() / 3600
+
+
+class TestUpdateRate:
+    def test_first_check_uses_the_configured_frequency(self):
+        source = _source(check_frequency_hours=6)
+        prior = TARGET_NEW_ITEMS / 6
+        weight = 1 - math.exp(-6 / RATE_TAU_HOURS)
+
+        rate = update_rate(source, new_items=12, now=NOW)
+
+        assert rate == pytest.approx(prior + weight * (12 / 6 - prior))
+
+    def test_moves_towards_the_observed_rate(self):
+        source = _source(change_rate=1.0, last_checked_at=NOW - timedelta(hours=4))
+
+        assert 1.0 < update_rate(source, new_items=20, now=NOW) < 5.0
+        assert 0.0 < update_rate(source, new_items=0, now=NOW) < 1.0
+
+    def test_long_gaps_weigh_more(self):
+        def updated(hours):
+            source = _source(
+                change_rate=1.0, last_checked_at=NOW - timedelta(hours=hours)
+            )
+            # The same observed rate of 3 items per hour
+            return update_rate(source, new_items=3 * hours, now=NOW)
+
+        assert updated(1) < updated(12) < updated(72) < 3.0
+        assert updated(72) == pytest.approx(3.0, abs=0.2)
+
+    def test_immediate_recheck_is_finite(self):
+        source = _source(change_rate=1.0, last_checked_at=NOW)
+
+        rate = update_rate(source, new_items=0, now=NOW)
+
+        assert math.isfinite(rate)
+        assert rate == pytest.approx(1.0, abs=0.01)
+
+
+class TestNextInterval:
+    def test_targets_the_expected_new_items(self):
+        source = _source(check_frequency_hours=6, change_rate=1.0)
+
+        assert _hours(next_interval(source)) == pytest.approx(TARGET_NEW_ITEMS)
+
+    def test_busy_source_is_clamped_to_max_speedup(self):
+        source = _source(check_frequency_hours=8, change_rate=100.0)
+
+        assert _hours(next_interval(source)) == pytest.approx(8 / MAX_SPEEDUP)
+
+    def test_quiet_source_is_clamped_to_max_backoff(self):
+        source = _source(check_frequency_hours=2, change_rate=0.01)
+
+        assert _hours(next_interval(source)) == pytest.approx(2 * MAX_BACKOFF)
+
+    def test_idle_source_is_capped_globally(self):
+        source = _source(check_frequency_hours=12, change_rate=0.0)
+
+        assert _hours(next_interval(source)) == pytest.approx(MAX_INTERVAL_HOURS)
+
+    def test_release_week_boosts_busy_sources(self):
+        source = _source(check_frequency_hours=6, change_rate=1.0)
+
+        boosted = next_interval(source, release_week=True, boost=2.0)
+
+        assert _hours(boosted) == pytest.approx(TARGET_NEW_ITEMS / 2)
+        # Outside the release week the boost does nothing
+        assert next_interval(source, boost=2.0) == next_interval(source)
+
+    def test_release_week_leaves_quiet_sources(self):
+        source = _source(check_frequency_hours=24, change_rate=BUSY_RATE / 2)
+
+        boosted = next_interval(source, release_week=True, boost=3.0)
+
+        assert boosted == next_interval(source)
+
+    def test_boost_never_slows_down(self):
+        source = _source(check_frequency_hours=6, change_rate=1.0)
+
+        boosted = next_interval(source, release_week=True, boost=0.5)
+
+        assert boosted == next_interval(source)
+
+    def test_boost_respects_the_minimum_interval(self):
+        source = _source(check_frequency_hours=1, change_rate=100.0)
+
+        boosted = next_interval(source, release_week=True, boost=10.0)
+
+        assert _hours(boosted) == pytest.approx(MIN_INTERVAL_HOURS)
+
+
+def test_in_release_week():
+    releasing = {"premiere"}
+
+    assert in_release_week(_source(movie_slug="premiere"), releasing)
+    assert in_release_week(_source(movie_slug=None), releasing)
+    assert not in_release_week(_source(movie_slug="other"), releasing)
+    assert not in_release_week(_source(movie_slug=None), set())
+
+
+class TestPlan:
+    def sources(self):
+        return [
+            _source(
+                name="slow",
+                change_rate=0.1,
+                last_checked_at=NOW - timedelta(hours=10),
+            ),
+            _source(
+                name="busy",
+                change_rate=2.0,
+                last_checked_at=NOW - timedelta(hours=1),
+            ),
+            _source(name="new"),
+            _source(
+                name="medium",
+                change_rate=0.5,
+                last_checked_at=NOW - timedelta(hours=3),
+            ),
+        ]
+
+    def test_orders_by_expected_new_items(self):
+        planned = plan(self.sources(), budget=10, now=NOW)
+
+        # Never-checked sources first, then 2.0, 1.5 and 1.0 expected items
+        assert [source.name for source in planned] == ["new", "busy", "medium", "slow"]
+
+    def test_caps_at_the_budget(self):
+        planned = plan(self.sources(), budget=2, now=NOW)
+
+        assert [source.name for source in planned] == ["new", "busy"]
+
+    def test_no_budget_plans_nothing(self):
+        assert plan(self.sources(), budget=0, now=NOW) == []
+        assert plan(self.sources(), budget=-1, now=NOW) == []
@@ -0,0 +1,115 @@
+"""
+Export encoders: header, batches and footer decode back to the rows.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from services.api.app.export import get_encoder
+from services.api.app.routers.export import SIGNAL_EXPORT_COLUMNS
+
+NAMES = [column.key for column in SIGNAL_EXPORT_COLUMNS]
+NOW = datetime(2026, 10, 1, 12, tzinfo=timezone.utc)
+
+
+def _signal(i: int) -> dict:
+    return {
+        "published_at": NOW - timedelta(hours=i),
+        "id": uuid4(),
+        "external_id": f"news:{i}",
+        "source_id": uuid4(),
+        "movie_id": None if i % 2 else uuid4(),
+        "title": f'Премьера недели, часть {i}, "в кавычках"',
+        "summary": "Две строки\nтекста",
+        "content": None,
+        "source_url": f"https://news.example/{i}",
+        "author": "Редакция",
+        "signal_type": "news",
+        "importance": "notable",
+        "sentiment": "positive",
+        "sentiment_score": 0.25,
+        "rating": None,
+        "platform_rating": "8/10",
+        "views_count": 1000 + i,
+        "likes_count": None,
+        "comments_count": 3,
+        "shares_count": 0,
+        "keywords": ["кино", f"k{i}"],
+        "is_classified": bool(i % 2),
+        "created_at": NOW,
+    }
+
+
+SIGNALS = [_signal(i) for i in range(5)]
+BATCHES = [
+    [tuple(signal[name] for name in NAMES) for signal in SIGNALS[:3]],
+    [tuple(signal[name] for name in NAMES) for signal in SIGNALS[3:]],
+]
+
+
+def _export(export_format: str) -> tuple[list[bytes], bytes]:
+    encoder = get_encoder(export_format, SIGNAL_EXPORT_COLUMNS)
+    chunks = [encoder.chunk(batch) for batch in BATCHES]
+    return chunks, encoder.header() + b"".join(chunks) + encoder.footer()
+
+
+def _text(signal: dict) -> dict:
+    """A signal as its text columns read back: strings, ISO times, JSON."""
+    values = {}
+    for name, value in signal.items():
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, list):
+            value = json.dumps(value, ensure_ascii=False)
+        elif value is not None and not isinstance(value, (bool, int, float)):
+            value = str(value)
+        values[name] = value
+    return values
+
+
+def test_ndjson_round_trip():
+    chunks, body = _export("ndjson")
+    assert [chunk.count(b"\n") for chunk in chunks] == [3, 2]
+
+    rows = [json.loads(line) for line in body.decode().splitlines()]
+    for row, signal in zip(rows, SIGNALS, strict=True):
+        expected = _text(signal)
+        expected["published_at"] = expected["published_at"].replace("+00:00", "Z")
+        expected["created_at"] = expected["created_at"].replace("+00:00", "Z")
+        expected["keywords"] = signal["keywords"]
+        assert row == expected
+
+
+def test_csv_round_trip():
+    _, body = _export("csv")
+    header, *rows = csv.reader(io.StringIO(body.decode()))
+    assert header == NAMES
+
+    for row, signal in zip(rows, SIGNALS, strict=True):
+        expected = {
+            name: "" if value is None else str(value)
+            for name, value in _text(signal).items()
+        }
+        assert dict(zip(NAMES, row)) == expected
+
+
+def test_parquet_round_trip():
+    pq = pytest.importorskip("pyarrow.parquet")
+    _, body = _export("parquet")
+
+    parquet = pq.ParquetFile(io.BytesIO(body))
+    # One row group per fetched batch
+    assert parquet.metadata.num_row_groups == len(BATCHES)
+    assert parquet.schema_arrow.names == NAMES
+
+    rows = parquet.read().to_pylist()
+    for row, signal in zip(rows, SIGNALS, strict=True):
+        expected = _text(signal)
+        expected["published_at"] = signal["published_at"]
+        expected["created_at"] = signal["created_at"]
+        assert row == expected
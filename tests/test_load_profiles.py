@@ -0,0 +1,91 @@
+"""
+Memory and bytes over the wire for a 1,000-row page per load profile.
+
+Signals carry realistic content and keywords; each profile loads the
+same page through SignalRepository.get_recent. Bytes are the page's
+result rows in Postgres' text encoding, memory is the peak Python
+allocation while fetching and building the entities.
+"""
+
+import tracemalloc
+
+import pytest
+from sqlalchemy import text
+
+from shared.db.repositories.signals import (
+    PROFILE_CLASSIFICATION,
+    PROFILE_DETAIL,
+    PROFILE_LIST,
+    SignalRepository,
+)
+from tests.conftest import requires_database, result_bytes, seed
+
+pytestmark = requires_database
+
+PAGE = 1_000
+PROFILES = (PROFILE_LIST, PROFILE_CLASSIFICATION, PROFILE_DETAIL)
+
+
+@pytest.fixture(scope="module")
+def seeded(database):
+    async def prepare():
+        await seed(
+            database.connection,
+            movies=50,
+            sources=10,
+            signals=5_000,
+            snapshots=0,
+            days=5,
+        )
+        # A review or article body of about 1.5 KB and a few keywords
+        await database.connection.execute(text("""
+                UPDATE signals
+                SET content = repeat('Текст рецензии ' || external_id || '. ', 40),
+                    keywords = jsonb_build_array(
+                        'кино', 'премьера', 'рецензия', external_id
+                    )
+                WHERE external_id LIKE 'seed:%'
+                """))
+
+    database.run(prepare())
+
+
+def _measure(database, profile: str) -> dict:
+    async def run():
+        async with database.session() as session:
+            with database.capture() as statements:
+                tracemalloc.start()
+                try:
+                    signals = await SignalRepository(session).get_recent(
+                        hours=168, limit=PAGE, profile=profile
+                    )
+                    _, peak = tracemalloc.get_traced_memory()
+                finally:
+                    tracemalloc.stop()
+            size = 0
+            for statement, parameters in statements:
+                size += await result_bytes(database.connection, statement, parameters)
+        return {"rows": len(signals), "bytes": size, "peak_memory": peak}
+
+    return database.run(run())
+
+
+@pytest.fixture(scope="module")
+def measured(database, seeded):
+    return {profile: _measure(database, profile) for profile in PROFILES}
+
+
+@pytest.mark.parametrize("profile", PROFILES)
+def test_page_size(measured, benchmark, profile):
+    benchmark(profile=profile, **measured[profile])
+    assert measured[profile]["rows"] == PAGE
+
+
+def test_list_profile_is_lighter_than_detail(measured):
+    lighter, heavier = measured[PROFILE_LIST], measured[PROFILE_DETAIL]
+    assert lighter["bytes"] < heavier["bytes"] / 2
+    assert lighter["peak_memory"] < heavier["peak_memory"]
+
+
+def test_classification_profile_skips_keywords(measured):
+    assert measured[PROFILE_CLASSIFICATION]["bytes"] < measured[PROFILE_DETAIL]["bytes"]
@@ -0,0 +1,65 @@
+"""
+Movie signal counters across retention.
+
+Pruning rolls signals up into signal_daily_rollups before deleting or
+archiving them, so a movie's counters must not change when its old
+signals are pruned.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from services.worker.app.tasks.metrics import movie_metrics
+from shared.config.retention import RETENTION_POLICIES
+from shared.db.retention import prune_batch
+from tests.conftest import requires_database, seed
+
+pytestmark = requires_database
+
+# Old enough that part of the seeded history is past the cutoff
+DAYS = 200
+CUTOFF_DAYS = 30
+
+
+@pytest.fixture(scope="module")
+def seeded(database):
+    database.run(
+        seed(
+            database.connection,
+            movies=50,
+            sources=20,
+            signals=5_000,
+            snapshots=0,
+            days=DAYS,
+        )
+    )
+
+
+def _by_movie(rows) -> dict:
+    return {
+        row["id"]: (row["signals_count"], row["reviews_count"], row["sentiment_score"])
+        for row in rows
+    }
+
+
+def test_counters_survive_pruning(database, seeded):
+    async def run():
+        async with database.session() as session:
+            before = _by_movie(await movie_metrics(session))
+            pruned = 0
+            cutoff = datetime.utcnow() - timedelta(days=CUTOFF_DAYS)
+            for policy in RETENTION_POLICIES:
+                stats = await prune_batch(
+                    session, policy, cutoff, batch_size=10_000, lock_timeout_ms=1000
+                )
+                pruned += stats["rows"]
+            after = _by_movie(await movie_metrics(session))
+        return before, pruned, after
+
+    before, pruned, after = database.run(run())
+    assert pruned > 0
+    assert after.keys() == before.keys()
+    for movie_id, (signals, reviews, sentiment) in before.items():
+        assert after[movie_id][:2] == (signals, reviews)
+        assert after[movie_id][2] == pytest.approx(sentiment)
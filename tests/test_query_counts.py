@@ -0,0 +1,112 @@
+"""
+Statements executed per page of the signals feed and the movie list.
+
+A signals page is one feed query (movie and source names joined in)
+plus one count, however many signals it holds; a movies page adds one
+batched distributor load. A regression to lazy loading would add a
+statement per row, or fail outright on an async session.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from services.api.app.routers.movies import list_movies
+from services.api.app.routers.signals import list_signals
+from tests.conftest import requires_database, seed
+
+pytestmark = requires_database
+
+PER_PAGE = 20
+QUERIES_PER_PAGE = 2  # Feed + exact count
+MOVIE_QUERIES_PER_PAGE = 3  # Movies + distributors + exact count
+
+
+@pytest.fixture(scope="module")
+def seeded(database):
+    async def prepare():
+        # Small enough for an exact count, large enough for several pages
+        await seed(
+            database.connection, movies=50, sources=10, signals=2_000, snapshots=0
+        )
+        await database.connection.execute(text("""
+                WITH distributor AS (
+                    INSERT INTO distributors (name, slug)
+                    VALUES ('Seed distributor', 'seed-distributor')
+                    RETURNING id
+                )
+                UPDATE movies SET distributor_id = distributor.id
+                FROM distributor
+                WHERE movies.slug LIKE 'seed-%'
+                """))
+
+    database.run(prepare())
+
+
+def _call(database, endpoint, **params):
+    async def run():
+        async with database.session() as session:
+            with database.capture() as statements:
+                response = await endpoint.__wrapped__(**params, session=session)
+            return response, statements
+
+    return database.run(run())
+
+
+def _page(database, **params):
+    return _call(
+        database,
+        list_signals,
+        **{
+            "page": 1,
+            "per_page": PER_PAGE,
+            "cursor": None,
+            "movie_slug": None,
+            "signal_type": None,
+            "importance": None,
+            "hours": 168,
+            "search": None,
+            "fields": None,
+            **params,
+        },
+    )
+
+
+def _movies_page(database, **params):
+    return _call(
+        database,
+        list_movies,
+        **{
+            "page": 1,
+            "per_page": PER_PAGE,
+            "cursor": None,
+            "search": None,
+            "release_from": None,
+            "release_to": None,
+            "distributor": None,
+            "featured": False,
+            "fields": None,
+            **params,
+        },
+    )
+
+
+@pytest.mark.parametrize("fields", [None, "id,published_at,title,movie_title"])
+def test_list_signals_query_count(database, seeded, fields):
+    first, statements = _page(database, fields=fields)
+    assert len(first["signals"]) == PER_PAGE
+    assert len(statements) == QUERIES_PER_PAGE
+
+    second, statements = _page(database, fields=fields, cursor=first["next_cursor"])
+    assert len(second["signals"]) == PER_PAGE
+    assert len(statements) == QUERIES_PER_PAGE
+
+
+def test_list_movies_loads_distributors_in_one_query(database, seeded):
+    first, statements = _movies_page(database)
+    assert len(first.movies) == PER_PAGE
+    assert all(movie.distributor_name == "Seed distributor" for movie in first.movies)
+    assert len(statements) == MOVIE_QUERIES_PER_PAGE
+
+    second, statements = _movies_page(database, cursor=first.next_cursor)
+    assert len(second.movies) == PER_PAGE
+    assert len(statements) == MOVIE_QUERIES_PER_PAGE
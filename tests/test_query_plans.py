@@ -0,0 +1,96 @@
+"""
+Query plans of the repository reads that migration 006 indexes for.
+
+Seeds a realistic volume, runs each repository method, then EXPLAINs
+every statement it executed and checks that no seeded table is read with
+a sequential scan. Partitions get their own copies of the parent's
+indexes (with generated names), so plans are checked by scan type.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from shared.db.repositories.movies import MovieRepository
+from shared.db.repositories.screenings import ScreeningRepository
+from shared.db.repositories.signals import SignalRepository
+from tests.conftest import explain, plan_nodes, requires_database, seed
+
+pytestmark = requires_database
+
+MOVIES = 2_000
+SOURCES = 500
+SIGNALS = 200_000
+SNAPSHOTS = 100_000
+
+INDEX_SCANS = {"Index Scan", "Index Only Scan", "Bitmap Index Scan"}
+
+
+@pytest.fixture(scope="module")
+def seeded(database):
+    async def prepare():
+        await seed(
+            database.connection,
+            movies=MOVIES,
+            sources=SOURCES,
+            signals=SIGNALS,
+            snapshots=SNAPSHOTS,
+        )
+        # Scans of empty relations (future partitions) are irrelevant
+        result = await database.connection.execute(
+            text("SELECT relname FROM pg_class WHERE relkind = 'r' AND reltuples > 0")
+        )
+        populated = set(result.scalars())
+        result = await database.connection.execute(
+            text("SELECT id FROM movies WHERE slug = 'seed-7'")
+        )
+        return populated, result.scalar_one()
+
+    populated, movie_id = database.run(prepare())
+    return {"populated": populated, "movie_id": movie_id}
+
+
+CASES = {
+    "signals.list_feed": lambda s, ids: SignalRepository(s).list_feed(
+        hours=24, limit=20
+    ),
+    "signals.list_feed_critical": lambda s, ids: SignalRepository(s).list_feed(
+        hours=168, importance="critical", limit=10
+    ),
+    "signals.count_recent": lambda s, ids: SignalRepository(s).count_recent(hours=24),
+    "signals.get_recent": lambda s, ids: SignalRepository(s).get_recent(
+        hours=24, limit=20
+    ),
+    "signals.get_for_movie": lambda s, ids: SignalRepository(s).get_for_movie(
+        ids["movie_id"], limit=20
+    ),
+    "signals.get_unclassified": lambda s, ids: SignalRepository(s).get_unclassified(
+        limit=100
+    ),
+    "screenings.get_for_movie": lambda s, ids: ScreeningRepository(s).get_for_movie(
+        ids["movie_id"], days=7
+    ),
+    "movies.get_active": lambda s, ids: MovieRepository(s).get_active(limit=20),
+    "movies.get_featured": lambda s, ids: MovieRepository(s).get_featured(limit=10),
+    "movies.get_leaderboard": lambda s, ids: MovieRepository(s).get_leaderboard(
+        limit=10
+    ),
+    "movies.get_by_slug": lambda s, ids: MovieRepository(s).get_by_slug("seed-7"),
+}
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_uses_index(database, seeded, name):
+    plans = explain(database, lambda session: CASES[name](session, seeded))
+    assert plans, f"{name} executed no statements"
+
+    scans = [node for plan in plans for node in plan_nodes(plan)]
+    seq_scans = [
+        node["Relation Name"]
+        for node in scans
+        if node["Node Type"] == "Seq Scan"
+        and node["Relation Name"] in seeded["populated"]
+    ]
+    assert not seq_scans, f"{name} scans {seq_scans} sequentially"
+    assert any(
+        node["Node Type"] in INDEX_SCANS for node in scans
+    ), f"{name} uses no index"
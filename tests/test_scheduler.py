@@ -0,0 +1,165 @@
+"""
+Scheduler: per-period job ids and the Redis leader lease.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from services.scheduler.app import main
+from services.scheduler.app.leader import RELEASE_SCRIPT, RENEW_SCRIPT, LeaderLease
+
+NOW = datetime(2026, 10, 1, 12, 34, 56, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Wall clock at NOW, in a zone other than UTC."""
+    monkeypatch.setenv("TZ", "Asia/Vladivostok")
+    time.tzset()
+    monkeypatch.setattr(main.time, "time", lambda: NOW.timestamp())
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.mark.parametrize(
+    "period, window",
+    [
+        (main.CLASSIFY_EVERY, "2026-10-01T12:30"),
+        (main.HOURLY, "2026-10-01T12:00"),
+        (main.DAILY, "2026-10-01T00:00"),
+    ],
+)
+def test_window_job_id_is_the_utc_period_start(clock, period, window):
+    assert main.window_job_id("collect_all", period) == f"collect_all:{window}"
+
+
+def test_window_job_id_is_stable_within_a_period(monkeypatch):
+    ids = set()
+    for offset in (0, 1, 1799):
+        start = datetime(2026, 10, 1, 12, 30, tzinfo=timezone.utc).timestamp()
+        monkeypatch.setattr(main.time, "time", lambda: start + offset)
+        ids.add(main.window_job_id("classify", main.CLASSIFY_EVERY))
+    assert ids == {"classify:2026-10-01T12:30"}
+
+
+class FakeRedis:
+    """The commands LeaderLease uses, with expiry on a manual clock."""
+
+    def __init__(self):
+        self.now_ms = 0
+        self.data: dict[str, tuple[bytes, int]] = {}
+        self.down = False
+
+    def advance(self, ms: int) -> None:
+        self.now_ms += ms
+
+    def _get(self, key: str):
+        self._check()
+        value, expires_at = self.data.get(key, (None, 0))
+        if value is not None and expires_at <= self.now_ms:
+            del self.data[key]
+            return None
+        return value
+
+    def _check(self):
+        if self.down:
+            raise ConnectionError("Redis is down")
+
+    async def get(self, key: str):
+        return self._get(key)
+
+    async def set(self, key: str, value: str, nx: bool = False, px: int = None):
+        if nx and self._get(key) is not None:
+            return None
+        self.data[key] = (value.encode(), self.now_ms + px)
+        return True
+
+    async def eval(self, script: str, numkeys: int, key: str, token: str, *args):
+        if self._get(key) != token.encode():
+            return 0
+        if script == RENEW_SCRIPT:
+            self.data[key] = (self.data[key][0], self.now_ms + int(args[0]))
+            return 1
+        if script == RELEASE_SCRIPT:
+            del self.data[key]
+            return 1
+        raise NotImplementedError(script)
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+def _lease(redis: FakeRedis) -> LeaderLease:
+    lease = LeaderLease(ttl_ms=30_000, key="test:leader")
+    lease.redis = redis
+    return lease
+
+
+def test_only_one_replica_acquires(redis):
+    first, second = _lease(redis), _lease(redis)
+
+    assert asyncio.run(first.refresh())
+    assert not asyncio.run(second.refresh())
+    assert first.is_leader and not second.is_leader
+
+
+def test_renewal_keeps_the_lease(redis):
+    leader, other = _lease(redis), _lease(redis)
+    asyncio.run(leader.refresh())
+
+    # Renewed every ttl/3, so the lease never runs out
+    for _ in range(5):
+        redis.advance(10_000)
+        assert asyncio.run(leader.refresh())
+        assert not asyncio.run(other.refresh())
+
+
+def test_expired_lease_passes_to_another_replica(redis):
+    leader, other = _lease(redis), _lease(redis)
+    asyncio.run(leader.refresh())
+
+    redis.advance(30_000)
+    assert asyncio.run(other.refresh())
+    # The old leader cannot renew someone else's lease and steps down
+    assert not asyncio.run(leader.refresh())
+    assert not leader.is_leader
+
+
+def test_release_hands_over_immediately(redis):
+    leader, other = _lease(redis), _lease(redis)
+
+    async def run():
+        await leader.start(redis)
+        await leader.stop()
+
+    asyncio.run(run())
+
+    assert not leader.is_leader
+    assert asyncio.run(other.refresh())
+
+
+def test_release_leaves_another_replicas_lease(redis):
+    stale, leader = _lease(redis), _lease(redis)
+    asyncio.run(stale.refresh())
+    redis.advance(30_000)
+    asyncio.run(leader.refresh())
+
+    # Still believes it leads, but the lease is no longer its own
+    asyncio.run(stale.stop())
+
+    assert redis.data["test:leader"][0] == leader.token.encode()
+
+
+def test_unreachable_redis_steps_down(redis):
+    leader = _lease(redis)
+    asyncio.run(leader.refresh())
+
+    redis.down = True
+    assert not asyncio.run(leader.refresh())
+    assert not leader.is_leader
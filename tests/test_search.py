@@ -0,0 +1,95 @@
+"""
+Search benchmark: full-text signal search and trigram movie search.
+
+Seeds SEARCH_SIGNALS signals (default 500,000; set SEARCH_SIGNALS=5000000
+for the full-size run) and SEARCH_MOVIES movies inside the test
+transaction, checks that `/signals?search=` is served by the tsvector GIN
+index and movie search by the trigram indexes, and records the median
+time of each query.
+"""
+
+import os
+import statistics
+import time
+
+import pytest
+
+from shared.db.repositories.movies import MovieRepository
+from shared.db.repositories.signals import SignalRepository
+from tests.conftest import explain, plan_nodes, requires_database, seed
+
+pytestmark = requires_database
+
+SIGNALS = int(os.environ.get("SEARCH_SIGNALS", 500_000))
+MOVIES = int(os.environ.get("SEARCH_MOVIES", 50_000))
+ROUNDS = 5
+
+TRIGRAM_INDEXES = {"idx_movies_title_trgm", "idx_movies_original_title_trgm"}
+
+# A rare word (0.1% of signals) and a common one (10%)
+SIGNAL_SEARCHES = {"rare": "премьера", "common": "рецензия"}
+MOVIE_SEARCHES = {"substring": "movie 1234", "fuzzy": "sed movi 4321"}
+
+
+@pytest.fixture(scope="module")
+def seeded(database):
+    database.run(
+        seed(
+            database.connection,
+            movies=MOVIES,
+            sources=200,
+            signals=SIGNALS,
+            snapshots=0,
+        )
+    )
+
+
+def _signal_search(term: str):
+    return lambda session: SignalRepository(session).list_feed(
+        hours=720, search=term, limit=20
+    )
+
+
+def _movie_search(term: str):
+    return lambda session: MovieRepository(session).search(term, limit=20)
+
+
+def _median_ms(database, call) -> float:
+    async def run():
+        timings = []
+        async with database.session() as session:
+            for _ in range(ROUNDS):
+                started = time.perf_counter()
+                await call(session)
+                timings.append(time.perf_counter() - started)
+        return statistics.median(timings)
+
+    return round(database.run(run()) * 1000, 2)
+
+
+def _index_names(plans) -> set[str]:
+    return {
+        node["Index Name"]
+        for plan in plans
+        for node in plan_nodes(plan)
+        if "Index Name" in node
+    }
+
+
+@pytest.mark.parametrize("case", list(SIGNAL_SEARCHES))
+def test_signal_search(database, seeded, benchmark, case):
+    call = _signal_search(SIGNAL_SEARCHES[case])
+    indexes = _index_names(explain(database, call))
+    benchmark(signals=SIGNALS, search=case, median_ms=_median_ms(database, call))
+    if case == "rare":
+        # Partitions carry copies of idx_signals_search, named after the
+        # search_vector column
+        assert any("search" in name for name in indexes)
+
+
+@pytest.mark.parametrize("case", list(MOVIE_SEARCHES))
+def test_movie_search(database, seeded, benchmark, case):
+    call = _movie_search(MOVIE_SEARCHES[case])
+    indexes = _index_names(explain(database, call))
+    benchmark(movies=MOVIES, search=case, median_ms=_median_ms(database, call))
+    assert indexes & TRIGRAM_INDEXES
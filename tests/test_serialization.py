@@ -0,0 +1,172 @@
+"""
+Serialization micro-benchmark for the /signals and /movies list pages.
+
+Each endpoint's page is rendered four ways: full models or a `fields=`
+trimmed payload, through FastAPI's default encoder (jsonable_encoder and
+json.dumps, as fastapi.responses.JSONResponse does) or through `dumps`.
+Timings are the median of several rounds; they and the body sizes are
+recorded as benchmarks. No database is needed.
+"""
+
+import json
+import statistics
+import time
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse as DefaultJSONResponse
+
+from services.api.app.responses import dumps
+from shared.schemas.movie import MovieListResponse, MovieResponse
+from shared.schemas.signal import SignalResponse
+
+PER_PAGE = 100
+ROUNDS = 30
+
+# What a dashboard card asks for
+SIGNAL_FIELDS = ("id", "published_at", "title", "importance", "movie_title")
+MOVIE_FIELDS = ("id", "release_date", "title", "poster_url")
+
+NOW = datetime(2026, 10, 1, 12, tzinfo=timezone.utc)
+
+
+def _signal(i: int) -> SignalResponse:
+    return SignalResponse(
+        id=uuid4(),
+        external_id=f"news:{i}",
+        title=f"Новость о фильме номер {i}: сборы первого уикенда",
+        summary="Краткое содержание статьи о прокате и отзывах зрителей. " * 2,
+        source_url=f"https://news.example/articles/{i}",
+        image_url=f"https://news.example/images/{i}.jpg",
+        author="Редакция",
+        created_at=NOW,
+        published_at=NOW - timedelta(minutes=i),
+        signal_type="news",
+        importance="notable",
+        sentiment="positive",
+        sentiment_score=0.4,
+        views_count=1200 + i,
+        likes_count=40,
+        comments_count=7,
+        shares_count=3,
+        is_classified=True,
+        movie_title=f"Фильм {i}",
+        source_name="Новости кино",
+    )
+
+
+def _movie(i: int) -> MovieResponse:
+    return MovieResponse(
+        id=uuid4(),
+        title=f"Фильм {i}",
+        original_title=f"Movie {i}",
+        slug=f"movie-{i}",
+        description="Описание фильма для карточки и страницы фильма. " * 4,
+        poster_url=f"https://cdn.example/posters/{i}.jpg",
+        release_date=date(2026, 10, 1) - timedelta(days=i),
+        year=2026,
+        runtime_minutes=118,
+        age_rating="12+",
+        kinopoisk_id=str(1000 + i),
+        created_at=NOW,
+        updated_at=NOW,
+        kinopoisk_rating=7.4,
+        kinopoisk_votes=15000,
+        signals_count=120,
+        reviews_count=14,
+        sentiment_score=0.2,
+        total_screenings=850,
+        avg_occupancy=31.5,
+        distributor_name="Дистрибьютор",
+    )
+
+
+def _page(key: str, items: list, **extra) -> dict:
+    return {
+        key: items,
+        "total": 10_000,
+        "page": 1,
+        "per_page": PER_PAGE,
+        "next_cursor": "cursor",
+        "total_is_estimate": False,
+        **extra,
+    }
+
+
+def _trimmed(items: list, fields: tuple[str, ...]) -> list[dict]:
+    return [{name: getattr(item, name) for name in fields} for item in items]
+
+
+signals = [_signal(i) for i in range(PER_PAGE)]
+movies = [_movie(i) for i in range(PER_PAGE)]
+
+# (endpoint, shape) -> payload as the router returns it
+PAYLOADS = {
+    ("signals", "full"): _page("signals", signals),
+    ("signals", "fields"): _page("signals", _trimmed(signals, SIGNAL_FIELDS)),
+    ("movies", "full"): MovieListResponse(**_page("movies", movies)),
+    ("movies", "fields"): _page("movies", _trimmed(movies, MOVIE_FIELDS)),
+}
+
+ENCODERS = {
+    "default": lambda content: DefaultJSONResponse(jsonable_encoder(content)).body,
+    "orjson": dumps,
+}
+
+
+def _median_seconds(encode, content) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        encode(content)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+@pytest.fixture(scope="module")
+def measured():
+    results = {}
+    for (endpoint, shape), content in PAYLOADS.items():
+        for name, encode in ENCODERS.items():
+            results[endpoint, shape, name] = {
+                "bytes": len(encode(content)),
+                "seconds": _median_seconds(encode, content),
+            }
+    return results
+
+
+@pytest.mark.parametrize("endpoint", ["signals", "movies"])
+@pytest.mark.parametrize("shape", ["full", "fields"])
+@pytest.mark.parametrize("encoder", list(ENCODERS))
+def test_serialization(measured, benchmark, endpoint, shape, encoder):
+    result = measured[endpoint, shape, encoder]
+    benchmark(
+        endpoint=endpoint,
+        shape=shape,
+        encoder=encoder,
+        bytes=result["bytes"],
+        microseconds=round(result["seconds"] * 1e6),
+    )
+
+
+@pytest.mark.parametrize("endpoint", ["signals", "movies"])
+def test_full_pages_match_the_default_encoder(endpoint):
+    content = PAYLOADS[endpoint, "full"]
+    assert json.loads(dumps(content)) == json.loads(ENCODERS["default"](content))
+
+
+@pytest.mark.parametrize("endpoint", ["signals", "movies"])
+def test_orjson_is_faster(measured, endpoint):
+    for shape in ("full", "fields"):
+        default = measured[endpoint, shape, "default"]["seconds"]
+        assert measured[endpoint, shape, "orjson"]["seconds"] < default
+
+
+@pytest.mark.parametrize("endpoint", ["signals", "movies"])
+def test_fields_trim_the_payload(measured, endpoint):
+    full = measured[endpoint, "full", "orjson"]
+    trimmed = measured[endpoint, "fields", "orjson"]
+    assert trimmed["bytes"] < full["bytes"] / 2
+    assert trimmed["seconds"] < full["seconds"]
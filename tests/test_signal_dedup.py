@@ -0,0 +1,79 @@
+"""
+Concurrent collection of the same items stores each signal once.
+
+Collectors stamp published_at at collection time, so two runs over the
+same source insert rows that differ in the partition key; only the
+external_id claim keeps them from both being stored. Unlike the other
+database tests this one commits (the race needs separate transactions),
+so it cleans up its rows afterwards.
+"""
+
+import asyncio
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from shared.db.repositories.signals import SignalRepository
+from tests.conftest import DATABASE_URL, requires_database
+
+pytestmark = requires_database
+
+ITEMS = 50
+COLLECTORS = 4
+
+
+def _items(prefix: str) -> list[dict]:
+    now = datetime.utcnow()
+    return [
+        {
+            "external_id": f"{prefix}{i}",
+            "title": f"Race item {i}",
+            "source_url": f"https://race.example/{i}",
+            "published_at": now,
+        }
+        for i in range(ITEMS)
+    ]
+
+
+async def _race(prefix: str) -> tuple[list[int], int]:
+    engine = create_async_engine(DATABASE_URL, pool_size=COLLECTORS)
+    started = asyncio.Event()
+
+    async def collect() -> int:
+        async with AsyncSession(engine) as session:
+            await started.wait()
+            created = await SignalRepository(session).create_new(_items(prefix))
+            # Hold the claims a moment so the other collectors queue on them
+            await asyncio.sleep(0.1)
+            await session.commit()
+            return len(created)
+
+    try:
+        tasks = [asyncio.create_task(collect()) for _ in range(COLLECTORS)]
+        await asyncio.sleep(0)
+        started.set()
+        created = await asyncio.gather(*tasks)
+
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                text("SELECT count(*) FROM signals WHERE external_id LIKE :prefix"),
+                {"prefix": f"{prefix}%"},
+            )
+            stored = result.scalar_one()
+        return created, stored
+    finally:
+        async with engine.begin() as conn:
+            for table in ("signals", "signal_external_ids"):
+                await conn.execute(
+                    text(f"DELETE FROM {table} WHERE external_id LIKE :prefix"),
+                    {"prefix": f"{prefix}%"},
+                )
+        await engine.dispose()
+
+
+def test_concurrent_collection_stores_each_item_once():
+    created, stored = asyncio.run(_race(f"race:{uuid4().hex}:"))
+    assert sum(created) == ITEMS
+    assert stored == ITEMS
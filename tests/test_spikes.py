@@ -0,0 +1,209 @@
+"""
+Spike detection: warm-up, threshold and one alert (and signal) per bucket.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from services.worker.app.tasks import spikes as spike_tasks
+from shared.analytics.spikes import (
+    BUCKET_SECONDS,
+    METRIC_NEGATIVE,
+    METRIC_VOLUME,
+    MIN_COUNT,
+    WARMUP_BUCKETS,
+    Spike,
+    SpikeDetector,
+    SpikeState,
+)
+
+BASELINE = 2  # Signals per hour in a quiet history
+START = 490_000  # First bucket of a movie's history
+
+
+class FakePipeline:
+    """The transactional pipeline calls SpikeDetector.observe makes."""
+
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.writes = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def watch(self, key: str):
+        pass
+
+    async def hgetall(self, key: str) -> dict:
+        return {
+            field.encode(): str(value).encode()
+            for field, value in self.redis.hashes.get(key, {}).items()
+        }
+
+    def multi(self):
+        self.writes = []
+
+    def hset(self, key: str, mapping: dict):
+        self.writes.append((key, mapping))
+
+    def expire(self, key: str, seconds: int):
+        pass
+
+    async def execute(self):
+        for key, mapping in self.writes:
+            self.redis.hashes.setdefault(key, {}).update(mapping)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.hashes: dict[str, dict] = {}
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+
+@pytest.fixture
+def detector():
+    return SpikeDetector(FakeRedis())
+
+
+def _at(bucket: int, minute: int = 0) -> float:
+    return (START + bucket) * BUCKET_SECONDS + minute * 60
+
+
+def _observe(detector, movie_id, count, bucket, minute=0, metric=METRIC_VOLUME):
+    return asyncio.run(
+        detector.observe(metric, movie_id, count, at=_at(bucket, minute))
+    )
+
+
+def _history(detector, movie_id, buckets, start=0):
+    for bucket in range(start, start + buckets):
+        assert _observe(detector, movie_id, BASELINE, bucket) is None
+
+
+def test_no_spikes_during_warm_up(detector):
+    movie_id = uuid4()
+    _history(detector, movie_id, WARMUP_BUCKETS - 2)
+
+    # Only WARMUP_BUCKETS - 1 buckets have closed when this one fills
+    assert _observe(detector, movie_id, 100, WARMUP_BUCKETS - 1) is None
+
+
+def test_spike_above_the_threshold(detector):
+    movie_id = uuid4()
+    _history(detector, movie_id, WARMUP_BUCKETS + 6)
+    bucket = WARMUP_BUCKETS + 6
+
+    # Builds up within the hour; alerts once the count is far enough out
+    assert _observe(detector, movie_id, BASELINE, bucket, minute=10) is None
+    spike = _observe(detector, movie_id, 20, bucket, minute=20)
+
+    assert spike == Spike(
+        movie_id=movie_id,
+        metric=METRIC_VOLUME,
+        bucket=START + bucket,
+        count=BASELINE + 20,
+        baseline=spike.baseline,
+        zscore=spike.zscore,
+    )
+    assert spike.baseline == pytest.approx(BASELINE, abs=0.1)
+    assert spike.zscore >= 3.0
+
+
+def test_small_buckets_never_alert():
+    state = SpikeState(bucket=WARMUP_BUCKETS, seen=WARMUP_BUCKETS, mean=0.0)
+    state.count = MIN_COUNT - 1
+
+    assert state.zscore() >= 3.0
+    assert not state.is_spike()
+
+
+def test_repeat_in_the_same_bucket_alerts_once(detector):
+    movie_id = uuid4()
+    _history(detector, movie_id, WARMUP_BUCKETS + 6)
+    bucket = WARMUP_BUCKETS + 6
+
+    assert _observe(detector, movie_id, 30, bucket, minute=5)
+    assert _observe(detector, movie_id, 30, bucket, minute=30) is None
+    assert _observe(detector, movie_id, 30, bucket, minute=59) is None
+
+    # A new bucket may alert again
+    assert _observe(detector, movie_id, 100, bucket + 1)
+
+
+def test_metrics_and_movies_are_tracked_separately(detector):
+    movie_id, other_id = uuid4(), uuid4()
+    _history(detector, movie_id, WARMUP_BUCKETS + 6)
+    bucket = WARMUP_BUCKETS + 6
+
+    assert _observe(detector, other_id, 30, bucket) is None
+    assert _observe(detector, movie_id, 30, bucket, metric=METRIC_NEGATIVE) is None
+    assert _observe(detector, movie_id, 30, bucket)
+
+
+def test_state_round_trips_through_redis():
+    state = SpikeState(bucket=7, count=3, mean=1.5, var=0.75, seen=30, alerted=True)
+    raw = {key.encode(): str(value).encode() for key, value in state.to_redis().items()}
+
+    assert SpikeState.from_redis(raw) == state
+    assert SpikeState.from_redis({}) is None
+
+
+class FakeSignalRepository:
+    """Signals by external_id, as SignalRepository claims them."""
+
+    external_ids: set[str] = set()
+
+    def __init__(self, session):
+        pass
+
+    async def exists_by_external_id(self, external_id: str) -> bool:
+        return external_id in self.external_ids
+
+    async def create(self, **fields):
+        if fields["external_id"] in self.external_ids:
+            return None
+        self.external_ids.add(fields["external_id"])
+        return SimpleNamespace(**fields)
+
+
+@pytest.fixture
+def signals(monkeypatch):
+    monkeypatch.setattr(FakeSignalRepository, "external_ids", set())
+    monkeypatch.setattr(spike_tasks, "SignalRepository", FakeSignalRepository)
+    return FakeSignalRepository.external_ids
+
+
+def test_one_spike_signal_per_bucket(signals):
+    movie = SimpleNamespace(id=uuid4(), title="Премьера", slug="premiere")
+    session = SimpleNamespace(get=lambda model, movie_id: asyncio.sleep(0, movie))
+
+    def spike(bucket: int, count: int) -> Spike:
+        return Spike(
+            movie_id=movie.id,
+            metric=METRIC_NEGATIVE,
+            bucket=bucket,
+            count=count,
+            baseline=2.0,
+            zscore=8.0,
+        )
+
+    async def create(spike: Spike):
+        return await spike_tasks._create_spike_signal(session, spike)
+
+    first = asyncio.run(create(spike(100, 20)))
+    assert first.external_id == f"spike:{METRIC_NEGATIVE}:{movie.id}:100"
+    assert first.importance == "critical"
+    assert first.source_url == "/signals?movie_slug=premiere"
+
+    # Detected again for the same hour (say, after a lost alerted flag)
+    assert asyncio.run(create(spike(100, 40))) is None
+    assert asyncio.run(create(spike(101, 20))) is not None
+    assert len(signals) == 2